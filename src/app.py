@@ -59,7 +59,7 @@ def process_template_to_db(product_id, shop_id):
         # Convert raw JSON to our model
         template_model = PrintifyTemplateModel.from_dict(template_data)
         
-        # Store it in DB
+        # Store it in DB; a failed save is rolled back and re-raised to the route's flash
         template_dao.insert_or_update_template(template_model)
         template_dao.set_status_by_template_id(template_model.id, "DRAFT")
         
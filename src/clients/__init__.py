@@ -1,4 +1,4 @@
 # Import clients for direct import from clients package
-from clients.printify_client import PrintifyClient
+from clients.printify_client import PrintifyClient, get_shared_client
 
-__all__ = ["PrintifyClient"] 
\ No newline at end of file
+__all__ = ["PrintifyClient", "get_shared_client"] 
\ No newline at end of file
@@ -0,0 +1,146 @@
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+import openai
+from openai import AsyncOpenAI
+from dotenv import load_dotenv
+
+from clients.openai_budget import MAX_RETRIES, TokenBudgets, estimate_tokens, get_shared_budgets, retry_delay
+from util.prompt_cache import PROMPT_CACHE_VARIANTS, get_prompt_cache, prompt_key
+
+# Load environment variables
+load_dotenv()
+
+# Completions in flight at once
+DEFAULT_CONCURRENCY = int(os.getenv("OPENAI_ASYNC_CONCURRENCY", "8"))
+
+
+class AsyncOpenAIClient:
+    """
+    Asyncio counterpart of OpenAIClient.generate_text for batch generation.
+
+    At most `concurrency` completions are in flight at once, and each one first reserves
+    its estimated token cost from the model's tokens-per-minute bucket, so a large batch
+    runs at the quota instead of into it. Unused tokens are refunded from the reported
+    usage. Rate limit (429), server (5xx) and connection errors are retried with
+    exponential backoff, honouring Retry-After; a 429 also pauses the model's budget.
+
+    Responses are shared with the synchronous client through the prompt cache when it
+    is enabled (OPENAI_PROMPT_CACHE=1).
+
+        async with AsyncOpenAIClient(concurrency=16) as client:
+            titles = await client.generate_many([(system, description) for description in descriptions])
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, tpm_limits: Optional[Dict[str, int]] = None,
+                 cache=None, variants: int = PROMPT_CACHE_VARIANTS):
+        """
+        Args:
+            concurrency: Maximum number of completions in flight at once
+            tpm_limits: Tokens per minute per model; defaults to OPENAI_TPM_LIMITS, shared process-wide
+            cache: PromptCache for completions; defaults to the shared one, if enabled
+            variants: Completions sampled per cached prompt and served round-robin
+        """
+        # Retries are handled here so they share the token budget
+        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.budgets = get_shared_budgets() if tpm_limits is None else TokenBudgets(tpm_limits)
+        self.cache = cache if cache is not None else get_prompt_cache()
+        self.variants = max(1, variants)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP connections."""
+        await self.client.close()
+
+    async def _complete(self, system_message: str, user_message: str, model: str, max_tokens: int,
+                        temperature: float, n: int, seed: Optional[int]) -> List[str]:
+        """Requests `n` completions, waiting for budget and retrying transient failures."""
+        budget = self.budgets.for_model(model)
+        estimate = estimate_tokens(system_message, user_message, max_tokens, n)
+        params = {"seed": seed} if seed is not None else {}
+
+        for attempt in range(MAX_RETRIES + 1):
+            if budget:
+                await budget.acquire_async(estimate)
+            try:
+                async with self.semaphore:
+                    response = await self.client.chat.completions.create(
+                        messages=[
+                            {"role": "system", "content": system_message},
+                            {"role": "user", "content": user_message}
+                        ],
+                        model=model,
+                        max_tokens=max_tokens,
+                        n=n,
+                        temperature=temperature,
+                        **params
+                    )
+            except openai.OpenAIError as e:
+                delay = retry_delay(e, attempt)
+                if delay is None or attempt == MAX_RETRIES:
+                    raise
+                # The request never ran, so its reservation goes back to the budget
+                if budget:
+                    budget.refund(estimate)
+                if budget and isinstance(e, openai.RateLimitError):
+                    budget.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+                print(f"OpenAI request for {model} failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+                continue
+
+            if budget and response.usage:
+                budget.refund(estimate - response.usage.total_tokens)
+            return [choice.message.content for choice in response.choices]
+
+    async def generate_text(self, system_message, user_message, model="gpt-3.5-turbo", max_tokens=150,
+                            temperature=0.7, seed=None, use_cache=True):
+        """
+        Async counterpart of OpenAIClient.generate_text. Transient failures are retried;
+        None is only returned once retries are exhausted or on a non-retryable error.
+        """
+        cache = self.cache if use_cache else None
+        variants = self.variants if cache else 1
+        key = None
+        if cache:
+            key = prompt_key(model, system_message, user_message, temperature, max_tokens, seed, variants)
+            try:
+                cached = await asyncio.to_thread(cache.get, key)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                print(f"Error reading prompt cache: {e}")
+
+        try:
+            responses = await self._complete(system_message, user_message, model, max_tokens, temperature, variants, seed)
+        except Exception as e:
+            print(f"Error in text API call: {e}")
+            return None
+
+        if cache:
+            try:
+                # The first completion is returned now; later calls get the others in turn
+                await asyncio.to_thread(cache.put, key, model, responses, 1)
+            except Exception as e:
+                print(f"Error writing prompt cache: {e}")
+        return responses[0]
+
+    async def generate_many(self, prompts, **kwargs) -> List[Optional[str]]:
+        """
+        Generates completions for many (system_message, user_message) pairs concurrently.
+        Results are in the order of `prompts`; keyword arguments apply to every call.
+        """
+        return await asyncio.gather(
+            *(self.generate_text(system_message, user_message, **kwargs) for system_message, user_message in prompts)
+        )
+
+    def budget_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-model token budget balance and throttling counters."""
+        return self.budgets.metrics()
@@ -0,0 +1,292 @@
+import asyncio
+import os
+from typing import Dict, Any, Optional
+
+import httpx
+
+from clients.printify_client import (
+    API_KEY,
+    BASE_URL,
+    BACKOFF_BASE,
+    BACKOFF_CAP,
+    CONNECT_TIMEOUT,
+    IDEMPOTENT_METHODS,
+    MAX_RETRIES,
+    READ_TIMEOUT,
+    RETRYABLE_STATUS_CODES,
+    UPLOAD_READ_TIMEOUT,
+)
+from clients.rate_limiter import RateLimitScheduler, backoff_delay, get_default_scheduler, parse_retry_after
+from clients.upload_body import Base64JSONUploadBody
+
+# Requests allowed in flight at once; also caps the connection pool
+DEFAULT_CONCURRENCY = int(os.getenv("PRINTIFY_ASYNC_CONCURRENCY", "10"))
+
+
+class AsyncPrintifyClient:
+    """
+    Asyncio counterpart of PrintifyClient, built on httpx.
+
+    Use it to fan out many independent calls (product GETs, deletes) concurrently:
+    at most `concurrency` requests are in flight at once, and every call still draws
+    from the shared rate limit scheduler, so fanning out never exceeds Printify's limits.
+
+    Use as an async context manager so the connection pool is closed:
+
+        async with AsyncPrintifyClient(concurrency=20) as client:
+            products = await asyncio.gather(*(client.get_product(shop_id, pid) for pid in ids))
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY,
+                 timeout: tuple = (CONNECT_TIMEOUT, READ_TIMEOUT),
+                 scheduler: Optional[RateLimitScheduler] = None):
+        """
+        Args:
+            concurrency: Maximum number of requests in flight at once
+            timeout: Default (connect, read) timeout in seconds for each call
+            scheduler: Rate limit scheduler; defaults to the process-wide one
+        """
+        self.headers = {
+            "Authorization": f"Bearer {API_KEY}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        self.base_url = BASE_URL
+        self.timeout = timeout
+        self.scheduler = scheduler or get_default_scheduler()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self._httpx_timeout(timeout[1]),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    def _httpx_timeout(self, read_timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(read_timeout, connect=self.timeout[0])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Sends a request once the concurrency slot and rate limit tokens are available.
+        Retries follow PrintifyClient._request: any call is retried after a 429, and server
+        errors or transport failures only for idempotent methods.
+        """
+        method = method.upper()
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        idempotent = method in IDEMPOTENT_METHODS
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self.scheduler.acquire_async(method, path)
+            try:
+                async with self.semaphore:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not idempotent or attempt == MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"{method} {path} failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt == MAX_RETRIES:
+                return response
+
+            if response.status_code == 429:
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"Rate limited on {method} {path}; retrying in {delay:.1f}s")
+                self.scheduler.on_rate_limited(method, path, delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and idempotent:
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"{method} {path} returned {response.status_code}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            return response
+
+    async def upload_image(self, image_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Upload an image to Printify, streaming the base64-encoded file in chunks.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Dict with image data including ID if successful, None otherwise
+        """
+        try:
+            if not os.path.exists(image_path):
+                print(f"File does not exist: {image_path}")
+                return None
+
+            # Chunks are read and encoded off the event loop as the body is sent
+            body = Base64JSONUploadBody(image_path, os.path.basename(image_path))
+
+            upload_url = f"{self.base_url}/uploads/images.json"
+            response = await self._request(
+                "POST", upload_url, content=body,
+                headers={"Content-Length": str(len(body))},
+                timeout=self._httpx_timeout(UPLOAD_READ_TIMEOUT)
+            )
+
+            if response.status_code == 200:
+                print("Image uploaded successfully!")
+                return response.json()
+            else:
+                print(f"Error uploading image: {response.status_code} - {response.text}")
+                return None
+
+        except Exception as e:
+            print(f"An error occurred during image upload: {e}")
+            return None
+
+    async def upload_image_from_url(self, image_url: str, file_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Upload an image that is already hosted elsewhere; Printify fetches it from the URL.
+
+        Args:
+            image_url: Publicly reachable URL of the image
+            file_name: Name to store the image under; defaults to the last URL path segment
+
+        Returns:
+            Dict with image data including ID if successful, None otherwise
+        """
+        try:
+            data = {
+                'file_name': file_name or image_url.split('?')[0].rstrip('/').split('/')[-1],
+                'url': image_url
+            }
+
+            upload_url = f"{self.base_url}/uploads/images.json"
+            response = await self._request(
+                "POST", upload_url, json=data, timeout=self._httpx_timeout(UPLOAD_READ_TIMEOUT)
+            )
+
+            if response.status_code == 200:
+                print("Image uploaded successfully!")
+                return response.json()
+            else:
+                print(f"Error uploading image: {response.status_code} - {response.text}")
+                return None
+
+        except Exception as e:
+            print(f"An error occurred during image upload: {e}")
+            return None
+
+    async def get_product(self, shop_id: str, product_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a product from Printify.
+
+        Args:
+            shop_id: Printify shop ID
+            product_id: Printify product ID
+
+        Returns:
+            Dict with product data if successful, None otherwise
+        """
+        fetch_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}.json"
+        response = await self._request("GET", fetch_url)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error fetching product: {response.status_code} - {response.text}")
+            return None
+
+    async def create_product(self, shop_id: str, product_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create a new product on Printify.
+
+        Args:
+            shop_id: Printify shop ID
+            product_data: Dict with product data
+
+        Returns:
+            Dict with new product data if successful, None otherwise
+        """
+        create_url = f"{self.base_url}/shops/{shop_id}/products.json"
+        response = await self._request("POST", create_url, json=product_data)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error creating product: {response.status_code} - {response.text}")
+            return None
+
+    async def publish_product(self, shop_id: str, product_id: str, publish_data: Dict[str, Any]) -> bool:
+        """
+        Publish a product on Printify.
+
+        Args:
+            shop_id: Printify shop ID
+            product_id: Printify product ID
+            publish_data: Dict with publish options
+
+        Returns:
+            True if successful, False otherwise
+        """
+        publish_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}/publish.json"
+        response = await self._request("POST", publish_url, json=publish_data)
+
+        if response.status_code == 200:
+            return True
+        else:
+            print(f"Error publishing product: {response.status_code} - {response.text}")
+            return False
+
+    async def delete_product(self, shop_id: str, product_id: str) -> bool:
+        """
+        Delete a product from Printify.
+
+        Args:
+            shop_id: Printify shop ID
+            product_id: Printify product ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        delete_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}.json"
+        response = await self._request("DELETE", delete_url)
+
+        if response.status_code == 200:
+            return True
+        else:
+            print(f"Error deleting product: {response.status_code} - {response.text}")
+            return False
+
+    async def get_mockup_image(self, shop_id: str, product_id: str, image_index: int = 0) -> Optional[str]:
+        """
+        Get mockup image URL for a product.
+
+        Args:
+            shop_id: Printify shop ID
+            product_id: Printify product ID
+            image_index: Index of the mockup image to retrieve
+
+        Returns:
+            Image URL if successful, None otherwise
+        """
+        product_data = await self.get_product(shop_id, product_id)
+
+        if not product_data:
+            return None
+
+        mockups = product_data.get("images", [])
+
+        if not mockups or image_index >= len(mockups):
+            print(f"Error: No mockup at index {image_index}")
+            return None
+
+        return mockups[image_index]["src"]
@@ -1,37 +1,113 @@
 import openai
 from openai import OpenAI
 import os
+import time
 from dotenv import load_dotenv
+from clients.openai_budget import MAX_RETRIES, TokenBudgets, estimate_tokens, get_shared_budgets, retry_delay
+from util.prompt_cache import PROMPT_CACHE_VARIANTS, get_prompt_cache, prompt_key
 
 # Load environment variables
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
 client = OpenAI()
+# Text retries are handled in OpenAIClient so they share the token budget
+text_client = client.with_options(max_retries=0)
 
 
 class OpenAIClient:
-    """Handles all OpenAI API interactions for both text and images."""
+    """
+    Handles all OpenAI API interactions for both text and images.
+
+    Text completions draw from per-model tokens-per-minute budgets and retry rate limit
+    (429), server (5xx) and connection errors the same way AsyncOpenAIClient does; the
+    client is thread-safe, so parallel text generation shares one budget.
+    """
+
+    def __init__(self, cache=None, variants=PROMPT_CACHE_VARIANTS, tpm_limits=None):
+        """
+        :param cache: PromptCache for text completions; defaults to the shared one, which
+            is only enabled with OPENAI_PROMPT_CACHE=1.
+        :param variants: Completions sampled per cached prompt and served round-robin.
+        :param tpm_limits: Tokens per minute per model; defaults to OPENAI_TPM_LIMITS, shared process-wide.
+        """
+        self.cache = cache if cache is not None else get_prompt_cache()
+        self.variants = max(1, variants)
+        self.budgets = get_shared_budgets() if tpm_limits is None else TokenBudgets(tpm_limits)
+
+    def _complete(self, system_message, user_message, model, max_tokens, temperature, n, seed):
+        """Requests `n` completions, waiting for budget and retrying transient failures."""
+        budget = self.budgets.for_model(model)
+        estimate = estimate_tokens(system_message, user_message, max_tokens, n)
+        params = {"seed": seed} if seed is not None else {}
+
+        for attempt in range(MAX_RETRIES + 1):
+            if budget:
+                budget.acquire(estimate)
+            try:
+                response = text_client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": user_message}
+                    ],
+                    model=model,
+                    max_tokens=max_tokens,
+                    n=n,
+                    temperature=temperature,
+                    **params
+                )
+            except openai.OpenAIError as e:
+                delay = retry_delay(e, attempt)
+                if delay is None or attempt == MAX_RETRIES:
+                    raise
+                # The request never ran, so its reservation goes back to the budget
+                if budget:
+                    budget.refund(estimate)
+                if budget and isinstance(e, openai.RateLimitError):
+                    # The next acquire waits out the pause, together with every other caller
+                    budget.pause(delay)
+                else:
+                    time.sleep(delay)
+                print(f"OpenAI request for {model} failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+                continue
+
+            if budget and response.usage:
+                budget.refund(estimate - response.usage.total_tokens)
+            return [choice.message.content for choice in response.choices]
+
+    def generate_text(self, system_message, user_message, model="gpt-3.5-turbo", max_tokens=150, temperature=0.7,
+                      seed=None, use_cache=True):
+        """
+        Handles API calls for text generation, serving repeated prompts from the cache when enabled.
+        Transient failures are retried; None is only returned once retries are exhausted or on
+        a non-retryable error.
+        """
+        cache = self.cache if use_cache else None
+        variants = self.variants if cache else 1
+        key = None
+        if cache:
+            key = prompt_key(model, system_message, user_message, temperature, max_tokens, seed, variants)
+            try:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                print(f"Error reading prompt cache: {e}")
 
-    @staticmethod
-    def generate_text(system_message, user_message, model="gpt-3.5-turbo", max_tokens=150, temperature=0.7):
-        """Handles API calls for text generation."""
         try:
-            response = client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                model=model,
-                max_tokens=max_tokens,
-                n=1,
-                temperature=temperature
-            )
-            return response.choices[0].message.content
+            responses = self._complete(system_message, user_message, model, max_tokens, temperature, variants, seed)
         except Exception as e:
             print(f"Error in text API call: {e}")
             return None
 
+        if cache:
+            try:
+                # The first completion is returned now; later calls get the others in turn
+                cache.put(key, model, responses, served=1)
+            except Exception as e:
+                print(f"Error writing prompt cache: {e}")
+        return responses[0]
+
     @staticmethod
     def generate_image(prompt, model="dall-e-3", size="1792x1024", quality="hd"):
         """Handles OpenAI image generation."""
@@ -47,3 +123,7 @@ class OpenAIClient:
         except Exception as e:
             print(f"Error generating image: {e}")
             return None
+
+    def budget_metrics(self):
+        """Per-model token budget balance and throttling counters."""
+        return self.budgets.metrics()
@@ -0,0 +1,89 @@
+import os
+import threading
+from typing import Dict, Optional
+
+import openai
+
+from clients.rate_limiter import TokenBucket, backoff_delay, parse_retry_after
+
+MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "6"))
+BACKOFF_BASE = 1
+BACKOFF_CAP = 60
+
+# Tokens per minute allowed per model, e.g. "gpt-3.5-turbo=200000,gpt-4o=30000";
+# models not listed use OPENAI_TPM_DEFAULT (0 disables budgeting for them)
+DEFAULT_TPM = int(os.getenv("OPENAI_TPM_DEFAULT", "90000"))
+TPM_LIMITS = {
+    model.strip(): int(limit)
+    for model, limit in (
+        entry.split("=") for entry in os.getenv("OPENAI_TPM_LIMITS", "").split(",") if "=" in entry
+    )
+}
+
+# Rough prompt size estimate before the API reports actual usage
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 8
+
+
+def estimate_tokens(system_message: str, user_message: str, max_tokens: int, n: int = 1) -> int:
+    """Upper-bound token cost of a completion: the prompt plus the most it may generate."""
+    prompt_chars = len(system_message or "") + len(user_message or "")
+    return prompt_chars // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS + max_tokens * n
+
+
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after `error`, or None if it is not retryable."""
+    if isinstance(error, openai.RateLimitError):
+        if getattr(error, "code", None) == "insufficient_quota":
+            # Billing quota, not a rate: waiting will not help
+            return None
+        headers = error.response.headers if error.response is not None else {}
+        retry_after_ms = parse_retry_after(headers.get("retry-after-ms"))
+        if retry_after_ms is not None:
+            return retry_after_ms / 1000
+        delay = parse_retry_after(headers.get("retry-after"))
+        return delay if delay is not None else backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+    if isinstance(error, openai.APIStatusError) and error.status_code >= 500:
+        return backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+    if isinstance(error, openai.APIConnectionError):
+        return backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+    return None
+
+
+class TokenBudgets:
+    """Per-model tokens-per-minute buckets, created on first use. Thread-safe."""
+
+    def __init__(self, tpm_limits: Optional[Dict[str, int]] = None):
+        self.tpm_limits = TPM_LIMITS if tpm_limits is None else tpm_limits
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def for_model(self, model: str) -> Optional[TokenBucket]:
+        """The model's tokens-per-minute bucket, or None when it is not budgeted."""
+        with self._lock:
+            if model not in self.buckets:
+                limit = self.tpm_limits.get(model, DEFAULT_TPM)
+                self.buckets[model] = TokenBucket(f"tpm:{model}", limit, 60) if limit > 0 else None
+            return self.buckets[model]
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-model token budget balance and throttling counters."""
+        with self._lock:
+            buckets = dict(self.buckets)
+        return {model: bucket.metrics() for model, bucket in buckets.items() if bucket}
+
+
+_shared_budgets = None
+_shared_budgets_lock = threading.Lock()
+
+
+def get_shared_budgets() -> TokenBudgets:
+    """
+    Returns the process-wide budgets. Limits are enforced per API key, so every OpenAI
+    client in the process that uses the default limits draws from the same buckets.
+    """
+    global _shared_budgets
+    with _shared_budgets_lock:
+        if _shared_budgets is None:
+            _shared_budgets = TokenBudgets()
+        return _shared_budgets
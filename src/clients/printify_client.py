@@ -1,31 +1,131 @@
 import requests
 import os
-import base64
+import threading
+import time
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from clients.rate_limiter import RateLimitScheduler, backoff_delay, get_default_scheduler, parse_retry_after
+from clients.upload_body import Base64JSONUploadBody
 
 # Load environment variables
 load_dotenv()
 API_KEY = os.getenv("PRINTIFY_API_KEY")
 BASE_URL = "https://api.printify.com/v1"
 
+# Keep-alive connections held open to api.printify.com; size it to the number of worker threads
+HTTP_POOL_SIZE = int(os.getenv("PRINTIFY_HTTP_POOL_SIZE", "10"))
+# (connect, read) timeouts in seconds; uploads get a longer read timeout for large payloads
+CONNECT_TIMEOUT = float(os.getenv("PRINTIFY_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("PRINTIFY_READ_TIMEOUT", "30"))
+UPLOAD_READ_TIMEOUT = float(os.getenv("PRINTIFY_UPLOAD_READ_TIMEOUT", "120"))
+
+# Retries for throttled or failed calls, with jittered exponential backoff between attempts
+MAX_RETRIES = int(os.getenv("PRINTIFY_MAX_RETRIES", "5"))
+BACKOFF_BASE = float(os.getenv("PRINTIFY_BACKOFF_BASE", "1"))
+BACKOFF_CAP = float(os.getenv("PRINTIFY_BACKOFF_CAP", "60"))
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+
 class PrintifyClient:
     """
     Client for interacting with the Printify API.
     Handles all direct API calls.
     """
     
-    def __init__(self):
-        """Initialize the Printify client with API key from environment variables."""
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, timeout: tuple = (CONNECT_TIMEOUT, READ_TIMEOUT),
+                 scheduler: Optional[RateLimitScheduler] = None):
+        """
+        Initialize the Printify client with API key from environment variables.
+
+        The client owns a requests.Session, so TCP/TLS connections are kept alive and
+        reused across calls instead of being re-established for every request.
+        Prefer get_shared_client() over constructing clients per request.
+
+        Args:
+            pool_size: Maximum number of pooled connections kept open to the API
+            timeout: Default (connect, read) timeout in seconds for each call
+            scheduler: Rate limit scheduler; defaults to the process-wide one
+        """
         self.headers = {
             "Authorization": f"Bearer {API_KEY}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
         self.base_url = BASE_URL
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.scheduler = scheduler or get_default_scheduler()
+
+    def close(self):
+        """Close the pooled connections held by the session."""
+        self.session.close()
+
+    def rate_limit_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Queue depth and throttling counters for each rate limit bucket."""
+        return self.scheduler.metrics()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request through the rate limit scheduler.
+
+        A 429 means the call was rejected without being processed, so any call is retried
+        after Retry-After (or a backoff when the header is missing), and its buckets are
+        paused so other threads back off too. Server errors and connection failures are
+        retried only for idempotent methods, since a POST may already have taken effect.
+        The last response is returned once retries run out.
+        """
+        method = method.upper()
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        idempotent = method in IDEMPOTENT_METHODS
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.scheduler.acquire(method, path)
+            # Streamed bodies are consumed by each attempt, so rewind before (re)sending
+            if hasattr(kwargs.get("data"), "seek"):
+                kwargs["data"].seek(0)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not idempotent or attempt == MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"{method} {path} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if attempt == MAX_RETRIES:
+                return response
+
+            if response.status_code == 429:
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"Rate limited on {method} {path}; retrying in {delay:.1f}s")
+                self.scheduler.on_rate_limited(method, path, delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and idempotent:
+                delay = backoff_delay(attempt, BACKOFF_BASE, BACKOFF_CAP)
+                print(f"{method} {path} returned {response.status_code}; retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            return response
     
     def upload_image(self, image_path: str) -> Optional[Dict[str, Any]]:
         """
         Upload an image to Printify.
+        The file is base64-encoded and sent in chunks as it is read, so memory use
+        stays bounded by the chunk size even for very large print files.
         
         Args:
             image_path: Path to the image file
@@ -42,19 +142,44 @@ class PrintifyClient:
             # Extract the file name from the path
             file_name = os.path.basename(image_path)
 
-            # Open the image file in binary mode and encode it to Base64
-            with open(image_path, 'rb') as image_file:
-                encoded_contents = base64.b64encode(image_file.read()).decode('utf-8')
+            # Stream the JSON body with Base64-encoded contents
+            body = Base64JSONUploadBody(image_path, file_name)
+
+            # Send the request to upload the image
+            upload_url = f"{self.base_url}/uploads/images.json"
+            response = self._request("POST", upload_url, data=body, timeout=(self.timeout[0], UPLOAD_READ_TIMEOUT))
+
+            if response.status_code == 200:
+                print("Image uploaded successfully!")
+                return response.json()
+            else:
+                print(f"Error uploading image: {response.status_code} - {response.text}")
+                return None
 
-            # Prepare the data with Base64-encoded contents
+        except Exception as e:
+            print(f"An error occurred during image upload: {e}")
+            return None
+
+    def upload_image_from_url(self, image_url: str, file_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Upload an image that is already hosted elsewhere; Printify fetches it from the URL,
+        so the file never passes through this process.
+        
+        Args:
+            image_url: Publicly reachable URL of the image
+            file_name: Name to store the image under; defaults to the last URL path segment
+            
+        Returns:
+            Dict with image data including ID if successful, None otherwise
+        """
+        try:
             data = {
-                'file_name': file_name,
-                'contents': encoded_contents
+                'file_name': file_name or image_url.split('?')[0].rstrip('/').split('/')[-1],
+                'url': image_url
             }
 
-            # Send the request to upload the image
             upload_url = f"{self.base_url}/uploads/images.json"
-            response = requests.post(upload_url, headers=self.headers, json=data)
+            response = self._request("POST", upload_url, json=data, timeout=(self.timeout[0], UPLOAD_READ_TIMEOUT))
 
             if response.status_code == 200:
                 print("Image uploaded successfully!")
@@ -79,7 +204,7 @@ class PrintifyClient:
             Dict with product data if successful, None otherwise
         """
         fetch_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}.json"
-        response = requests.get(fetch_url, headers=self.headers)
+        response = self._request("GET", fetch_url)
 
         if response.status_code == 200:
             return response.json()
@@ -99,7 +224,7 @@ class PrintifyClient:
             Dict with new product data if successful, None otherwise
         """
         create_url = f"{self.base_url}/shops/{shop_id}/products.json"
-        response = requests.post(create_url, headers=self.headers, json=product_data)
+        response = self._request("POST", create_url, json=product_data)
 
         if response.status_code == 200:
             return response.json()
@@ -120,7 +245,7 @@ class PrintifyClient:
             True if successful, False otherwise
         """
         publish_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}/publish.json"
-        response = requests.post(publish_url, headers=self.headers, json=publish_data)
+        response = self._request("POST", publish_url, json=publish_data)
 
         if response.status_code == 200:
             return True
@@ -140,7 +265,7 @@ class PrintifyClient:
             True if successful, False otherwise
         """
         delete_url = f"{self.base_url}/shops/{shop_id}/products/{product_id}.json"
-        response = requests.delete(delete_url, headers=self.headers)
+        response = self._request("DELETE", delete_url)
 
         if response.status_code == 200:
             return True
@@ -171,4 +296,22 @@ class PrintifyClient:
             print(f"Error: No mockup at index {image_index}")
             return None
             
-        return mockups[image_index]["src"] 
\ No newline at end of file
+        return mockups[image_index]["src"]
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> PrintifyClient:
+    """
+    Returns the process-wide PrintifyClient, creating it on first use.
+    Sharing one client lets every PrintifyService (and every Flask request) reuse the
+    same pool of keep-alive connections.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = PrintifyClient()
+    return _shared_client
@@ -0,0 +1,210 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+
+def _parse_rate(value: str) -> tuple:
+    """Parses a '<requests>/<seconds>' rate string, e.g. '600/60'."""
+    requests_allowed, period = value.split("/")
+    return int(requests_allowed), float(period)
+
+
+# Printify's published limits, overridable from the environment as '<requests>/<seconds>'.
+# Every call counts against 'global'; some endpoints also draw from a stricter bucket.
+DEFAULT_RATES = {
+    "global": _parse_rate(os.getenv("PRINTIFY_RATE_GLOBAL", "600/60")),
+    "catalog": _parse_rate(os.getenv("PRINTIFY_RATE_CATALOG", "100/60")),
+    "product_write": _parse_rate(os.getenv("PRINTIFY_RATE_PRODUCT_WRITE", "200/1800")),
+    "publish": _parse_rate(os.getenv("PRINTIFY_RATE_PUBLISH", "200/1800")),
+}
+# Deletes fall outside Printify's 200/30min product-write limit, so by default they only
+# count against 'global'; set PRINTIFY_RATE_PRODUCT_DELETE to give them their own limit.
+if os.getenv("PRINTIFY_RATE_PRODUCT_DELETE"):
+    DEFAULT_RATES["product_delete"] = _parse_rate(os.getenv("PRINTIFY_RATE_PRODUCT_DELETE"))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket holding up to `capacity` tokens, refilled evenly over `period` seconds.
+
+    Callers reserve a token up front and are told how long to wait for it, so waiting
+    callers are served in arrival order and the bucket never has to be polled.
+    """
+
+    def __init__(self, name: str, capacity: int, period: float):
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes `tokens` (one request by default) and returns how many seconds the caller
+        must wait before using them. The balance may go negative; each reservation queues
+        behind the previous ones.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate, self._paused_until - now)
+            self.acquired += 1
+            self.total_wait += wait
+            return wait
+
+    def acquire(self, tokens: float = 1):
+        """Blocks until `tokens` are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            with self._lock:
+                self.waiting += 1
+            try:
+                time.sleep(wait)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+
+    async def acquire_async(self, tokens: float = 1):
+        """Waits for `tokens` without blocking the event loop."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            with self._lock:
+                self.waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+
+    def refund(self, tokens: float):
+        """Returns tokens that were reserved but not used, e.g. after an overestimate."""
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def pause(self, seconds: float):
+        """
+        Holds back every caller for `seconds`, used when the server answers 429.
+        The balance is drained so traffic ramps back up gradually afterwards.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self.throttled += 1
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "queue_depth": self.waiting,
+                "available": max(0.0, self._tokens),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "total_wait_seconds": round(self.total_wait, 3),
+            }
+
+
+class RateLimitScheduler:
+    """
+    Routes each Printify call to its token buckets and blocks until the call may be sent.
+
+    Buckets:
+        global          every request
+        catalog         /catalog/ endpoints
+        product_write   creating and updating products
+        publish         publishing endpoints
+        product_delete  deleting products, only when PRINTIFY_RATE_PRODUCT_DELETE is set
+    """
+
+    def __init__(self, rates: Optional[Dict[str, tuple]] = None):
+        rates = rates or DEFAULT_RATES
+        self.buckets = {
+            name: TokenBucket(name, capacity, period)
+            for name, (capacity, period) in rates.items()
+        }
+
+    @staticmethod
+    def bucket_for(method: str, path: str) -> Optional[str]:
+        """Returns the endpoint-specific bucket name for a call, or None if only 'global' applies."""
+        if "/catalog/" in path:
+            return "catalog"
+        if path.endswith("/publish.json") or "/publishing_succeeded.json" in path or "/publishing_failed.json" in path:
+            return "publish"
+        if "/products" in path and method.upper() in ("POST", "PUT"):
+            return "product_write"
+        if "/products" in path and method.upper() == "DELETE":
+            return "product_delete"
+        return None
+
+    def _buckets_for(self, method: str, path: str) -> list:
+        names = ["global", self.bucket_for(method, path)]
+        return [self.buckets[name] for name in names if name in self.buckets]
+
+    def acquire(self, method: str, path: str):
+        """Blocks until every bucket that applies to the call has a token."""
+        for bucket in self._buckets_for(method, path):
+            bucket.acquire()
+
+    async def acquire_async(self, method: str, path: str):
+        """Asyncio counterpart of acquire, for the async client."""
+        for bucket in self._buckets_for(method, path):
+            await bucket.acquire_async()
+
+    def on_rate_limited(self, method: str, path: str, retry_after: float):
+        """Pauses the buckets behind a call that was answered with 429."""
+        for bucket in self._buckets_for(method, path):
+            bucket.pause(retry_after)
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-bucket queue depth, token balance and throttling counters."""
+        return {name: bucket.metrics() for name, bucket in self.buckets.items()}
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff, so retrying workers do not fire in lockstep."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a numeric Retry-After header value, or None if absent or not numeric."""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RateLimitScheduler:
+    """
+    Returns the process-wide scheduler. Limits are enforced per API key, so every
+    client in the process must draw from the same buckets.
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        with _default_scheduler_lock:
+            if _default_scheduler is None:
+                _default_scheduler = RateLimitScheduler()
+    return _default_scheduler
@@ -0,0 +1,82 @@
+import asyncio
+import base64
+import json
+import os
+
+# Raw bytes read and encoded per step; a multiple of 3 so encoded chunks join without padding
+UPLOAD_CHUNK_SIZE = int(os.getenv("PRINTIFY_UPLOAD_CHUNK_SIZE", str(3 * 256 * 1024))) // 3 * 3
+
+
+class Base64JSONUploadBody:
+    """
+    Streams the JSON body {"file_name": ..., "contents": "<base64 of file>"} for the
+    Printify image upload endpoint without ever holding the whole file in memory.
+
+    The file is read and base64-encoded one chunk at a time, so peak memory per upload
+    is about 2.3x `chunk_size` regardless of image size. The encoded length is known up
+    front, so the body is sent with a Content-Length instead of chunked encoding.
+
+    Works as a file-like body for requests (read/__len__) and as a re-iterable async
+    byte stream for httpx (__aiter__). It deliberately has no __iter__: httpx would treat
+    it as a sync stream, and requests would switch to chunked encoding. seek(0) restarts
+    it for a retry.
+    """
+
+    def __init__(self, path: str, file_name: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = max(3, chunk_size // 3 * 3)
+
+        # Everything before and after the base64 payload; json.dumps escapes the file name
+        self._prefix = ('{"file_name": ' + json.dumps(file_name) + ', "contents": "').encode("utf-8")
+        self._suffix = b'"}'
+        size = os.path.getsize(path)
+        self._length = len(self._prefix) + 4 * ((size + 2) // 3) + len(self._suffix)
+
+        self.seek(0)
+
+    def __len__(self):
+        return self._length
+
+    def _encoded_chunks(self):
+        yield self._prefix
+        with open(self.path, "rb") as image_file:
+            while True:
+                raw = image_file.read(self.chunk_size)
+                if not raw:
+                    break
+                yield base64.b64encode(raw)
+        yield self._suffix
+
+    def seek(self, offset: int, whence: int = 0):
+        """Only rewinding to the start is supported."""
+        if offset != 0 or whence != 0:
+            raise ValueError("Base64JSONUploadBody can only seek to the start")
+        self._chunks = self._encoded_chunks()
+        self._buffer = b""
+        self._offset = 0
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Returns up to `size` bytes of the body (all remaining bytes if size < 0)."""
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            if self._offset >= len(self._buffer):
+                self._buffer = next(self._chunks, b"")
+                self._offset = 0
+                if not self._buffer:
+                    break
+            end = len(self._buffer) if size < 0 else min(len(self._buffer), self._offset + remaining)
+            parts.append(self._buffer[self._offset:end])
+            remaining -= end - self._offset
+            self._offset = end
+        return b"".join(parts)
+
+    async def __aiter__(self):
+        # File reads and encoding run off the event loop, one chunk at a time
+        chunks = self._encoded_chunks()
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
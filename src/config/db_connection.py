@@ -1,31 +1,222 @@
+import os
+import threading
+import time
 import mysql.connector
 from mysql.connector import Error
 
+# Pool tuning, overridable from the environment
+DEFAULT_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DEFAULT_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DEFAULT_MAX_IDLE_SECONDS = float(os.getenv("DB_POOL_MAX_IDLE_SECONDS", "300"))
+
+
+class PoolExhaustedError(Error):
+    """Raised when no pooled connection becomes available before the checkout timeout."""
+
+
+class DBConnectionPool:
+    """
+    Bounded, thread-safe pool of MySQL connections.
+
+    Connections are created lazily up to `pool_size`. A checkout reuses the most
+    recently returned idle connection, evicting it first if it has been idle for
+    longer than `max_idle_seconds` or fails its health check. When every connection
+    is in use, callers wait (up to `timeout` seconds) for one to be returned.
+    """
+
+    def __init__(self, host, user, password, database,
+                 pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_POOL_TIMEOUT,
+                 max_idle_seconds=DEFAULT_MAX_IDLE_SECONDS):
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+
+        self._lock = threading.Condition()
+        self._idle = []  # stack of (connection, returned_at)
+        self._in_use = 0
+
+        # Statistics
+        self._created = 0
+        self._evicted = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+
+    def _new_connection(self):
+        connection = mysql.connector.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database
+        )
+        with self._lock:
+            self._created += 1
+        return connection
+
+    def _is_healthy(self, connection):
+        try:
+            # Round-trips a ping and transparently fails if the server went away
+            return connection.is_connected()
+        except Error:
+            return False
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    def checkout(self):
+        """
+        Borrow a connection from the pool, blocking while the pool is exhausted.
+        """
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        wait_started = None
+
+        with self._lock:
+            while not self._idle and self._in_use >= self.pool_size:
+                if not waited:
+                    waited = True
+                    wait_started = time.monotonic()
+                    self._waits += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    self._wait_time += time.monotonic() - wait_started
+                    raise PoolExhaustedError(
+                        msg=f"Timed out after {self.timeout}s waiting for a database connection"
+                    )
+                self._lock.wait(remaining)
+
+            if waited:
+                self._wait_time += time.monotonic() - wait_started
+
+            candidate = self._idle.pop() if self._idle else None
+            self._in_use += 1
+            self._checkouts += 1
+
+        try:
+            if candidate is not None:
+                connection, returned_at = candidate
+                idle_for = time.monotonic() - returned_at
+                if idle_for <= self.max_idle_seconds and self._is_healthy(connection):
+                    return connection
+                self._discard(connection)
+                with self._lock:
+                    self._evicted += 1
+            return self._new_connection()
+        except Exception:
+            # Give the slot back if we could not hand out a connection
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+    def release(self, connection):
+        """
+        Return a connection to the pool. Any open transaction is rolled back so the
+        next borrower starts from a clean snapshot.
+        """
+        reusable = True
+        try:
+            connection.rollback()
+        except Error:
+            reusable = False
+            self._discard(connection)
+
+        with self._lock:
+            self._in_use -= 1
+            if reusable:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self._evicted += 1
+            self._lock.notify()
+
+    def stats(self):
+        """
+        Returns a snapshot of the pool counters.
+        """
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "created": self._created,
+                "evicted": self._evicted,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_time": self._wait_time,
+                "timeouts": self._timeouts,
+            }
+
+    def close_all(self):
+        """
+        Close every idle connection held by the pool.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._discard(connection)
+
+
+# Pools are shared process-wide, one per set of connection settings
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(host="localhost", user="root", password="", database="print_core_db", **pool_kwargs):
+    """
+    Returns the shared pool for the given connection settings, creating it on first use.
+    """
+    key = (host, user, password, database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = DBConnectionPool(host, user, password, database, **pool_kwargs)
+            _pools[key] = pool
+        return pool
+
+
 class DBConnection:
+    """
+    A single checked-out connection from the shared pool.
+
+    connect() borrows a connection and opens a dictionary cursor on it;
+    close() closes the cursor and hands the connection back to the pool.
+    """
+
     def __init__(self, host="localhost", user="root", password="", database="print_core_db"):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.pool = get_pool(host, user, password, database)
         self.connection = None
         self.cursor = None
 
     def connect(self):
+        if self.connection is not None:
+            return
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
+            self.connection = self.pool.checkout()
             self.cursor = self.connection.cursor(dictionary=True)
-            print("Connected to the database successfully!")
         except Error as e:
             print(f"Error connecting to MySQL: {e}")
 
     def close(self):
         if self.cursor:
-            self.cursor.close()
+            try:
+                self.cursor.close()
+            except Error:
+                pass
+            self.cursor = None
         if self.connection:
-            self.connection.close()
-        print("Database connection closed.")
+            self.pool.release(self.connection)
+            self.connection = None
@@ -0,0 +1,128 @@
+import os
+import re
+from pathlib import Path
+
+from config.db_connection import DBConnection
+
+# Numbered .sql files, e.g. 0001_initial_schema.sql
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+# Advisory lock name, so concurrently starting workers apply migrations only once
+MIGRATION_LOCK_NAME = "print_core_schema_migrations"
+MIGRATION_LOCK_TIMEOUT = int(os.getenv("DB_MIGRATION_LOCK_TIMEOUT", "60"))
+
+
+class MigrationRunner:
+    """
+    Applies the numbered SQL files in `migrations/` that have not been recorded in
+    the 'schema_version' table yet, in version order.
+
+    MySQL commits DDL implicitly, so a migration is not atomic: a version is recorded
+    only after all of its statements succeed, and migrations should be written so a
+    partially applied file can be fixed up and re-run.
+    """
+
+    def __init__(self, db_conn: DBConnection, migrations_dir: Path = MIGRATIONS_DIR):
+        self.db = db_conn
+        self.migrations_dir = Path(migrations_dir)
+
+    def _ensure_version_table(self):
+        self.db.cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+        self.db.connection.commit()
+
+    def available_migrations(self) -> list:
+        """
+        Returns (version, name, path) for every migration file, sorted by version.
+        """
+        migrations = []
+        for path in self.migrations_dir.iterdir():
+            match = MIGRATION_FILE_PATTERN.match(path.name)
+            if match:
+                migrations.append((int(match.group(1)), match.group(2), path))
+        migrations.sort()
+
+        versions = [version for version, _, _ in migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Duplicate migration version in {self.migrations_dir}")
+        return migrations
+
+    def applied_versions(self) -> set:
+        self.db.cursor.execute("SELECT version FROM schema_version")
+        return {row["version"] for row in self.db.cursor.fetchall()}
+
+    def current_version(self) -> int:
+        self._ensure_version_table()
+        return max(self.applied_versions(), default=0)
+
+    @staticmethod
+    def split_statements(sql: str) -> list:
+        """
+        Splits a migration file into statements on ';', dropping '--' comment lines.
+        Statements must not contain literal semicolons.
+        """
+        lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+        return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+    def migrate(self) -> list:
+        """
+        Applies all pending migrations and returns the versions that were applied.
+        """
+        self._ensure_version_table()
+
+        self.db.cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (MIGRATION_LOCK_NAME, MIGRATION_LOCK_TIMEOUT))
+        row = self.db.cursor.fetchone()
+        if not row or row["acquired"] != 1:
+            raise RuntimeError("Could not acquire the schema migration lock")
+
+        applied = []
+        try:
+            # Re-read under the lock in case another process just migrated
+            done = self.applied_versions()
+            for version, name, path in self.available_migrations():
+                if version in done:
+                    continue
+                print(f"Applying migration {version:04d}_{name}...")
+                for statement in self.split_statements(path.read_text()):
+                    self.db.cursor.execute(statement)
+                self.db.cursor.execute(
+                    "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                    (version, name)
+                )
+                self.db.connection.commit()
+                applied.append(version)
+        finally:
+            self.db.cursor.execute("SELECT RELEASE_LOCK(%s) AS released", (MIGRATION_LOCK_NAME,))
+            self.db.cursor.fetchone()
+
+        if applied:
+            print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+        else:
+            print("Database schema is up to date.")
+        return applied
+
+
+def run_migrations(host="localhost", user="root", password="", database="print_core_db") -> list:
+    """
+    Convenience wrapper that checks out a connection, migrates, and returns it to the pool.
+    Raises RuntimeError when no connection can be made, since DBConnection.connect()
+    only prints connection errors.
+    """
+    db_conn = DBConnection(host=host, user=user, password=password, database=database)
+    db_conn.connect()
+    try:
+        if db_conn.connection is None or db_conn.cursor is None:
+            raise RuntimeError(
+                f"Cannot run migrations: could not connect to MySQL database '{database}' "
+                f"at {host} as '{user}'. Check that MySQL is running, or set "
+                f"DB_MIGRATE_ON_STARTUP=0 and run main_migrate_db.py once it is reachable."
+            )
+        return MigrationRunner(db_conn).migrate()
+    finally:
+        db_conn.close()
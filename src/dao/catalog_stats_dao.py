@@ -0,0 +1,210 @@
+# file: dao/catalog_stats_dao.py
+
+import os
+from config.db_connection import DBConnection
+from util.db_util import execute_batched, first_variant_price_sql
+
+# Dashboards rebuild the stats when they are older than this; a periodic
+# main_refresh_catalog_stats.py run keeps them fresher without a request paying for it
+CATALOG_STATS_MAX_AGE_SECONDS = int(os.getenv("CATALOG_STATS_MAX_AGE_SECONDS", "300"))
+# Most frequent tags kept per scope
+CATALOG_STATS_TOP_TAGS = 50
+
+# Advisory lock, so only one worker rebuilds the stats at a time
+REFRESH_LOCK_NAME = "print_core_catalog_stats_refresh"
+
+# Upper bounds (exclusive, in the variant price unit, i.e. cents) of the price buckets
+PRICE_BUCKETS = (1000, 2000, 3000, 5000)
+# Font sizes, in percent, of the least and most used tags in the dashboard tag cloud
+TAG_CLOUD_MIN_PERCENT = 100
+TAG_CLOUD_MAX_PERCENT = 200
+
+
+def price_bucket_sql(column: str) -> str:
+    """CASE expression naming the price bucket of `column`, e.g. '1000-2000' or '5000+'."""
+    cases = []
+    lower = 0
+    for upper in PRICE_BUCKETS:
+        cases.append(f"WHEN {column} < {upper} THEN '{lower}-{upper}'")
+        lower = upper
+    return f"CASE {' '.join(cases)} ELSE '{lower}+' END"
+
+
+def catalog_summary(stats: dict) -> dict:
+    """The headline numbers shown on the home pages, from a fetch_stats() result."""
+    product_stats = stats.get("product", {})
+    return {
+        "total_templates": stats.get("template", {}).get("total", 0),
+        "total_products": product_stats.get("total", 0),
+        "published_products": product_stats.get("status", {}).get("PUBLISHED", 0),
+        "unique_tags": stats.get("catalog", {}).get("unique_tags", 0)
+    }
+
+
+def tag_cloud_sizes(tag_counts: dict) -> dict:
+    """
+    Font size in percent for each tag of a tag cloud. Counts are catalog-wide, so they
+    are scaled against the most used tag to stay within TAG_CLOUD_MIN/MAX_PERCENT.
+    """
+    if not tag_counts:
+        return {}
+    max_count = max(tag_counts.values()) or 1
+    spread = TAG_CLOUD_MAX_PERCENT - TAG_CLOUD_MIN_PERCENT
+    return {tag: TAG_CLOUD_MIN_PERCENT + round(spread * count / max_count) for tag, count in tag_counts.items()}
+
+
+class CatalogStatsDAO:
+    """
+    Reads and rebuilds the 'catalog_stats' rollup behind the dashboards: counts by
+    status, tag frequencies, the price distribution and 7-day update counts.
+
+    The rollup is rebuilt as a whole by a handful of GROUP BY queries, either by the
+    refresh job or by the first dashboard request that finds it stale.
+    """
+
+    # (scope, table, status table, status key, tag table, tag key)
+    _SCOPES = (
+        ("product", "products", "product_status", "product_fk", "product_tags", "product_id"),
+        ("template", "templates", "template_status", "template_fk", "template_tags", "template_id"),
+    )
+
+    def __init__(self, db_conn: DBConnection):
+        self.db = db_conn
+
+    def _collect_rows(self) -> list:
+        """Computes every stat as (scope, metric, name, value) rows."""
+        rows = []
+        cursor = self.db.cursor
+        for scope, table, status_table, status_key, tag_table, tag_key in self._SCOPES:
+            cursor.execute(f"""
+            SELECT COUNT(*) AS total,
+                   SUM(updated_at >= NOW() - INTERVAL 7 DAY) AS updated_7d
+            FROM {table}
+            """)
+            result = cursor.fetchone() or {}
+            rows.append((scope, "total", "", result.get("total") or 0))
+            rows.append((scope, "updated_7d", "", result.get("updated_7d") or 0))
+
+            cursor.execute(f"""
+            SELECT st.status, COUNT(*) AS count
+            FROM {status_table} st
+            JOIN {table} t ON t.id = st.{status_key}
+            GROUP BY st.status
+            """)
+            rows.extend((scope, "status", row["status"], row["count"]) for row in cursor.fetchall())
+
+            cursor.execute(f"""
+            SELECT tag, COUNT(DISTINCT {tag_key}) AS count
+            FROM {tag_table}
+            WHERE tag IS NOT NULL AND tag <> ''
+            GROUP BY tag
+            ORDER BY count DESC, tag
+            LIMIT %s
+            """, (CATALOG_STATS_TOP_TAGS,))
+            rows.extend((scope, "tag", row["tag"], row["count"]) for row in cursor.fetchall())
+
+            cursor.execute(f"SELECT COUNT(DISTINCT tag) AS count FROM {tag_table} WHERE tag IS NOT NULL AND tag <> ''")
+            result = cursor.fetchone() or {}
+            rows.append((scope, "unique_tags", "", result.get("count") or 0))
+
+        # A product's price is its first variant's price, as on the listing pages
+        cursor.execute(f"""
+        SELECT {price_bucket_sql('x.price')} AS bucket, COUNT(*) AS count, SUM(x.price) AS price_sum
+        FROM (
+            SELECT {first_variant_price_sql('product_variants', 'product_id', 'p.id')} AS price
+            FROM products p
+        ) x
+        WHERE x.price IS NOT NULL
+        GROUP BY bucket
+        """)
+        priced = 0
+        price_sum = 0
+        for row in cursor.fetchall():
+            rows.append(("product", "price_bucket", row["bucket"], row["count"]))
+            priced += row["count"]
+            price_sum += row["price_sum"] or 0
+        rows.append(("product", "priced", "", priced))
+        rows.append(("product", "price_sum", "", price_sum))
+
+        cursor.execute("""
+        SELECT COUNT(*) AS count FROM (
+            SELECT tag FROM product_tags WHERE tag IS NOT NULL AND tag <> ''
+            UNION
+            SELECT tag FROM template_tags WHERE tag IS NOT NULL AND tag <> ''
+        ) tags
+        """)
+        result = cursor.fetchone() or {}
+        rows.append(("catalog", "unique_tags", "", result.get("count") or 0))
+        return rows
+
+    def refresh(self, wait_seconds: int = 0) -> bool:
+        """
+        Rebuilds the whole rollup in one transaction. Returns False without doing
+        anything if another worker is already refreshing and does not finish within
+        `wait_seconds`.
+        """
+        self.db.cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (REFRESH_LOCK_NAME, wait_seconds))
+        result = self.db.cursor.fetchone()
+        if not result or result["acquired"] != 1:
+            return False
+
+        try:
+            rows = self._collect_rows()
+            self.db.cursor.execute("DELETE FROM catalog_stats")
+            execute_batched(
+                self.db.cursor,
+                "INSERT INTO catalog_stats (scope, metric, name, value, refreshed_at) VALUES (%s, %s, %s, %s, NOW())",
+                rows
+            )
+            self.db.connection.commit()
+            return True
+        except Exception as e:
+            self.db.connection.rollback()
+            print(f"Error refreshing catalog stats: {e}")
+            return False
+        finally:
+            self.db.cursor.execute("SELECT RELEASE_LOCK(%s)", (REFRESH_LOCK_NAME,))
+            self.db.cursor.fetchall()
+
+    def fetch_stats(self, max_age_seconds: int = CATALOG_STATS_MAX_AGE_SECONDS) -> dict:
+        """
+        Returns the rollup as {scope: {metric: value or {name: value}}}, named values such
+        as tags in descending order. It is rebuilt first when missing or older than
+        `max_age_seconds`; when another worker is already rebuilding it, the current
+        (possibly stale) stats are returned.
+        """
+        stats = self._read()
+        if stats.get("_age") is None or stats["_age"] > max_age_seconds:
+            if self.refresh():
+                stats = self._read()
+        stats.pop("_age", None)
+        return stats
+
+    def _read(self) -> dict:
+        self.db.cursor.execute("""
+        SELECT scope, metric, name, value, TIMESTAMPDIFF(SECOND, refreshed_at, NOW()) AS age
+        FROM catalog_stats
+        ORDER BY scope, metric, value DESC, name
+        """)
+        rows = self.db.cursor.fetchall()
+        # End the read so the next refresh check sees rows committed by other workers
+        self.db.connection.commit()
+
+        stats = {"product": {}, "template": {}, "catalog": {}, "_age": None}
+        for row in rows:
+            value = row["value"]
+            value = int(value) if value == int(value) else float(value)
+            metrics = stats.setdefault(row["scope"], {})
+            if row["name"]:
+                metrics.setdefault(row["metric"], {})[row["name"]] = value
+            else:
+                metrics[row["metric"]] = value
+            stats["_age"] = max(stats["_age"] or 0, row["age"] or 0)
+        return stats
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        if self.db:
+            self.db.close()
@@ -0,0 +1,123 @@
+# file: dao/generation_job_dao.py
+
+import json
+import threading
+from config.db_connection import DBConnection
+
+
+class GenerationJobDAO:
+    """
+    Journal of per-image progress for product generation runs (the 'generation_jobs' table).
+
+    A job is identified by (template_id, shop_id, image_sha256), so renaming or moving an
+    image does not lose its progress. Each finished stage stores its output, which lets a
+    rerun pick up exactly where the previous run stopped.
+
+    Pipeline stages run in several threads; every method serialises access to the single
+    connection with a lock, so one instance can be shared by all workers.
+    """
+
+    # Stages in pipeline order
+    STAGES = ("uploaded", "text_generated", "created", "saved")
+
+    # Columns a stage may record besides 'stage' itself
+    _STAGE_COLUMNS = ("image_name", "image_upload", "title", "description", "bullet_points", "printify_product_id")
+    _JSON_COLUMNS = {"image_upload", "bullet_points"}
+
+    def __init__(self, db_conn: DBConnection):
+        self.db = db_conn
+        self._lock = threading.Lock()
+
+    @classmethod
+    def reached(cls, job_row, stage: str) -> bool:
+        """True if the journal row shows the job completed `stage` (or a later one)."""
+        if not job_row or job_row.get("stage") not in cls.STAGES:
+            return False
+        return cls.STAGES.index(job_row["stage"]) >= cls.STAGES.index(stage)
+
+    def fetch_job(self, template_id: str, shop_id: str, image_sha256: str) -> dict | None:
+        """
+        Returns the journal row for an image, with JSON columns parsed, or None if the
+        image has not been started.
+        """
+        query = """
+        SELECT * FROM generation_jobs
+        WHERE template_id = %s AND shop_id = %s AND image_sha256 = %s
+        """
+        with self._lock:
+            self.db.cursor.execute(query, (template_id, shop_id, image_sha256))
+            row = self.db.cursor.fetchone()
+            # Keep the next read consistent with writes committed by other runs
+            self.db.connection.commit()
+
+        if not row:
+            return None
+        for column in self._JSON_COLUMNS:
+            if isinstance(row.get(column), (str, bytes, bytearray)):
+                row[column] = json.loads(row[column])
+        return row
+
+    def record_stage(self, template_id: str, shop_id: str, image_sha256: str, stage: str, **fields):
+        """
+        Marks a job as having completed `stage` and stores that stage's outputs.
+        Columns not passed in `fields` keep their stored values.
+        """
+        if stage not in self.STAGES:
+            raise ValueError(f"Invalid generation stage '{stage}'.")
+        unknown = set(fields) - set(self._STAGE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown generation job columns: {', '.join(sorted(unknown))}")
+
+        columns = ["template_id", "shop_id", "image_sha256", "stage", "last_error"] + list(fields)
+        values = [template_id, shop_id, image_sha256, stage, None]
+        for column, value in fields.items():
+            values.append(json.dumps(value) if column in self._JSON_COLUMNS else value)
+
+        updates = ["stage = VALUES(stage)", "last_error = NULL"] + [f"{column} = VALUES({column})" for column in fields]
+        sql = f"""
+        INSERT INTO generation_jobs ({', '.join(columns)})
+        VALUES ({', '.join(['%s'] * len(columns))})
+        ON DUPLICATE KEY UPDATE {', '.join(updates)}
+        """
+        with self._lock:
+            try:
+                self.db.cursor.execute(sql, values)
+                self.db.connection.commit()
+            except Exception as e:
+                self.db.connection.rollback()
+                print(f"Error recording stage '{stage}' for image {image_sha256}: {e}")
+                raise
+
+    def record_error(self, template_id: str, shop_id: str, image_sha256: str, error: str):
+        """Stores the last error for a job that has already been journaled; the stage is kept."""
+        sql = """
+        UPDATE generation_jobs SET last_error = %s
+        WHERE template_id = %s AND shop_id = %s AND image_sha256 = %s
+        """
+        with self._lock:
+            try:
+                self.db.cursor.execute(sql, (error, template_id, shop_id, image_sha256))
+                self.db.connection.commit()
+            except Exception as e:
+                self.db.connection.rollback()
+                print(f"Error recording failure for image {image_sha256}: {e}")
+
+    def count_by_stage(self, template_id: str, shop_id: str) -> dict:
+        """Number of journaled images per stage for a template/shop."""
+        query = """
+        SELECT stage, COUNT(*) AS count FROM generation_jobs
+        WHERE template_id = %s AND shop_id = %s
+        GROUP BY stage
+        """
+        with self._lock:
+            self.db.cursor.execute(query, (template_id, shop_id))
+            rows = self.db.cursor.fetchall()
+            self.db.connection.commit()
+        return {row["stage"]: row["count"] for row in rows}
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        if self.db:
+            self.db.close()
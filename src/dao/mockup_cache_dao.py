@@ -0,0 +1,183 @@
+# file: dao/mockup_cache_dao.py
+
+import json
+import os
+from config.db_connection import DBConnection
+
+# Entries older than this are treated as missing and refetched
+MOCKUP_CACHE_TTL_SECONDS = int(os.getenv("MOCKUP_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# Least recently used entries beyond this count are evicted
+MOCKUP_CACHE_MAX_ENTRIES = int(os.getenv("MOCKUP_CACHE_MAX_ENTRIES", "50000"))
+# Reads refresh last_used_at at most this often per entry, so listings rarely write
+MOCKUP_CACHE_TOUCH_SECONDS = 300
+
+
+def mockup_urls_from_images(images) -> list:
+    """
+    Image URLs in Printify order from a product's images, given either as the 'images'
+    list of a Printify product JSON or as PrintifyImageModels.
+    """
+    urls = []
+    for image in images or []:
+        src = image.get("src") if isinstance(image, dict) else (getattr(image, "data", None) or {}).get("src")
+        if src:
+            urls.append(src)
+    return urls
+
+
+def mockup_cache_join(id_column: str, alias: str = "mc") -> tuple:
+    """
+    (columns_sql, join_sql) for selecting the cached mockup next to the rows of another
+    query: 'mockup_url' is NULL when there is no fresh entry for `id_column`, and
+    'mockup_needs_touch' flags entries to pass to MockupCacheDAO.touch_mockups.
+    """
+    columns_sql = (
+        f"{alias}.mockup_url, "
+        f"{alias}.last_used_at < NOW() - INTERVAL {MOCKUP_CACHE_TOUCH_SECONDS} SECOND AS mockup_needs_touch"
+    )
+    join_sql = (
+        f"LEFT JOIN mockup_cache {alias} ON {alias}.printify_id = {id_column} "
+        f"AND {alias}.fetched_at >= NOW() - INTERVAL {int(MOCKUP_CACHE_TTL_SECONDS)} SECOND"
+    )
+    return columns_sql, join_sql
+
+
+class MockupCacheDAO:
+    """
+    Access to the 'mockup_cache' table, which maps Printify product and template ids to
+    their mockup image URLs so listing pages do not have to ask Printify for them.
+    """
+
+    KINDS = ("product", "template")
+
+    # Table and external id column holding the products or templates of each kind
+    _OWNER_TABLES = {"product": ("products", "product_id"), "template": ("templates", "template_id")}
+
+    def __init__(self, db_conn: DBConnection):
+        self.db = db_conn
+
+    def fetch_mockup_urls(self, printify_ids: list, ttl_seconds: int = MOCKUP_CACHE_TTL_SECONDS) -> dict:
+        """
+        Returns {printify_id: mockup_url} for the ids with a fresh entry. Ids without an
+        entry, or whose entry has expired, are left out.
+        """
+        ids = list(dict.fromkeys(pid for pid in printify_ids if pid))
+        if not ids:
+            return {}
+
+        placeholders = ", ".join(["%s"] * len(ids))
+        query = f"""
+        SELECT printify_id, mockup_url,
+               last_used_at < NOW() - INTERVAL %s SECOND AS needs_touch
+        FROM mockup_cache
+        WHERE printify_id IN ({placeholders})
+          AND fetched_at >= NOW() - INTERVAL %s SECOND
+        """
+        self.db.cursor.execute(query, [MOCKUP_CACHE_TOUCH_SECONDS] + ids + [ttl_seconds])
+        rows = self.db.cursor.fetchall()
+
+        self.touch_mockups([row["printify_id"] for row in rows if row["needs_touch"]])
+        return {row["printify_id"]: row["mockup_url"] for row in rows if row["mockup_url"]}
+
+    def fetch_known_ids(self, printify_ids: list, kind: str) -> set:
+        """The ids among `printify_ids` that belong to a stored product or template of `kind`."""
+        if kind not in self.KINDS:
+            raise ValueError(f"Invalid mockup kind '{kind}'. Expected one of: {', '.join(self.KINDS)}")
+        ids = list(dict.fromkeys(pid for pid in printify_ids if pid))
+        if not ids:
+            return set()
+
+        table, id_column = self._OWNER_TABLES[kind]
+        query = f"SELECT {id_column} FROM {table} WHERE {id_column} IN ({', '.join(['%s'] * len(ids))})"
+        self.db.cursor.execute(query, ids)
+        return {row[id_column] for row in self.db.cursor.fetchall()}
+
+    def touch_mockups(self, printify_ids: list):
+        """
+        Marks entries as recently used so eviction keeps them. Callers that read the
+        table themselves (e.g. listing queries joining it) pass only the ids whose
+        last_used_at is older than MOCKUP_CACHE_TOUCH_SECONDS.
+        """
+        if not printify_ids:
+            return
+        try:
+            touch_sql = f"UPDATE mockup_cache SET last_used_at = NOW() WHERE printify_id IN ({', '.join(['%s'] * len(printify_ids))})"
+            self.db.cursor.execute(touch_sql, list(printify_ids))
+            self.db.connection.commit()
+        except Exception as e:
+            self.db.connection.rollback()
+            print(f"Error touching mockup cache entries: {e}")
+
+    def store_mockups(self, printify_id: str, kind: str, image_urls: list, commit: bool = True):
+        """
+        Stores (or replaces) the mockup URLs for a product or template. The first URL is
+        the one shown on listing pages.
+
+        Pass commit=False to write inside the caller's transaction, e.g. while a DAO is
+        saving the product itself.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Invalid mockup kind '{kind}'. Expected one of: {', '.join(self.KINDS)}")
+
+        sql = """
+        INSERT INTO mockup_cache (printify_id, kind, mockup_url, image_urls, fetched_at, last_used_at)
+        VALUES (%s, %s, %s, %s, NOW(), NOW())
+        ON DUPLICATE KEY UPDATE
+            kind = VALUES(kind),
+            mockup_url = VALUES(mockup_url),
+            image_urls = VALUES(image_urls),
+            fetched_at = VALUES(fetched_at),
+            last_used_at = VALUES(last_used_at)
+        """
+        values = (printify_id, kind, image_urls[0] if image_urls else None, json.dumps(image_urls))
+        if not commit:
+            self.db.cursor.execute(sql, values)
+            return
+        try:
+            self.db.cursor.execute(sql, values)
+            self.db.connection.commit()
+        except Exception as e:
+            self.db.connection.rollback()
+            print(f"Error caching mockups for {printify_id}: {e}")
+
+    def delete_mockups(self, printify_id: str, commit: bool = True):
+        """Removes the cached mockups for a product or template."""
+        self.db.cursor.execute("DELETE FROM mockup_cache WHERE printify_id = %s", (printify_id,))
+        if commit:
+            self.db.connection.commit()
+
+    def evict(self, ttl_seconds: int = MOCKUP_CACHE_TTL_SECONDS, max_entries: int = MOCKUP_CACHE_MAX_ENTRIES) -> int:
+        """
+        Deletes expired entries, then the least recently used ones beyond `max_entries`.
+        Returns the number of rows removed.
+        """
+        try:
+            self.db.cursor.execute(
+                "DELETE FROM mockup_cache WHERE fetched_at < NOW() - INTERVAL %s SECOND", (ttl_seconds,)
+            )
+            removed = self.db.cursor.rowcount
+
+            # The cut-off is the last_used_at of the newest entry that no longer fits
+            self.db.cursor.execute(
+                "SELECT last_used_at FROM mockup_cache ORDER BY last_used_at DESC LIMIT 1 OFFSET %s",
+                (max_entries,)
+            )
+            cutoff = self.db.cursor.fetchone()
+            if cutoff:
+                self.db.cursor.execute(
+                    "DELETE FROM mockup_cache WHERE last_used_at <= %s", (cutoff["last_used_at"],)
+                )
+                removed += self.db.cursor.rowcount
+            self.db.connection.commit()
+            return removed
+        except Exception as e:
+            self.db.connection.rollback()
+            print(f"Error evicting mockup cache entries: {e}")
+            return 0
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        if self.db:
+            self.db.close()
@@ -3,6 +3,18 @@
 import json
 import uuid
 from config.db_connection import DBConnection
+from dao.mockup_cache_dao import MockupCacheDAO, mockup_cache_join, mockup_urls_from_images
+from util.db_util import (
+    DEFAULT_BATCH_SIZE,
+    SUMMARY_DESCRIPTION_CHARS,
+    fetch_rows_in,
+    fetch_tags_by_owner,
+    first_variant_price_sql,
+    SubModelTables,
+    CountCache
+)
+from util.pagination_util import KEYSET_SORTS, decode_cursor, order_clause, page_cursors, seek_clause
+from util.search_util import search_clause
 from models.printify_product_models import (
     PrintifyProductModel,
     PrintifyVariantModel,
@@ -12,194 +24,28 @@ from models.printify_product_models import (
     PrintifyTagModel,
     PrintifyExternalModel,
     PrintifySalesChannelPropertyModel,
-    PrintifyViewModel
+    PrintifyViewModel,
+    PrintifyProductSummaryModel
 )
 
 class ProductDAO:
-    def __init__(self, db_conn: DBConnection):
-        self.db = db_conn
-        # Automatically create all tables when this object is instantiated.
-        self._create_all_tables()
+    # Price of the first variant, as a correlated subquery on the outer 'p' alias
+    _FIRST_PRICE_SQL = first_variant_price_sql("product_variants", "product_id", "p.id")
+    # First stored image of 'p', the default one if it is flagged
+    _FIRST_IMAGE_SQL = "(SELECT pi.src FROM product_images pi WHERE pi.product_id = p.id ORDER BY pi.is_default DESC, pi.order_index LIMIT 1)"
 
-    def _create_all_tables(self):
-        self.create_tables()
-        self.create_status_table()
+    # Sub-model tables (product_tags, product_variants, ...), written through the shared helper
+    _SUB_MODELS = SubModelTables("product", "product_id")
 
-    # ---------------------------------------------------------
-    # TABLE CREATION
-    # ---------------------------------------------------------
-    def create_status_table(self):
-        """
-        Creates the 'product_status' table that references products.id
-        and holds a status (DRAFT, PUBLISHED).
-        """
-        status_sql = """
-        CREATE TABLE IF NOT EXISTS product_status (
-            product_fk VARCHAR(36) PRIMARY KEY,
-            status ENUM('DRAFT','PUBLISHED') NOT NULL,
-            FOREIGN KEY (product_fk) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(status_sql)
-        self.db.connection.commit()
-        print("Created 'product_status' table if not present.")
-
-    def create_tables(self):
-        """
-        Creates the main 'products' table and all product sub-tables.
-        The main table includes:
-          - id: internal primary key (VARCHAR(36))
-          - product_id: external product identifier (VARCHAR(100), UNIQUE)
-
-        Note: We removed (or you can ignore) DEFAULT (UUID()) because
-        we'll generate UUIDs in Python for clarity.
-        """
-        # Main products table
-        main_product_sql = """
-        CREATE TABLE IF NOT EXISTS products (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(100) NOT NULL,
-            title VARCHAR(255),
-            description TEXT,
-            blueprint_id INT,
-            print_provider_id INT,
-            user_id INT,
-            shop_id INT,
-            visible TINYINT(1),
-            is_locked TINYINT(1),
-            reviewed TINYINT(1),
-            created_at DATETIME,
-            updated_at DATETIME,
-            UNIQUE KEY unique_product_id (product_id)
-        );
-        """
-        self.db.cursor.execute(main_product_sql)
-
-        # Sub-tables
-        tags_sql = """
-        CREATE TABLE IF NOT EXISTS product_tags (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            tag VARCHAR(255),
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(tags_sql)
-
-        variants_sql = """
-        CREATE TABLE IF NOT EXISTS product_variants (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            variant_id INT,
-            sku VARCHAR(50),
-            cost INT,
-            price INT,
-            title VARCHAR(255),
-            grams INT,
-            is_enabled TINYINT(1),
-            is_default TINYINT(1),
-            is_available TINYINT(1),
-            is_printify_express_eligible TINYINT(1),
-            quantity INT,
-            options JSON,
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(variants_sql)
-
-        images_sql = """
-        CREATE TABLE IF NOT EXISTS product_images (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            src TEXT,
-            variant_ids JSON,
-            position VARCHAR(50),
-            is_default TINYINT(1),
-            is_selected_for_publishing TINYINT(1),
-            order_index INT NULL,
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(images_sql)
-
-        print_areas_sql = """
-        CREATE TABLE IF NOT EXISTS product_print_areas (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            variant_ids JSON,
-            background VARCHAR(7),
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(print_areas_sql)
-
-        placeholders_sql = """
-        CREATE TABLE IF NOT EXISTS product_placeholders (
-            id VARCHAR(36) PRIMARY KEY,
-            print_area_id VARCHAR(36),
-            position VARCHAR(50),
-            images JSON,
-            FOREIGN KEY (print_area_id) REFERENCES product_print_areas(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(placeholders_sql)
-
-        external_sql = """
-        CREATE TABLE IF NOT EXISTS product_external (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36) UNIQUE,
-            external_id VARCHAR(100),
-            handle TEXT,
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(external_sql)
-
-        scp_sql = """
-        CREATE TABLE IF NOT EXISTS product_sales_channel_properties (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            data JSON,
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(scp_sql)
-
-        views_sql = """
-        CREATE TABLE IF NOT EXISTS product_views (
-            id VARCHAR(36) PRIMARY KEY,
-            product_id VARCHAR(36),
-            view_id INT,
-            label VARCHAR(255),
-            position VARCHAR(50),
-            FOREIGN KEY (product_id) REFERENCES products(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(views_sql)
-
-        view_files_sql = """
-        CREATE TABLE IF NOT EXISTS product_view_files (
-            id VARCHAR(36) PRIMARY KEY,
-            view_id VARCHAR(36),
-            src TEXT,
-            variant_ids JSON,
-            FOREIGN KEY (view_id) REFERENCES product_views(id)
-              ON DELETE CASCADE
-        );
-        """
-        self.db.cursor.execute(view_files_sql)
+    # Listing totals keyed by (search_term, status), shared by the per-request DAO instances
+    _count_cache = CountCache()
 
-        self.db.connection.commit()
-        print("Created all 'products' tables if not present.")
+    def __init__(self, db_conn: DBConnection, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db_conn
+        # Maximum number of rows sent per multi-row INSERT
+        self.batch_size = batch_size
+        # Tables are created by the versioned migrations in migrations/ (see main_migrate_db.py),
+        # so constructing a DAO does not touch the schema.
 
     # ---------------------------------------------------------
     # INSERT / UPDATE
@@ -207,27 +53,30 @@ class ProductDAO:
     def _delete_sub_models(self, internal_id: str):
         """
         Delete sub-rows referencing the internal id from all sub-tables.
+        Does not commit; callers commit as part of their own transaction.
         """
-        tables_to_clear = [
-            "product_tags",
-            "product_variants",
-            "product_images",
-            "product_print_areas",
-            "product_external",
-            "product_sales_channel_properties",
-            "product_views"
-        ]
-        for tbl in tables_to_clear:
-            sql = f"DELETE FROM {tbl} WHERE product_id = %s"
-            self.db.cursor.execute(sql, (internal_id,))
-        self.db.connection.commit()
+        self._SUB_MODELS.delete_all(self.db.cursor, internal_id)
 
-    def insert_or_update_product(self, product_model: PrintifyProductModel):
+    def insert_or_update_product(self, product_model: PrintifyProductModel, incremental: bool = True,
+                                 cache_mockups: bool = True):
         """
-        Insert or update a product from a PrintifyProductModel,
-        then re-insert all sub-model data.
+        Insert or update a product from a PrintifyProductModel, together with
+        all of its sub-model data.
         The product_model.id holds the external product identifier (product_id).
         We generate an internal UUID if it doesn't already exist.
+
+        When the product already exists and `incremental` is True, sub-models are
+        synced by diffing the stored rows against the model on natural keys, so only
+        the rows that actually changed are written. Otherwise the sub-tables are
+        cleared and rebuilt.
+
+        All writes happen in one transaction: new rows are sent as multi-row INSERT
+        batches of at most `self.batch_size` rows, and any failure rolls the whole
+        product back before the error is re-raised.
+
+        The model's images also fill the shared mockup cache. Pass `cache_mockups=False`
+        when they did not come from Printify, e.g. for a model just mapped from a
+        template, which still carries the template's mockups.
         """
         def bool_to_int(b):
             return 1 if b else 0
@@ -244,15 +93,29 @@ class ProductDAO:
             # Generate a new internal UUID for this product
             internal_id = str(uuid.uuid4())
 
-        # 2) Upsert main product row using REPLACE to ensure 'id' is what we want
+        # 2) Upsert main product row. ON DUPLICATE KEY UPDATE (unlike REPLACE) keeps the
+        #    existing row, so it does not cascade-delete the sub-tables and status, and
+        #    MySQL skips the write entirely when nothing changed.
         upsert_sql = """
-        REPLACE INTO products (
+        INSERT INTO products (
             id, product_id, title, description,
             blueprint_id, print_provider_id,
             user_id, shop_id, visible, is_locked,
             reviewed, created_at, updated_at
         )
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            title             = VALUES(title),
+            description       = VALUES(description),
+            blueprint_id      = VALUES(blueprint_id),
+            print_provider_id = VALUES(print_provider_id),
+            user_id           = VALUES(user_id),
+            shop_id           = VALUES(shop_id),
+            visible           = VALUES(visible),
+            is_locked         = VALUES(is_locked),
+            reviewed          = VALUES(reviewed),
+            created_at        = VALUES(created_at),
+            updated_at        = VALUES(updated_at)
         """
         upsert_values = (
             internal_id,
@@ -269,201 +132,37 @@ class ProductDAO:
             product_model.created_at,
             product_model.updated_at
         )
+
+        # 3) Build the sub-model rows up front
+        rows_by_table = self._SUB_MODELS.build_rows(product_model, internal_id)
+
+        # 4) Write everything in a single transaction
         try:
             self.db.cursor.execute(upsert_sql, upsert_values)
+            if existing and incremental:
+                inserted, updated, deleted = self._SUB_MODELS.sync(self.db.cursor, internal_id, rows_by_table, self.batch_size)
+                summary = f"synced sub-models ({inserted} inserted, {updated} updated, {deleted} deleted)"
+            else:
+                if existing:
+                    self._delete_sub_models(internal_id)
+                self._SUB_MODELS.insert_rows(self.db.cursor, rows_by_table, self.batch_size)
+                summary = "rebuilt sub-models"
+            # The mockups are in hand now, so listing pages never have to fetch them
+            mockup_urls = mockup_urls_from_images(product_model.images) if cache_mockups else []
+            if mockup_urls:
+                MockupCacheDAO(self.db).store_mockups(product_model.id, "product", mockup_urls, commit=False)
             self.db.connection.commit()
-            print(f"Upserted product row for external product_id={product_model.id}")
+            self._count_cache.invalidate()
         except Exception as e:
-            print(f"Error upserting product {product_model.id}: {e}")
-            return
+            self.db.connection.rollback()
+            print(f"Error upserting product {product_model.id}, rolled back: {e}")
+            raise
 
         # Save internal_id to the model
         product_model.internal_id = internal_id
-
-        # 3) Remove old sub-model rows
-        self._delete_sub_models(internal_id)
-
-        # 4) Insert tags
-        insert_tag_sql = """
-        REPLACE INTO product_tags (id, product_id, tag)
-        VALUES (%s, %s, %s)
-        """
-        for tmodel in product_model.tags:
-            new_tag_id = str(uuid.uuid4())
-            self.db.cursor.execute(insert_tag_sql, (new_tag_id, internal_id, tmodel.tag))
-
-        # 5) Insert variants
-        insert_variant_sql = """
-        REPLACE INTO product_variants (
-            id, product_id, variant_id, sku, cost, price, title,
-            grams, is_enabled, is_default, is_available,
-            is_printify_express_eligible, quantity, options
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        for vmodel in product_model.variants:
-            vdata = vmodel.data or {}
-            new_variant_id = str(uuid.uuid4())
-            self.db.cursor.execute(
-                insert_variant_sql,
-                (
-                    new_variant_id,
-                    internal_id,
-                    vdata.get("id"),
-                    vdata.get("sku"),
-                    vdata.get("cost"),
-                    vdata.get("price"),
-                    vdata.get("title"),
-                    vdata.get("grams"),
-                    bool_to_int(vdata.get("is_enabled", False)),
-                    bool_to_int(vdata.get("is_default", False)),
-                    bool_to_int(vdata.get("is_available", False)),
-                    bool_to_int(vdata.get("is_printify_express_eligible", False)),
-                    vdata.get("quantity", 1),
-                    json.dumps(vdata.get("options", []))
-                )
-            )
-
-        # 6) Insert images
-        insert_img_sql = """
-        REPLACE INTO product_images (
-            id, product_id, src, variant_ids, position,
-            is_default, is_selected_for_publishing, order_index
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        for imodel in product_model.images:
-            idata = imodel.data or {}
-            new_image_id = str(uuid.uuid4())
-            self.db.cursor.execute(
-                insert_img_sql,
-                (
-                    new_image_id,
-                    internal_id,
-                    idata.get("src"),
-                    json.dumps(idata.get("variant_ids", [])),
-                    idata.get("position"),
-                    bool_to_int(idata.get("is_default", False)),
-                    bool_to_int(idata.get("is_selected_for_publishing", False)),
-                    idata.get("order")
-                )
-            )
-
-        # 7) Insert print areas and placeholders
-        insert_pa_sql = """
-        REPLACE INTO product_print_areas (
-            id, product_id, variant_ids, background
-        ) VALUES (%s, %s, %s, %s)
-        """
-        insert_ph_sql = """
-        REPLACE INTO product_placeholders (
-            id, print_area_id, position, images
-        ) VALUES (%s, %s, %s, %s)
-        """
-        for pa_model in product_model.print_areas:
-            pa_data = pa_model.data or {}
-            new_area_id = str(uuid.uuid4())
-            self.db.cursor.execute(
-                insert_pa_sql,
-                (
-                    new_area_id,
-                    internal_id,
-                    json.dumps(pa_data.get("variant_ids", [])),
-                    pa_data.get("background")
-                )
-            )
-
-            # Now insert placeholders referencing that new_area_id
-            for ph in pa_data.get("placeholders", []):
-                new_ph_id = str(uuid.uuid4())
-                self.db.cursor.execute(
-                    insert_ph_sql,
-                    (
-                        new_ph_id,
-                        new_area_id,
-                        ph.get("position"),
-                        json.dumps(ph.get("images", []))
-                    )
-                )
-
-        # 8) Insert external
-        if product_model.external and isinstance(product_model.external.data, dict):
-            ext_data = product_model.external.data
-            insert_ext_sql = """
-            REPLACE INTO product_external (
-                id, product_id, external_id, handle
-            ) VALUES (%s, %s, %s, %s)
-            """
-            new_ext_id = str(uuid.uuid4())
-            self.db.cursor.execute(
-                insert_ext_sql,
-                (
-                    new_ext_id,
-                    internal_id,
-                    ext_data.get("id"),
-                    ext_data.get("handle")
-                )
-            )
-
-        # 9) Insert sales channel properties
-        insert_scp_sql = """
-        REPLACE INTO product_sales_channel_properties (id, product_id, data)
-        VALUES (%s, %s, %s)
-        """
-        for scp_model in product_model.sales_channel_properties:
-            new_scp_id = str(uuid.uuid4())
-            scp_data = scp_model.data if isinstance(scp_model.data, dict) else {}
-            self.db.cursor.execute(
-                insert_scp_sql,
-                (
-                    new_scp_id,
-                    internal_id,
-                    json.dumps(scp_data)
-                )
-            )
-
-        # 10) Insert views and view files
-        insert_view_sql = """
-        REPLACE INTO product_views (id, product_id, view_id, label, position)
-        VALUES (%s, %s, %s, %s, %s)
-        """
-        insert_view_file_sql = """
-        REPLACE INTO product_view_files (
-            id, view_id, src, variant_ids
-        ) VALUES (%s, %s, %s, %s)
-        """
-        for v_model in product_model.views:
-            vdata = v_model.data or {}
-            new_view_uuid = str(uuid.uuid4())
-            self.db.cursor.execute(
-                insert_view_sql,
-                (
-                    new_view_uuid,
-                    internal_id,
-                    vdata.get("id"),
-                    vdata.get("label"),
-                    vdata.get("position")
-                )
-            )
-
-            # Insert the files for this view
-            for vf in vdata.get("files", []):
-                new_file_id = str(uuid.uuid4())
-                self.db.cursor.execute(
-                    insert_view_file_sql,
-                    (
-                        new_file_id,
-                        new_view_uuid,
-                        vf.get("src"),
-                        json.dumps(vf.get("variant_ids", []))
-                    )
-                )
-
-        # Commit everything
-        self.db.connection.commit()
         print(
             f"Upserted product with internal id={internal_id} "
-            f"and external product_id={product_model.id} + sub-models from model."
+            f"and external product_id={product_model.id}; {summary}."
         )
 
     # ---------------------------------------------------------
@@ -475,7 +174,7 @@ class ProductDAO:
         Here the lookup is performed using the external product identifier
         (the value stored in the 'product_id' column).
         Once found, the internal primary key (from the 'id' column)
-        is used to query the sub-tables.
+        is used to load the sub-tables with a constant number of queries.
         """
         main_q = "SELECT * FROM products WHERE product_id = %s"
         self.db.cursor.execute(main_q, (external_product_id,))
@@ -483,33 +182,52 @@ class ProductDAO:
         if not row:
             return None
 
-        internal_id = row["id"]
-
-        pm = PrintifyProductModel(
-            id=row["product_id"],  # external product id
-            title=row["title"],
-            description=row["description"],
-            blueprint_id=row["blueprint_id"],
-            print_provider_id=row["print_provider_id"],
-            user_id=row["user_id"],
-            shop_id=row["shop_id"],
-            visible=bool(row["visible"]),
-            is_locked=bool(row["is_locked"]),
-            reviewed=bool(row["reviewed"]),
-            created_at=str(row["created_at"]) if row["created_at"] else None,
-            updated_at=str(row["updated_at"]) if row["updated_at"] else None
-        )
-        # Save the internal id in the model for later reference.
-        pm.internal_id = internal_id
+        return self._hydrate_products([row])[0]
+
+    def _fetch_rows_in(self, select_sql: str, column: str, values: list) -> list:
+        """
+        Runs `select_sql WHERE column IN (...)` for the given values and returns all rows.
+        """
+        return fetch_rows_in(self.db.cursor, select_sql, column, values)
+
+    def _hydrate_products(self, rows: list) -> list:
+        """
+        Builds PrintifyProductModels for a list of 'products' rows.
+        Every sub-table is loaded with a single set-based query covering all of
+        the given products, so the number of queries does not grow with the
+        number of products, variants, print areas or views.
+        Models are returned in the same order as `rows`.
+        """
+        models = {}
+        for row in rows:
+            pm = PrintifyProductModel(
+                id=row["product_id"],  # external product id
+                title=row["title"],
+                description=row["description"],
+                blueprint_id=row["blueprint_id"],
+                print_provider_id=row["print_provider_id"],
+                user_id=row["user_id"],
+                shop_id=row["shop_id"],
+                visible=bool(row["visible"]),
+                is_locked=bool(row["is_locked"]),
+                reviewed=bool(row["reviewed"]),
+                created_at=str(row["created_at"]) if row["created_at"] else None,
+                updated_at=str(row["updated_at"]) if row["updated_at"] else None
+            )
+            # Save the internal id in the model for later reference.
+            pm.internal_id = row["id"]
+            models[row["id"]] = pm
+
+        internal_ids = list(models.keys())
 
-        # Fetch tags using the internal id.
-        self.db.cursor.execute("SELECT tag FROM product_tags WHERE product_id = %s", (internal_id,))
-        for trow in self.db.cursor.fetchall():
-            pm.tags.append(PrintifyTagModel(external_product_id, trow["tag"]))
+        # Fetch tags
+        for trow in self._fetch_rows_in("SELECT product_id, tag FROM product_tags", "product_id", internal_ids):
+            pm = models[trow["product_id"]]
+            pm.tags.append(PrintifyTagModel(pm.id, trow["tag"]))
 
         # Fetch variants
-        self.db.cursor.execute("SELECT * FROM product_variants WHERE product_id = %s", (internal_id,))
-        for vrow in self.db.cursor.fetchall():
+        for vrow in self._fetch_rows_in("SELECT * FROM product_variants", "product_id", internal_ids):
+            pm = models[vrow["product_id"]]
             data_dict = {
                 "id": vrow["variant_id"],
                 "sku": vrow["sku"],
@@ -524,11 +242,11 @@ class ProductDAO:
                 "quantity": vrow["quantity"],
                 "options": json.loads(vrow["options"]) if vrow["options"] else []
             }
-            pm.variants.append(PrintifyVariantModel(external_product_id, data_dict))
+            pm.variants.append(PrintifyVariantModel(pm.id, data_dict))
 
         # Fetch images
-        self.db.cursor.execute("SELECT * FROM product_images WHERE product_id = %s", (internal_id,))
-        for irow in self.db.cursor.fetchall():
+        for irow in self._fetch_rows_in("SELECT * FROM product_images", "product_id", internal_ids):
+            pm = models[irow["product_id"]]
             data_dict = {
                 "src": irow["src"],
                 "variant_ids": json.loads(irow["variant_ids"]) if irow["variant_ids"] else [],
@@ -537,67 +255,64 @@ class ProductDAO:
                 "is_selected_for_publishing": bool(irow["is_selected_for_publishing"]),
                 "order": irow["order_index"]
             }
-            pm.images.append(PrintifyImageModel(external_product_id, data_dict))
-
-        # Fetch print areas + placeholders
-        self.db.cursor.execute("SELECT * FROM product_print_areas WHERE product_id = %s", (internal_id,))
-        pa_rows = self.db.cursor.fetchall()
+            pm.images.append(PrintifyImageModel(pm.id, data_dict))
+
+        # Fetch print areas, then all of their placeholders in one go
+        pa_rows = self._fetch_rows_in("SELECT * FROM product_print_areas", "product_id", internal_ids)
+        placeholders_by_area = {}
+        for ph in self._fetch_rows_in(
+            "SELECT * FROM product_placeholders", "print_area_id", [par["id"] for par in pa_rows]
+        ):
+            placeholders_by_area.setdefault(ph["print_area_id"], []).append({
+                "position": ph["position"],
+                "images": json.loads(ph["images"]) if ph["images"] else []
+            })
         for par in pa_rows:
-            pa_id = par["id"]
-            self.db.cursor.execute("SELECT * FROM product_placeholders WHERE print_area_id = %s", (pa_id,))
-            ph_rows = self.db.cursor.fetchall()
-            placeholders_list = []
-            for ph in ph_rows:
-                placeholders_list.append({
-                    "position": ph["position"],
-                    "images": json.loads(ph["images"]) if ph["images"] else []
-                })
+            pm = models[par["product_id"]]
             pa_data = {
                 "variant_ids": json.loads(par["variant_ids"]) if par["variant_ids"] else [],
                 "background": par["background"],
-                "placeholders": placeholders_list
+                "placeholders": placeholders_by_area.get(par["id"], [])
             }
-            pm.print_areas.append(PrintifyPrintAreaModel(external_product_id, pa_data))
+            pm.print_areas.append(PrintifyPrintAreaModel(pm.id, pa_data))
 
         # Fetch external
-        self.db.cursor.execute("SELECT * FROM product_external WHERE product_id = %s", (internal_id,))
-        er = self.db.cursor.fetchone()
-        if er:
-            pm.external = PrintifyExternalModel(external_product_id, {
+        for er in self._fetch_rows_in("SELECT * FROM product_external", "product_id", internal_ids):
+            pm = models[er["product_id"]]
+            pm.external = PrintifyExternalModel(pm.id, {
                 "id": er["external_id"],
                 "handle": er["handle"]
             })
 
         # Fetch sales channel properties
-        self.db.cursor.execute("SELECT data FROM product_sales_channel_properties WHERE product_id = %s", (internal_id,))
-        for scp_row in self.db.cursor.fetchall():
+        for scp_row in self._fetch_rows_in(
+            "SELECT product_id, data FROM product_sales_channel_properties", "product_id", internal_ids
+        ):
+            pm = models[scp_row["product_id"]]
             scp_data = json.loads(scp_row["data"]) if scp_row["data"] else {}
-            pm.sales_channel_properties.append(PrintifySalesChannelPropertyModel(external_product_id, scp_data))
-
-        # Fetch views + view files
-        self.db.cursor.execute("SELECT * FROM product_views WHERE product_id = %s", (internal_id,))
-        view_rows = self.db.cursor.fetchall()
+            pm.sales_channel_properties.append(PrintifySalesChannelPropertyModel(pm.id, scp_data))
+
+        # Fetch views, then all of their files in one go
+        view_rows = self._fetch_rows_in("SELECT * FROM product_views", "product_id", internal_ids)
+        files_by_view = {}
+        for vfr in self._fetch_rows_in(
+            "SELECT * FROM product_view_files", "view_id", [vr["id"] for vr in view_rows]
+        ):
+            files_by_view.setdefault(vfr["view_id"], []).append({
+                "src": vfr["src"],
+                "variant_ids": json.loads(vfr["variant_ids"]) if vfr["variant_ids"] else []
+            })
         for vr in view_rows:
-            view_id = vr["view_id"]
-            label = vr["label"]
-            position = vr["position"]
-            self.db.cursor.execute("SELECT * FROM product_view_files WHERE view_id = %s", (vr["id"],))
-            vf_rows = self.db.cursor.fetchall()
-            files_list = []
-            for vfr in vf_rows:
-                files_list.append({
-                    "src": vfr["src"],
-                    "variant_ids": json.loads(vfr["variant_ids"]) if vfr["variant_ids"] else []
-                })
+            pm = models[vr["product_id"]]
             view_data = {
-                "id": view_id,
-                "label": label,
-                "position": position,
-                "files": files_list
+                "id": vr["view_id"],
+                "label": vr["label"],
+                "position": vr["position"],
+                "files": files_by_view.get(vr["id"], [])
             }
-            pm.views.append(PrintifyViewModel(external_product_id, view_data))
+            pm.views.append(PrintifyViewModel(pm.id, view_data))
 
-        return pm
+        return [models[row["id"]] for row in rows]
 
     def set_status_by_product_id(self, external_product_id: str, new_status: str):
         if new_status not in ("DRAFT", "PUBLISHED"):
@@ -616,6 +331,7 @@ class ProductDAO:
         """
         self.db.cursor.execute(upsert_sql, (local_id, new_status))
         self.db.connection.commit()
+        self._count_cache.invalidate()
         print(f"Set status for product_id={external_product_id} to '{new_status}'.")
 
     def set_status_by_id(self, db_id: int, new_status: str):
@@ -634,6 +350,7 @@ class ProductDAO:
         """
         self.db.cursor.execute(upsert_sql, (db_id, new_status))
         self.db.connection.commit()
+        self._count_cache.invalidate()
         print(f"Set status for id={db_id} to '{new_status}'.")
 
     def fetch_max_draft_product_id(self) -> int | None:
@@ -666,6 +383,34 @@ class ProductDAO:
         self.db.cursor.execute(query)
         return self.db.cursor.fetchall()
 
+    def _build_filters(self, search_term=None, status=None):
+        """
+        Builds the WHERE conditions shared by count_products and fetch_products_paginated,
+        so both paths evaluate the search the same way.
+        Conditions reference the products table as 'p' and product_status as 'ps'.
+        
+        Returns:
+            tuple: (conditions, params, relevance_sql, relevance_params)
+        """
+        conditions = []
+        params = []
+        relevance_sql = None
+        relevance_params = []
+        
+        if status:
+            conditions.append("ps.status = %s")
+            params.append(status)
+        
+        # FULLTEXT search over title and description
+        if search_term:
+            condition, condition_params, relevance_sql, relevance_params = search_clause(
+                ["p.title", "p.description"], search_term
+            )
+            conditions.append(condition)
+            params.extend(condition_params)
+        
+        return conditions, params, relevance_sql, relevance_params
+
     def count_products(self, search_term=None, status=None):
         """
         Count the total number of products with optional filtering.
@@ -682,21 +427,13 @@ class ProductDAO:
         FROM products p
         """
         
-        conditions = []
-        params = []
+        conditions, params, _, _ = self._build_filters(search_term, status)
         
         # Join with status table if status filter is provided
         if status:
             query += """
             JOIN product_status ps ON p.id = ps.product_fk
             """
-            conditions.append("ps.status = %s")
-            params.append(status)
-        
-        # Add search condition if search term is provided
-        if search_term:
-            conditions.append("(p.title LIKE %s OR p.description LIKE %s)")
-            params.extend([f"%{search_term}%", f"%{search_term}%"])
         
         # Add WHERE clause if we have conditions
         if conditions:
@@ -704,50 +441,116 @@ class ProductDAO:
         
         self.db.cursor.execute(query, params)
         result = self.db.cursor.fetchone()
-        return result['count'] if result else 0
+        total = result['count'] if result else 0
+        self._count_cache.set(self._count_key(search_term, status), total)
+        return total
+
+    @staticmethod
+    def _count_key(search_term=None, status=None):
+        return (search_term or "", status or "")
+
+    def _listing_total(self, rows, search_term=None, status=None):
+        """
+        Reads the total from the COUNT(*) OVER() column of a page query and caches it.
+        An empty page carries no window value, so it falls back to count_products.
+        """
+        if rows:
+            total = rows[0]["total_count"]
+            self._count_cache.set(self._count_key(search_term, status), total)
+            return total
+        return self.count_products(search_term=search_term, status=status)
         
     def fetch_products_paginated(self, limit=10, offset=0, search_term=None, status=None, sort_by='updated_at'):
         """
         Fetch products with pagination and optional filtering.
+        The page query joins the status table and derives the first variant's
+        price in SQL, then the whole page is hydrated with one query per sub-table.
         
         Args:
             limit (int): Maximum number of products to fetch
             offset (int): Number of products to skip
             search_term (str, optional): Search term to filter products by title or description
             status (str, optional): Filter by status (DRAFT or PUBLISHED)
-            sort_by (str, optional): Field to sort by ('created_at', 'updated_at', 'title'). Defaults to 'updated_at'.
+            sort_by (str, optional): Field to sort by ('created_at', 'updated_at', 'title', 'relevance').
+                'relevance' ranks FULLTEXT matches and falls back to 'updated_at' without a search term.
+                Defaults to 'updated_at'.
             
         Returns:
             list: List of PrintifyProductModel objects
         """
-        # Base query to get product IDs with pagination
-        query = """
-        SELECT p.product_id
+        rows = self._fetch_listing_rows(limit, offset, search_term, status, sort_by, with_total=False)
+        return self._hydrate_listed_products(rows)
+
+    def fetch_products_with_total(self, limit=10, offset=0, search_term=None, status=None, sort_by='updated_at'):
+        """
+        Fetch one page of products together with the total number of matches, so
+        listing routes need a single query instead of count_products plus a page query.
+
+        The total comes from a COUNT(*) OVER() window on the page query. While a recent
+        total for the same filters is cached the window is left out, letting MySQL stop
+        reading at LIMIT.
+
+        Returns:
+            tuple: (products, total)
+        """
+        total = self._count_cache.get(self._count_key(search_term, status))
+        rows = self._fetch_listing_rows(limit, offset, search_term, status, sort_by, with_total=total is None)
+        if total is None:
+            total = self._listing_total(rows, search_term, status)
+        return self._hydrate_listed_products(rows), total
+
+    def _listing_select(self, summary, total_sql):
+        """
+        SELECT ... FROM part of the listing page queries. Full listings select whole
+        product rows for hydration; summaries select only what a listing card shows,
+        with the first image and the cached mockup folded into the same row (tags are
+        loaded per page by _summaries_from_rows).
+        """
+        if not summary:
+            # Product rows plus status and first-variant price
+            return f"""
+        SELECT p.*,
+               COALESCE(ps.status, 'DRAFT') AS status,
+               {self._FIRST_PRICE_SQL} AS first_price{total_sql}
+        FROM products p
+        LEFT JOIN product_status ps ON p.id = ps.product_fk
+        """
+
+        mockup_columns, mockup_join = mockup_cache_join("p.product_id")
+        return f"""
+        SELECT p.id, p.product_id, p.title,
+               LEFT(p.description, {SUMMARY_DESCRIPTION_CHARS}) AS description,
+               p.created_at, p.updated_at,
+               COALESCE(ps.status, 'DRAFT') AS status,
+               {self._FIRST_PRICE_SQL} AS first_price,
+               {self._FIRST_IMAGE_SQL} AS image_url,
+               {mockup_columns}{total_sql}
         FROM products p
+        LEFT JOIN product_status ps ON p.id = ps.product_fk
+        {mockup_join}
         """
+
+    def _fetch_listing_rows(self, limit, offset, search_term, status, sort_by, with_total, summary=False):
+        """
+        Runs the OFFSET page query behind fetch_products_paginated and returns the raw rows.
+        With `with_total` each row also carries the match count as 'total_count';
+        with `summary` the rows are summary rows (see _listing_select).
+        """
+        total_sql = ", COUNT(*) OVER() AS total_count" if with_total else ""
+
+        query = self._listing_select(summary, total_sql)
         
-        conditions = []
-        params = []
-        
-        # Join with status table if status filter is provided
-        if status:
-            query += """
-            JOIN product_status ps ON p.id = ps.product_fk
-            """
-            conditions.append("ps.status = %s")
-            params.append(status)
-        
-        # Add search condition if search term is provided
-        if search_term:
-            conditions.append("(p.title LIKE %s OR p.description LIKE %s)")
-            params.extend([f"%{search_term}%", f"%{search_term}%"])
+        conditions, params, relevance_sql, relevance_params = self._build_filters(search_term, status)
         
         # Add WHERE clause if we have conditions
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
         
         # Add ORDER BY clause based on sort_by parameter
-        if sort_by == 'title':
+        if sort_by == 'relevance' and relevance_sql:
+            query += f" ORDER BY {relevance_sql} DESC, p.updated_at DESC"
+            params.extend(relevance_params)
+        elif sort_by == 'title':
             query += " ORDER BY p.title ASC"
         elif sort_by == 'created_at':
             query += " ORDER BY p.created_at DESC"
@@ -759,35 +562,136 @@ class ProductDAO:
         params.extend([limit, offset])
         
         self.db.cursor.execute(query, params)
-        product_ids = [row['product_id'] for row in self.db.cursor.fetchall()]
-        
-        # Fetch complete product data for each ID
-        products = []
-        for product_id in product_ids:
-            product = self.fetch_product_from_product_id(product_id)
-            if product:
-                # Try to get the status for this product
-                self.db.cursor.execute("""
-                    SELECT ps.status 
-                    FROM product_status ps 
-                    JOIN products p ON ps.product_fk = p.id 
-                    WHERE p.product_id = %s
-                """, (product_id,))
-                status_row = self.db.cursor.fetchone()
-                if status_row:
-                    product.status = status_row['status']
-                else:
-                    product.status = "DRAFT"  # Default status
-                
-                # Get price from first variant
-                if product.variants and hasattr(product.variants[0], 'data') and 'price' in product.variants[0].data:
-                    product.price = product.variants[0].data['price']
-                else:
-                    product.price = None
-                    
-                products.append(product)
-        
-        return products
+        return self.db.cursor.fetchall()
+
+    def fetch_products_page(self, limit=10, cursor=None, search_term=None, status=None, sort_by='updated_at'):
+        """
+        Fetch one page of products using keyset pagination.
+        Instead of skipping rows with OFFSET, the page starts from a (sort_key, id)
+        position carried in the cursor, so MySQL seeks straight to it on the sort
+        index and every page costs the same as the first one.
+
+        Args:
+            limit (int): Maximum number of products to fetch
+            cursor (str, optional): Opaque token from a previous page's next/prev cursor
+            search_term (str, optional): Search term to filter products by title or description
+            status (str, optional): Filter by status (DRAFT or PUBLISHED)
+            sort_by (str, optional): Field to sort by ('created_at', 'updated_at', 'title').
+                Relevance ranking has no stable seek key; use fetch_products_paginated for it.
+
+        Returns:
+            tuple: (products, total, next_cursor, prev_cursor); a cursor is None when there is no such page
+        """
+        rows, total, next_cursor, prev_cursor = self._fetch_page_rows(limit, cursor, search_term, status, sort_by)
+        return self._hydrate_listed_products(rows), total, next_cursor, prev_cursor
+
+    def _fetch_page_rows(self, limit, cursor, search_term, status, sort_by, summary=False):
+        """
+        Runs the keyset page query behind fetch_products_page.
+        Returns (rows, total, next_cursor, prev_cursor) with the rows in display order.
+        """
+        if sort_by not in KEYSET_SORTS:
+            sort_by = 'updated_at'
+        descending = KEYSET_SORTS[sort_by]
+        sort_column = f"p.{sort_by}"
+
+        position = decode_cursor(cursor, sort_by) if cursor else None
+        direction = position["d"] if position else "next"
+
+        # The first page sees every match, so it can count them with a window in the same
+        # query; later pages reuse that total from the count cache
+        total = self._count_cache.get(self._count_key(search_term, status))
+        with_total = total is None and position is None
+        total_sql = ", COUNT(*) OVER() AS total_count" if with_total else ""
+
+        query = self._listing_select(summary, total_sql)
+
+        conditions, params, _, _ = self._build_filters(search_term, status)
+
+        # Seek past the cursor position instead of counting rows with OFFSET
+        if position:
+            seek_sql, seek_params = seek_clause(sort_column, "p.id", descending, direction, position["k"], position["i"])
+            conditions.append(seek_sql)
+            params.extend(seek_params)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY " + order_clause(sort_column, "p.id", descending, direction)
+
+        # One extra row tells us whether another page exists
+        query += " LIMIT %s"
+        params.append(limit + 1)
+
+        self.db.cursor.execute(query, params)
+        rows = self.db.cursor.fetchall()
+
+        if total is None:
+            total = self._listing_total(rows if with_total else [], search_term, status)
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "prev":
+            rows.reverse()
+
+        next_cursor, prev_cursor = page_cursors(sort_by, rows, sort_by, "id", direction, has_more, position is not None)
+        return rows, total, next_cursor, prev_cursor
+
+    def fetch_product_summaries(self, limit=10, offset=0, search_term=None, status=None, sort_by='updated_at'):
+        """
+        Fetch one page of product summaries together with the total number of matches.
+        Takes the same arguments as fetch_products_with_total, but each product comes
+        from a single row of the page query: no variants, images or other sub-tables
+        are loaded. Use it for listings; detail and edit views need get_product_by_id.
+
+        Returns:
+            tuple: (list of PrintifyProductSummaryModel, total)
+        """
+        total = self._count_cache.get(self._count_key(search_term, status))
+        rows = self._fetch_listing_rows(limit, offset, search_term, status, sort_by, with_total=total is None, summary=True)
+        if total is None:
+            total = self._listing_total(rows, search_term, status)
+        return self._summaries_from_rows(rows), total
+
+    def fetch_product_summaries_page(self, limit=10, cursor=None, search_term=None, status=None, sort_by='updated_at'):
+        """
+        Keyset-paginated variant of fetch_product_summaries, taking the same arguments
+        as fetch_products_page.
+
+        Returns:
+            tuple: (summaries, total, next_cursor, prev_cursor); a cursor is None when there is no such page
+        """
+        rows, total, next_cursor, prev_cursor = self._fetch_page_rows(
+            limit, cursor, search_term, status, sort_by, summary=True
+        )
+        return self._summaries_from_rows(rows), total, next_cursor, prev_cursor
+
+    def _summaries_from_rows(self, rows: list) -> list:
+        """
+        Builds PrintifyProductSummaryModels from summary rows, keeping the mockup
+        cache entries they used from being evicted.
+        """
+        MockupCacheDAO(self.db).touch_mockups(
+            [row["product_id"] for row in rows if row["mockup_url"] and row["mockup_needs_touch"]]
+        )
+        # Tags come from their own query: GROUP_CONCAT would silently cut them at group_concat_max_len
+        tags = fetch_tags_by_owner(self.db.cursor, "product_tags", "product_id", [row["id"] for row in rows])
+        return [
+            PrintifyProductSummaryModel(
+                id=row["product_id"],  # external product id
+                internal_id=row["id"],
+                title=row["title"],
+                description=row["description"],
+                created_at=str(row["created_at"]) if row["created_at"] else None,
+                updated_at=str(row["updated_at"]) if row["updated_at"] else None,
+                status=row["status"],
+                price=row["first_price"],
+                tags=tags[row["id"]],
+                mockup_url=row["mockup_url"],
+                image_url=row["image_url"]
+            )
+            for row in rows
+        ]
 
     def get_product_by_id(self, product_id):
         """
@@ -800,28 +704,31 @@ class ProductDAO:
         Returns:
             PrintifyProductModel: The product if found, None otherwise
         """
-        product = self.fetch_product_from_product_id(product_id)
-        if product:
-            # Try to get the status for this product
-            self.db.cursor.execute("""
-                SELECT ps.status 
-                FROM product_status ps 
-                JOIN products p ON ps.product_fk = p.id 
-                WHERE p.product_id = %s
-            """, (product_id,))
-            status_row = self.db.cursor.fetchone()
-            if status_row:
-                product.status = status_row['status']
-            else:
-                product.status = "DRAFT"  # Default status
-            
-            # Get price from first variant
-            if product.variants and hasattr(product.variants[0], 'data') and 'price' in product.variants[0].data:
-                product.price = product.variants[0].data['price']
-            else:
-                product.price = None
+        query = f"""
+        SELECT p.*,
+               COALESCE(ps.status, 'DRAFT') AS status,
+               {self._FIRST_PRICE_SQL} AS first_price
+        FROM products p
+        LEFT JOIN product_status ps ON p.id = ps.product_fk
+        WHERE p.product_id = %s
+        """
+        self.db.cursor.execute(query, (product_id,))
+        row = self.db.cursor.fetchone()
+        if not row:
+            return None
         
-        return product
+        return self._hydrate_listed_products([row])[0]
+
+    def _hydrate_listed_products(self, rows: list) -> list:
+        """
+        Hydrates rows selected with the status/first_price columns and copies
+        those columns onto the resulting models.
+        """
+        products = self._hydrate_products(rows)
+        for product, row in zip(products, rows):
+            product.status = row["status"]
+            product.price = row["first_price"]
+        return products
 
     def delete_product(self, product_id: str) -> bool:
         """
@@ -852,8 +759,10 @@ class ProductDAO:
             # Delete main product
             delete_q = "DELETE FROM products WHERE id = %s"
             self.db.cursor.execute(delete_q, (internal_id,))
+            MockupCacheDAO(self.db).delete_mockups(product_id, commit=False)
             
             self.db.connection.commit()
+            self._count_cache.invalidate()
             return True
             
         except Exception as e:
@@ -903,6 +812,7 @@ class ProductDAO:
                 self.set_status_by_id(internal_id, product.status)
             
             self.db.connection.commit()
+            self._count_cache.invalidate()
             return True
             
         except Exception as e:
@@ -1,6 +1,16 @@
 import json
-import uuid
 from config.db_connection import DBConnection
+from dao.mockup_cache_dao import MockupCacheDAO, mockup_cache_join, mockup_urls_from_images
+from util.db_util import (
+	DEFAULT_BATCH_SIZE,
+	SUMMARY_DESCRIPTION_CHARS,
+	fetch_tags_by_owner,
+	first_variant_price_sql,
+	SubModelTables,
+	CountCache
+)
+from util.pagination_util import KEYSET_SORTS, decode_cursor, order_clause, page_cursors, seek_clause
+from util.search_util import search_clause
 from models.printify_template_models import (
 	PrintifyTemplateModel,  
 	PrintifyVariantModel,
@@ -10,193 +20,27 @@ from models.printify_template_models import (
 	PrintifyTagModel,
 	PrintifyExternalModel,
 	PrintifySalesChannelPropertyModel,
-	PrintifyViewModel
+	PrintifyViewModel,
+	PrintifyTemplateSummaryModel
 )
 
 class TemplateDAO:
-	def __init__(self, db_conn: DBConnection):
-		self.db = db_conn
-		# Automatically create all tables when this object is instantiated.
-		self._create_all_tables()
+	# Per-template columns of the summary query, as correlated subqueries on the outer 't' alias
+	_FIRST_PRICE_SQL = first_variant_price_sql("template_variants", "template_id", "t.id")
+	_FIRST_IMAGE_SQL = "(SELECT ti.src FROM template_images ti WHERE ti.template_id = t.id ORDER BY ti.is_default DESC, ti.order_index LIMIT 1)"
 
-	def _create_all_tables(self):
-		self.create_tables()
-		self.create_status_table()
+	# Sub-model tables (template_tags, template_variants, ...), written through the shared helper
+	_SUB_MODELS = SubModelTables("template", "template_id")
 
-	# ---------------------------------------------------------
-	# TABLE CREATION
-	# ---------------------------------------------------------
-	def create_status_table(self):
-		"""
-		Creates the 'template_status' table referencing templates.id
-		and holding status (DRAFT, PUBLISHED).
-		"""
-		status_sql = """
-		CREATE TABLE IF NOT EXISTS template_status (
-			template_fk VARCHAR(36) PRIMARY KEY,
-			status ENUM('DRAFT','PUBLISHED','TEMPLATE') NOT NULL,
-			FOREIGN KEY (template_fk) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(status_sql)
-		self.db.connection.commit()
-		print("Created 'template_status' table if not present.")
-
-	def create_tables(self):
-		"""
-		Creates the main 'templates' table and all sub-tables.
-		The main table now includes:
-		  - id: internal primary key (UUID auto-generated by the database)
-		  - template_id: external identifier (VARCHAR(100), UNIQUE)
-		Every table's primary key is a UUID. For sub-tables,
-		if the row is referenced later, we will generate the UUID in the DAO.
-		"""
-		# Main templates table
-		main_template_sql = """
-		CREATE TABLE IF NOT EXISTS templates (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(100) NOT NULL,
-			title VARCHAR(255),
-			description TEXT,
-			blueprint_id INT,
-			user_id INT,
-			shop_id INT,
-			visible TINYINT(1),
-			is_locked TINYINT(1),
-			reviewed TINYINT(1),
-			created_at DATETIME,
-			updated_at DATETIME,
-			print_provider_id INT,
-			UNIQUE KEY unique_template_id (template_id)
-		);
-		"""
-		self.db.cursor.execute(main_template_sql)
-
-		# Sub-tables: For these, we use UUIDs generated by the DB (or explicitly for rows that must be referenced)
-		tags_sql = """
-		CREATE TABLE IF NOT EXISTS template_tags (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			tag VARCHAR(255),
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(tags_sql)
-
-		variants_sql = """
-		CREATE TABLE IF NOT EXISTS template_variants (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			variant_id INT,
-			sku VARCHAR(50),
-			cost INT,
-			price INT,
-			title VARCHAR(255),
-			grams INT,
-			is_enabled TINYINT(1),
-			is_default TINYINT(1),
-			is_available TINYINT(1),
-			is_printify_express_eligible TINYINT(1),
-			quantity INT,
-			options JSON,
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(variants_sql)
-
-		images_sql = """
-		CREATE TABLE IF NOT EXISTS template_images (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			src TEXT,
-			variant_ids JSON,
-			position VARCHAR(50),
-			is_default TINYINT(1),
-			is_selected_for_publishing TINYINT(1),
-			order_index INT NULL,
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(images_sql)
-
-		print_areas_sql = """
-		CREATE TABLE IF NOT EXISTS template_print_areas (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			variant_ids JSON,
-			background VARCHAR(7),
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(print_areas_sql)
-
-		placeholders_sql = """
-		CREATE TABLE IF NOT EXISTS template_placeholders (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			print_area_id VARCHAR(36),
-			position VARCHAR(50),
-			images JSON,
-			FOREIGN KEY (print_area_id) REFERENCES template_print_areas(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(placeholders_sql)
-
-		external_sql = """
-		CREATE TABLE IF NOT EXISTS template_external (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36) UNIQUE,
-			external_id VARCHAR(100),
-			handle TEXT,
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(external_sql)
-
-		scp_sql = """
-		CREATE TABLE IF NOT EXISTS template_sales_channel_properties (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			data JSON,
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(scp_sql)
-
-		views_sql = """
-		CREATE TABLE IF NOT EXISTS template_views (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			template_id VARCHAR(36),
-			view_id INT,
-			label VARCHAR(255),
-			position VARCHAR(50),
-			FOREIGN KEY (template_id) REFERENCES templates(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(views_sql)
-
-		view_files_sql = """
-		CREATE TABLE IF NOT EXISTS template_view_files (
-			id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
-			view_id VARCHAR(36),
-			src TEXT,
-			variant_ids JSON,
-			FOREIGN KEY (view_id) REFERENCES template_views(id)
-			  ON DELETE CASCADE
-		);
-		"""
-		self.db.cursor.execute(view_files_sql)
+	# Listing totals keyed by search term, shared by the per-request DAO instances
+	_count_cache = CountCache()
 
-		self.db.connection.commit()
-		print("Created all 'templates' tables if not present.")
+	def __init__(self, db_conn: DBConnection, batch_size: int = DEFAULT_BATCH_SIZE):
+		self.db = db_conn
+		# Maximum number of rows sent per multi-row INSERT
+		self.batch_size = batch_size
+		# Tables are created by the versioned migrations in migrations/ (see main_migrate_db.py),
+		# so constructing a DAO does not touch the schema.
 
 	# ---------------------------------------------------------
 	# INSERT / UPDATE
@@ -204,34 +48,33 @@ class TemplateDAO:
 	def _delete_sub_models(self, internal_id: str):
 		"""
 		Delete sub-rows referencing the internal id from all sub-tables.
+		Does not commit; callers commit as part of their own transaction.
 		"""
-		tables_to_clear = [
-			"template_tags",
-			"template_variants",
-			"template_images",
-			"template_print_areas",
-			"template_external",
-			"template_sales_channel_properties",
-			"template_views"
-		]
-		for tbl in tables_to_clear:
-			sql = f"DELETE FROM {tbl} WHERE template_id = %s"
-			self.db.cursor.execute(sql, (internal_id,))
-		self.db.connection.commit()
+		self._SUB_MODELS.delete_all(self.db.cursor, internal_id)
 
-	def insert_or_update_template(self, template_model: PrintifyTemplateModel):
+	def insert_or_update_template(self, template_model: PrintifyTemplateModel, incremental: bool = True):
 		"""
 		Insert or update a template using a PrintifyTemplateModel.
 		The model's external identifier is stored in 'template_id' while the
 		internal id is auto-generated by the database.
 		After the upsert, the internal id is retrieved using the external template_id.
-		"""
-		import json
-		import uuid
 
+		When the template already exists and `incremental` is True, sub-models are
+		synced by diffing the stored rows against the model on natural keys, so only
+		the rows that actually changed are written. Otherwise the sub-tables are
+		cleared and rebuilt.
+
+		Everything happens in one transaction. Like insert_or_update_product, any
+		failure rolls the whole template back and the error is re-raised, so callers
+		must handle it instead of assuming the template was saved.
+		"""
 		def bool_to_int(b: bool) -> int:
 			return 1 if b else 0
 
+		# Remember whether this is a re-save before the upsert creates the row
+		self.db.cursor.execute("SELECT id FROM templates WHERE template_id = %s", (template_model.id,))
+		existing = self.db.cursor.fetchone()
+
 		# 1) Upsert main template row.
 		#    Include print_provider_id as well.
 		upsert_query = """
@@ -282,214 +125,43 @@ class TemplateDAO:
 
 		try:
 			self.db.cursor.execute(upsert_query, upsert_values)
+
+			# 2) Retrieve the internal id generated by the database.
+			self.db.cursor.execute("SELECT id FROM templates WHERE template_id = %s", (template_model.id,))
+			row = self.db.cursor.fetchone()
+			if not row:
+				raise ValueError(f"Could not retrieve internal id after upserting template {template_model.id}")
+			internal_id = row["id"]
+
+			# 3) Sync or rebuild the sub-model rows using the internal id.
+			rows_by_table = self._SUB_MODELS.build_rows(template_model, internal_id)
+			if existing and incremental:
+				inserted, updated, deleted = self._SUB_MODELS.sync(self.db.cursor, internal_id, rows_by_table, self.batch_size)
+				summary = f"synced sub-models ({inserted} inserted, {updated} updated, {deleted} deleted)"
+			else:
+				if existing:
+					self._delete_sub_models(internal_id)
+				self._SUB_MODELS.insert_rows(self.db.cursor, rows_by_table, self.batch_size)
+				summary = "rebuilt sub-models"
+
+			# The mockups are in hand now, so listing pages never have to fetch them
+			mockup_urls = mockup_urls_from_images(template_model.images)
+			if mockup_urls:
+				MockupCacheDAO(self.db).store_mockups(template_model.id, "template", mockup_urls, commit=False)
+
 			self.db.connection.commit()
-			print(f"Upserted template row for external template_id={template_model.id}")
+			self._count_cache.invalidate()
 		except Exception as e:
-			print(f"Error upserting template {template_model.id}: {e}")
-			return
+			self.db.connection.rollback()
+			print(f"Error upserting template {template_model.id}, rolled back: {e}")
+			raise
 
-		# 2) Retrieve the internal id generated by the database.
-		self.db.cursor.execute("SELECT id FROM templates WHERE template_id = %s", (template_model.id,))
-		row = self.db.cursor.fetchone()
-		if not row:
-			print("Error: Could not retrieve internal id after upsert.")
-			return
-		internal_id = row["id"]
 		template_model.internal_id = internal_id
-
-		# 3) Remove old sub-model rows using the internal id.
-		self._delete_sub_models(internal_id)
-
-		# 4) Insert tags
-		insert_tag_sql = "INSERT INTO template_tags (template_id, tag) VALUES (%s, %s)"
-		for tmodel in template_model.tags:
-			self.db.cursor.execute(insert_tag_sql, (internal_id, tmodel.tag))
-
-		# 5) Insert variants
-		insert_variant_sql = """
-		INSERT INTO template_variants (
-			template_id, variant_id, sku, cost, price, title,
-			grams, is_enabled, is_default, is_available,
-			is_printify_express_eligible, quantity, options
-		)
-		VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-		"""
-		for vmodel in template_model.variants:
-			vdata = vmodel.data
-			if not isinstance(vdata, dict):
-				continue
-			variant_id = vdata.get("id")
-			sku = vdata.get("sku")
-			cost = vdata.get("cost")
-			price = vdata.get("price")
-			title = vdata.get("title")
-			grams = vdata.get("grams")
-			is_enabled = bool_to_int(vdata.get("is_enabled", False))
-			is_default = bool_to_int(vdata.get("is_default", False))
-			is_available = bool_to_int(vdata.get("is_available", False))
-			is_express = bool_to_int(vdata.get("is_printify_express_eligible", False))
-			quantity = vdata.get("quantity", 1)
-			options_json = json.dumps(vdata.get("options", []))
-
-			self.db.cursor.execute(
-				insert_variant_sql,
-				(
-					internal_id,
-					variant_id,
-					sku,
-					cost,
-					price,
-					title,
-					grams,
-					is_enabled,
-					is_default,
-					is_available,
-					is_express,
-					quantity,
-					options_json
-				)
-			)
-
-		# 6) Insert images
-		insert_img_sql = """
-		INSERT INTO template_images (
-			template_id, src, variant_ids, position,
-			is_default, is_selected_for_publishing, order_index
-		)
-		VALUES (%s, %s, %s, %s, %s, %s, %s)
-		"""
-		for imodel in template_model.images:
-			idata = imodel.data
-			if not isinstance(idata, dict):
-				continue
-			src = idata.get("src")
-			variant_ids = json.dumps(idata.get("variant_ids", []))
-			position = idata.get("position")
-			is_def = bool_to_int(idata.get("is_default", False))
-			is_pub = bool_to_int(idata.get("is_selected_for_publishing", False))
-			order_i = idata.get("order", None)
-
-			self.db.cursor.execute(
-				insert_img_sql,
-				(
-					internal_id,
-					src,
-					variant_ids,
-					position,
-					is_def,
-					is_pub,
-					order_i
-				)
-			)
-
-		# 7) Insert print areas and placeholders.
-		insert_pa_sql = """
-		INSERT INTO template_print_areas (id, template_id, variant_ids, background)
-		VALUES (%s, %s, %s, %s)
-		"""
-		insert_ph_sql = """
-		INSERT INTO template_placeholders (id, print_area_id, position, images)
-		VALUES (%s, %s, %s, %s)
-		"""
-		for pa_model in template_model.print_areas:
-			pa_data = pa_model.data
-			if not isinstance(pa_data, dict):
-				continue
-			variant_ids_json = json.dumps(pa_data.get("variant_ids", []))
-			background = pa_data.get("background")
-			pa_internal_id = str(uuid.uuid4())
-
-			self.db.cursor.execute(insert_pa_sql, (pa_internal_id, internal_id, variant_ids_json, background))
-
-			for ph in pa_data.get("placeholders", []):
-				ph_internal_id = str(uuid.uuid4())
-				images_json = json.dumps(ph.get("images", []))
-				position_val = ph.get("position")
-				self.db.cursor.execute(
-					insert_ph_sql,
-					(ph_internal_id, pa_internal_id, position_val, images_json)
-				)
-
-		# 8) Insert external
-		if template_model.external and isinstance(template_model.external.data, dict):
-			ext_data = template_model.external.data
-			insert_ext_sql = """
-			INSERT INTO template_external (id, template_id, external_id, handle)
-			VALUES (UUID(), %s, %s, %s)
-			ON DUPLICATE KEY UPDATE
-				external_id = VALUES(external_id),
-				handle = VALUES(handle)
-			"""
-			self.db.cursor.execute(
-				insert_ext_sql,
-				(
-					internal_id,
-					ext_data.get("id"),
-					ext_data.get("handle")
-				)
-			)
-
-		# 9) Insert sales channel properties
-		insert_scp_sql = """
-		INSERT INTO template_sales_channel_properties (id, template_id, data)
-		VALUES (UUID(), %s, %s)
-		"""
-		for scp_model in template_model.sales_channel_properties:
-			scp_data = scp_model.data if isinstance(scp_model.data, dict) else {}
-			json_data = json.dumps(scp_data)
-			self.db.cursor.execute(insert_scp_sql, (internal_id, json_data))
-
-		# 10) Insert views and view files
-		insert_view_sql = """
-		INSERT INTO template_views (id, template_id, view_id, label, position)
-		VALUES (UUID(), %s, %s, %s, %s)
-		"""
-		insert_view_file_sql = """
-		INSERT INTO template_view_files (id, view_id, src, variant_ids)
-		VALUES (UUID(), %s, %s, %s)
-		"""
-		for v_model in template_model.views:
-			vdata = v_model.data
-			if not isinstance(vdata, dict):
-				continue
-
-			view_id = vdata.get("id")
-			label = vdata.get("label")
-			position = vdata.get("position")
-
-			# Insert the view row
-			self.db.cursor.execute(
-				insert_view_sql,
-				(internal_id, view_id, label, position)
-			)
-
-			# Retrieve the newly created row ID for the template_views row
-			self.db.cursor.execute(
-				"SELECT id FROM template_views WHERE template_id = %s AND view_id = %s",
-				(internal_id, view_id)
-			)
-			view_row = self.db.cursor.fetchone()
-			if view_row:
-				internal_view_id = view_row["id"]
-				# Insert the files for this view
-				for vf in vdata.get("files", []):
-					variant_ids_json = json.dumps(vf.get("variant_ids", []))
-					src = vf.get("src")
-					self.db.cursor.execute(
-						insert_view_file_sql,
-						(internal_view_id, src, variant_ids_json)
-					)
-
-		self.db.connection.commit()
 		print(
 			f"Upserted template with internal id={internal_id} "
-			f"(external template_id={template_model.id}) and its sub-models."
+			f"(external template_id={template_model.id}); {summary}."
 		)
 
-
-	# ---------------------------------------------------------
-	# FETCH
-	# ---------------------------------------------------------
 	def fetch_template_from_template_id(self, external_template_id: str) -> PrintifyTemplateModel | None:
 		"""
 		Loads from DB, reconstructs a PrintifyTemplateModel.
@@ -663,6 +335,30 @@ class TemplateDAO:
 		result = self.db.cursor.fetchone()
 		return result[0] if result and result[0] else None
 
+	def _build_filters(self, search_term=None):
+		"""
+		Builds the WHERE conditions shared by count_templates and fetch_templates_paginated,
+		so both paths evaluate the search the same way.
+		Conditions reference the templates table as 't'.
+		
+		Returns:
+			tuple: (conditions, params, relevance_sql, relevance_params)
+		"""
+		conditions = []
+		params = []
+		relevance_sql = None
+		relevance_params = []
+		
+		# FULLTEXT search over title and description
+		if search_term:
+			condition, condition_params, relevance_sql, relevance_params = search_clause(
+				["t.title", "t.description"], search_term
+			)
+			conditions.append(condition)
+			params.extend(condition_params)
+		
+		return conditions, params, relevance_sql, relevance_params
+
 	def count_templates(self, search_term=None):
 		"""
 		Count the total number of templates in the database with optional search.
@@ -673,28 +369,39 @@ class TemplateDAO:
 		Returns:
 			int: Total count of templates matching the criteria.
 		"""
-		sql = "SELECT COUNT(*) as count FROM templates"
+		sql = "SELECT COUNT(*) as count FROM templates t"
 		
-		params = []
-		if search_term:
-			sql += " WHERE title LIKE %s OR description LIKE %s"
-			search_pattern = f"%{search_term}%"
-			params = [search_pattern, search_pattern]
+		conditions, params, _, _ = self._build_filters(search_term)
+		if conditions:
+			sql += " WHERE " + " AND ".join(conditions)
 		
 		self.db.cursor.execute(sql, params)
 		result = self.db.cursor.fetchone()
 		
 		# Handle different cursor result formats (tuple or dictionary)
+		total = 0
 		if result:
 			if isinstance(result, dict):
-				return result.get('count', 0)
+				total = result.get('count', 0)
 			elif hasattr(result, 'count'):  # Named tuple
-				return result.count
+				total = result.count
 			else:  # Regular tuple
-				return result[0]
-		return 0
+				total = result[0]
+		self._count_cache.set(search_term or "", total)
+		return total
+
+	def _listing_total(self, rows, search_term=None):
+		"""
+		Reads the total from the COUNT(*) OVER() column of a page query and caches it.
+		An empty page carries no window value, so it falls back to count_templates.
+		"""
+		if rows:
+			total = rows[0]['total_count']
+			self._count_cache.set(search_term or "", total)
+			return total
+		return self.count_templates(search_term=search_term)
 
-	def fetch_templates_paginated(self, limit, offset, search_term=None):
+	def fetch_templates_paginated(self, limit, offset, search_term=None, sort_by='updated_at'):
 		"""
 		Fetch templates with pagination and optional search.
 		
@@ -702,25 +409,92 @@ class TemplateDAO:
 			limit (int): Maximum number of templates to return.
 			offset (int): Offset for pagination.
 			search_term (str, optional): Search term to filter templates. Defaults to None.
+			sort_by (str, optional): Field to sort by ('created_at', 'updated_at', 'title', 'relevance').
+				'relevance' ranks FULLTEXT matches and falls back to 'updated_at' without a search term.
+				Defaults to 'updated_at'.
 			
 		Returns:
 			list: List of PrintifyTemplateModel objects.
 		"""
-		# Base query to get template IDs
-		sql = "SELECT template_id FROM templates"
+		rows = self._fetch_listing_rows(limit, offset, search_term, sort_by, with_total=False)
+		return self._load_templates(rows)
+
+	def fetch_templates_with_total(self, limit, offset, search_term=None, sort_by='updated_at'):
+		"""
+		Fetch one page of templates together with the total number of matches, so
+		listing routes need a single query instead of count_templates plus a page query.
 		
-		params = []
-		if search_term:
-			sql += " WHERE title LIKE %s OR description LIKE %s"
-			search_pattern = f"%{search_term}%"
-			params = [search_pattern, search_pattern]
+		The total comes from a COUNT(*) OVER() window on the page query. While a recent
+		total for the same search is cached the window is left out, letting MySQL stop
+		reading at LIMIT.
 		
-		sql += " ORDER BY updated_at DESC LIMIT %s OFFSET %s"
+		Returns:
+			tuple: (templates, total)
+		"""
+		total = self._count_cache.get(search_term or "")
+		rows = self._fetch_listing_rows(limit, offset, search_term, sort_by, with_total=total is None)
+		if total is None:
+			total = self._listing_total(rows, search_term)
+		return self._load_templates(rows), total
+
+	def _summary_select(self, total_sql):
+		"""
+		SELECT ... FROM part of the summary page queries: only what a listing card shows,
+		with status, first price, the first image and the cached mockup folded into
+		each template's row (tags are loaded per page by _summaries_from_rows).
+		"""
+		mockup_columns, mockup_join = mockup_cache_join("t.template_id")
+		return f"""
+		SELECT t.id, t.template_id, t.title,
+			   LEFT(t.description, {SUMMARY_DESCRIPTION_CHARS}) AS description,
+			   t.created_at, t.updated_at,
+			   COALESCE(ts.status, 'DRAFT') AS status,
+			   {self._FIRST_PRICE_SQL} AS first_price,
+			   {self._FIRST_IMAGE_SQL} AS image_url,
+			   {mockup_columns}{total_sql}
+		FROM templates t
+		LEFT JOIN template_status ts ON t.id = ts.template_fk
+		{mockup_join}
+		"""
+
+	def _fetch_listing_rows(self, limit, offset, search_term, sort_by, with_total, summary=False):
+		"""
+		Runs the OFFSET page query behind fetch_templates_paginated and returns the raw rows.
+		With `with_total` each row also carries the match count as 'total_count';
+		with `summary` the rows are summary rows (see _summary_select).
+		"""
+		total_sql = ", COUNT(*) OVER() AS total_count" if with_total else ""
+		
+		if summary:
+			sql = self._summary_select(total_sql)
+		else:
+			# Base query to get template IDs
+			sql = f"SELECT t.template_id{total_sql} FROM templates t"
+		
+		conditions, params, relevance_sql, relevance_params = self._build_filters(search_term)
+		if conditions:
+			sql += " WHERE " + " AND ".join(conditions)
+		
+		if sort_by == 'relevance' and relevance_sql:
+			sql += f" ORDER BY {relevance_sql} DESC, t.updated_at DESC"
+			params.extend(relevance_params)
+		elif sort_by == 'title':
+			sql += " ORDER BY t.title ASC"
+		elif sort_by == 'created_at':
+			sql += " ORDER BY t.created_at DESC"
+		else:  # Default to updated_at
+			sql += " ORDER BY t.updated_at DESC"
+		
+		sql += " LIMIT %s OFFSET %s"
 		params.extend([limit, offset])
 		
 		self.db.cursor.execute(sql, params)
-		results = self.db.cursor.fetchall()
-		
+		return self.db.cursor.fetchall()
+
+	def _load_templates(self, results):
+		"""
+		Loads the full template model for each page row, skipping rows that fail to load.
+		"""
 		templates = []
 		for result in results:
 			# Handle different cursor result formats (tuple, dictionary, or named tuple)
@@ -743,6 +517,134 @@ class TemplateDAO:
 		
 		return templates
 
+	def fetch_templates_page(self, limit, cursor=None, search_term=None, sort_by='updated_at'):
+		"""
+		Fetch one page of templates using keyset pagination.
+		The page starts from the (sort_key, id) position carried in the cursor rather
+		than an OFFSET, so deep pages cost the same as the first one.
+		
+		Args:
+			limit (int): Maximum number of templates to return.
+			cursor (str, optional): Opaque token from a previous page's next/prev cursor.
+			search_term (str, optional): Search term to filter templates. Defaults to None.
+			sort_by (str, optional): Field to sort by ('created_at', 'updated_at', 'title').
+				Relevance ranking has no stable seek key; use fetch_templates_paginated for it.
+			
+		Returns:
+			tuple: (templates, total, next_cursor, prev_cursor); a cursor is None when there is no such page.
+		"""
+		rows, total, next_cursor, prev_cursor = self._fetch_page_rows(limit, cursor, search_term, sort_by)
+		return self._load_templates(rows), total, next_cursor, prev_cursor
+
+	def _fetch_page_rows(self, limit, cursor, search_term, sort_by, summary=False):
+		"""
+		Runs the keyset page query behind fetch_templates_page.
+		Returns (rows, total, next_cursor, prev_cursor) with the rows in display order.
+		"""
+		if sort_by not in KEYSET_SORTS:
+			sort_by = 'updated_at'
+		descending = KEYSET_SORTS[sort_by]
+		sort_column = f"t.{sort_by}"
+		
+		position = decode_cursor(cursor, sort_by) if cursor else None
+		direction = position["d"] if position else "next"
+		
+		# The first page sees every match, so it can count them with a window in the same
+		# query; later pages reuse that total from the count cache
+		total = self._count_cache.get(search_term or "")
+		with_total = total is None and position is None
+		total_sql = ", COUNT(*) OVER() AS total_count" if with_total else ""
+		
+		if summary:
+			sql = self._summary_select(total_sql)
+		else:
+			sql = f"SELECT t.id, t.template_id, {sort_column}{total_sql} FROM templates t"
+		
+		conditions, params, _, _ = self._build_filters(search_term)
+		
+		# Seek past the cursor position instead of counting rows with OFFSET
+		if position:
+			seek_sql, seek_params = seek_clause(sort_column, "t.id", descending, direction, position["k"], position["i"])
+			conditions.append(seek_sql)
+			params.extend(seek_params)
+		
+		if conditions:
+			sql += " WHERE " + " AND ".join(conditions)
+		
+		sql += " ORDER BY " + order_clause(sort_column, "t.id", descending, direction)
+		
+		# One extra row tells us whether another page exists
+		sql += " LIMIT %s"
+		params.append(limit + 1)
+		
+		self.db.cursor.execute(sql, params)
+		rows = self.db.cursor.fetchall()
+		
+		if total is None:
+			total = self._listing_total(rows if with_total else [], search_term)
+		
+		has_more = len(rows) > limit
+		rows = rows[:limit]
+		if direction == "prev":
+			rows.reverse()
+		
+		next_cursor, prev_cursor = page_cursors(sort_by, rows, sort_by, "id", direction, has_more, position is not None)
+		return rows, total, next_cursor, prev_cursor
+
+	def fetch_template_summaries(self, limit, offset=0, search_term=None, sort_by='updated_at'):
+		"""
+		Fetch one page of template summaries together with the total number of matches.
+		Takes the same arguments as fetch_templates_with_total, but each template comes
+		from a single row of the page query instead of a full model load per template.
+		Use it for listings; detail and edit views need fetch_template_from_template_id.
+		
+		Returns:
+			tuple: (list of PrintifyTemplateSummaryModel, total)
+		"""
+		total = self._count_cache.get(search_term or "")
+		rows = self._fetch_listing_rows(limit, offset, search_term, sort_by, with_total=total is None, summary=True)
+		if total is None:
+			total = self._listing_total(rows, search_term)
+		return self._summaries_from_rows(rows), total
+
+	def fetch_template_summaries_page(self, limit, cursor=None, search_term=None, sort_by='updated_at'):
+		"""
+		Keyset-paginated variant of fetch_template_summaries, taking the same arguments
+		as fetch_templates_page.
+		
+		Returns:
+			tuple: (summaries, total, next_cursor, prev_cursor); a cursor is None when there is no such page.
+		"""
+		rows, total, next_cursor, prev_cursor = self._fetch_page_rows(limit, cursor, search_term, sort_by, summary=True)
+		return self._summaries_from_rows(rows), total, next_cursor, prev_cursor
+
+	def _summaries_from_rows(self, rows: list) -> list:
+		"""
+		Builds PrintifyTemplateSummaryModels from summary rows, keeping the mockup
+		cache entries they used from being evicted.
+		"""
+		MockupCacheDAO(self.db).touch_mockups(
+			[row["template_id"] for row in rows if row["mockup_url"] and row["mockup_needs_touch"]]
+		)
+		# Tags come from their own query: GROUP_CONCAT would silently cut them at group_concat_max_len
+		tags = fetch_tags_by_owner(self.db.cursor, "template_tags", "template_id", [row["id"] for row in rows])
+		return [
+			PrintifyTemplateSummaryModel(
+				id=row["template_id"],  # external template id
+				internal_id=row["id"],
+				title=row["title"],
+				description=row["description"],
+				created_at=str(row["created_at"]) if row["created_at"] else None,
+				updated_at=str(row["updated_at"]) if row["updated_at"] else None,
+				status=row["status"],
+				price=row["first_price"],
+				tags=tags[row["id"]],
+				mockup_url=row["mockup_url"],
+				image_url=row["image_url"]
+			)
+			for row in rows
+		]
+
 	def close(self):
 		"""
 		Close the database connection.
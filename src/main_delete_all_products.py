@@ -1,36 +1,46 @@
-from services.printify_service import PrintifyService
+from clients.async_printify_client import AsyncPrintifyClient
 from config.db_connection import DBConnection
 from dao.product_dao import ProductDAO
+import asyncio
 import os
-from concurrent.futures import ThreadPoolExecutor
 
 # Configure shop ID - using the same ID from the other file
 shop_id = "20510104"
 
-def delete_product(product_id, printify_id, printify_service, product_dao):
+# Printify deletes in flight at once (the rate limiter still caps the request rate)
+PRINTIFY_CONCURRENCY = int(os.getenv("PRINTIFY_ASYNC_CONCURRENCY", "10"))
+
+async def delete_from_printify(printify_ids):
     """
-    Delete a product from both Printify and the local database
+    Delete products from Printify concurrently.
+    
+    Args:
+        printify_ids: IDs of the products in Printify
+    """
+    async with AsyncPrintifyClient(concurrency=PRINTIFY_CONCURRENCY) as client:
+        async def delete_one(printify_id):
+            try:
+                success = await client.delete_product(shop_id, printify_id)
+                if success:
+                    print(f"Successfully deleted product from Printify: {printify_id}")
+                else:
+                    print(f"Failed to delete product from Printify: {printify_id}")
+            except Exception as e:
+                print(f"Error deleting product from Printify: {e}")
+        
+        await asyncio.gather(*(delete_one(printify_id) for printify_id in printify_ids))
+
+def delete_product(product_id, product_dao):
+    """
+    Delete a product from the local database
     
     Args:
         product_id: The internal database ID of the product
-        printify_id: The ID of the product in Printify
-        printify_service: PrintifyService instance
         product_dao: ProductDAO instance
     """
-    print(f"Deleting product: {product_id} (Printify ID: {printify_id})")
-    
-    # First delete from Printify if there's a valid ID
-    if printify_id:
-        try:
-            success = printify_service.delete_product(printify_id)
-            if success:
-                print(f"Successfully deleted product from Printify: {printify_id}")
-            else:
-                print(f"Failed to delete product from Printify: {printify_id}")
-        except Exception as e:
-            print(f"Error deleting product from Printify: {e}")
+    print(f"Deleting product from database: {product_id}")
     
-    # Then delete from database regardless of Printify success
+    # Delete from database regardless of Printify success
     # (to ensure we clean up the DB even if Printify deletion fails)
     try:
         success = product_dao.delete_product(product_id)
@@ -44,9 +54,6 @@ def delete_product(product_id, printify_id, printify_service, product_dao):
 def main():
     db_conn = None
     try:
-        # Initialize services
-        printify_service = PrintifyService(name="PrintifyService", shop_id=shop_id)
-        
         # Set up database connection
         db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
         db_conn.connect()
@@ -67,16 +74,22 @@ def main():
             print("Operation cancelled.")
             return
         
-        # Process deletions one at a time to avoid memory issues
+        # Skip rows without an internal ID
+        valid_products = []
         for product in products:
-            product_id = product.get('id')  # Internal database ID
-            printify_id = product.get('printify_id')  # External Printify ID
-            
-            if not product_id:
+            if not product.get('id'):
                 print(f"Warning: Skipping product with no internal ID: {product}")
                 continue
-                
-            delete_product(product_id, printify_id, printify_service, product_dao)
+            valid_products.append(product)
+        
+        # Printify deletes are independent network calls, so fan them out concurrently
+        printify_ids = [product['printify_id'] for product in valid_products if product.get('printify_id')]
+        print(f"Deleting {len(printify_ids)} products from Printify...")
+        asyncio.run(delete_from_printify(printify_ids))
+        
+        # Then clean up the database over the single connection
+        for product in valid_products:
+            delete_product(product['id'], product_dao)
         
         print("All products have been processed.")
         
@@ -4,112 +4,254 @@ from clients.open_ai_client import OpenAIClient
 from services.product_generator_service import ProductGeneratorService
 from config.db_connection import DBConnection
 from models.printify_template_models import PrintifyTemplateModel
+from models.printify_product_models import PrintifyProductModel
 from dao.template_dao import TemplateDAO
 from dao.product_dao import ProductDAO
+from dao.generation_job_dao import GenerationJobDAO
 from mappers.template_product_mapper import TemplateProductMapper
-from util.text_generator_util import TextGenerator
+from util.text_generator_util import TextGenerator, CONTENT_MODES, DEFAULT_CONTENT_MODE
+from util.pipeline import Pipeline, Stage
+from util.upload_cache import file_sha256
+import argparse
 import os
-from concurrent.futures import ThreadPoolExecutor
+import time
 
 
 product_id = '67cfca8600271d354f0a1f70'  # Replace with the product ID to duplicate
 shop_id = "20510104"
 image_folder = "/Users/alex/git/print/working_images_vertical" 
 
-def process_image(image_name, image_folder, text_generator, printify_service, template, product_dao):
-	try:
-		image_path = os.path.join(image_folder, image_name)
-		
-		# Check if the file is an image
-		if not (os.path.isfile(image_path) and image_name.lower().endswith(('.png', '.jpg', '.jpeg'))):
-			return
-			
-		print(f"\nProcessing image: {image_name}")
+# Threads per pipeline stage; --workers overrides it
+DEFAULT_WORKERS = int(os.getenv("GENERATION_WORKERS", "4"))
+# Each persist worker holds a pooled DB connection for the whole run
+MAX_PERSIST_WORKERS = 4
+# Tries at journaling a newly created product before the job fails
+CREATED_JOURNAL_ATTEMPTS = 3
+
+def journal_error(job, journal, message):
+	"""Prints a stage failure and, when journaling, keeps it on the job's journal row."""
+	print(message)
+	if journal and job.get('sha256'):
+		journal.record_error(product_id, shop_id, job['sha256'], message)
+
+def upload_stage(job, printify_service, journal=None):
+	"""Uploads the job's image to Printify and records the upload response."""
+	print(f"\nProcessing image: {job['image_name']}")
+	
+	# Resume from the journal: skip finished images and reuse a previous upload
+	if journal:
+		job['sha256'] = file_sha256(job['image_path'])
+		job['journal'] = journal.fetch_job(product_id, shop_id, job['sha256'])
+		if GenerationJobDAO.reached(job['journal'], "saved"):
+			print(f"Skipping {job['image_name']}: already saved as product {job['journal']['printify_product_id']}")
+			return None
+		if GenerationJobDAO.reached(job['journal'], "uploaded"):
+			job['image_id'] = job['journal']['image_upload']
+			print(f"Resuming {job['image_name']} at stage '{job['journal']['stage']}'")
+			return job
+	
+	# Upload the new image to Printify
+	print(f"Uploading {job['image_name']} to Printify...")
+	new_image_id = printify_service.upload_image(job['image_path'])
+	if not new_image_id:
+		journal_error(job, journal, f"Failed to upload image to Printify: {job['image_name']}")
+		return None
+	print(f"Image uploaded successfully, got image ID: {new_image_id}")
+	
+	job['image_id'] = new_image_id
+	if journal:
+		journal.record_stage(
+			product_id, shop_id, job['sha256'], "uploaded",
+			image_name=job['image_name'], image_upload=new_image_id
+		)
+	return job
+
+def text_stage(job, text_generator, journal=None):
+	"""Generates the description, title and bullet points for the job."""
+	# Text generated by an earlier run is reused rather than paid for again
+	if GenerationJobDAO.reached(job.get('journal'), "text_generated"):
+		job['description'] = job['journal']['description']
+		job['title'] = job['journal']['title']
+		job['bullet_points'] = job['journal']['bullet_points']
+		return job
+	
+	print(f"\nGenerating product content for {job['image_name']}...")
+	# Description, title and bullet points come from one request (or two in parallel mode)
+	content = text_generator.generate_product_content(
+		"trippy mandlebrot set inspired design with crazy trippy patterns", "Amazon", "iphone 16 case",
+		listing_product_type="phone case"
+	)
+	new_description = content['description']
+	new_title = content['title']
+	bullet_points = content['bullet_points']
+	
+	print(f"Generated Title: {new_title}")
+	print(f"Generated Description: {new_description}")
+	for i, bullet_point in enumerate(bullet_points, 1):
+		print(f"Bullet point {i}: {bullet_point}")
+	
+	job['description'] = new_description
+	job['title'] = new_title
+	job['bullet_points'] = bullet_points
+	if journal:
+		journal.record_stage(
+			product_id, shop_id, job['sha256'], "text_generated",
+			title=new_title, description=new_description, bullet_points=bullet_points
+		)
+	return job
+
+def map_stage(job, template):
+	"""Maps the template to a new product carrying the job's image and text."""
+	# A product created by an earlier run is loaded from Printify in create_stage; mapping
+	# again would generate new SKUs that do not match the ones Printify already has
+	if GenerationJobDAO.reached(job.get('journal'), "created"):
+		return job
+	
+	print(f"\nCreating product from template for {job['image_name']}...")
+	# Map template to new product and replace with custom data
+	new_product = TemplateProductMapper.map_template_to_product(template)
+	if not new_product:
+		print("Failed to map template to product")
+		return None
 		
-		# Upload the new image to Printify
-		print("Uploading image to Printify...")
-		new_image_id = printify_service.upload_image(image_path)
-		if not new_image_id:
-			print("Failed to upload image to Printify")
+	new_product = TemplateProductMapper.replace_product_title(new_product, job['title'])
+	new_product = TemplateProductMapper.replace_product_description(new_product, job['description'])
+	new_product = TemplateProductMapper.replace_all_sku(new_product)
+	new_product = TemplateProductMapper.replace_all_image_ids(new_product, job['image_id'])
+	new_product = TemplateProductMapper.replace_product_bullet_points(new_product, job['bullet_points'])
+	
+	# Verify product data before creating on Printify
+	print(f"\nVerifying product data before Printify creation ({job['image_name']}):")
+	print(f"Title: {new_product.title}")
+	print(f"Description length: {len(new_product.description or '')}")
+	print(f"Number of variants: {len(new_product.variants)}")
+	print(f"Number of images: {len(new_product.images)}")
+	
+	job['product'] = new_product
+	return job
+
+def create_stage(job, printify_service, journal=None):
+	"""Creates the mapped product on Printify."""
+	# Never create the same product twice: reload the product an earlier run created, so the
+	# SKUs and image ids saved to the database are the ones Printify has
+	if GenerationJobDAO.reached(job.get('journal'), "created"):
+		existing_id = job['journal']['printify_product_id']
+		details = printify_service.get_product_details(existing_id)
+		if not details:
+			journal_error(job, journal, f"Failed to load existing Printify product {existing_id} for {job['image_name']}")
+			return None
+		job['product'] = PrintifyProductModel.from_dict(details)
+		job['from_printify'] = True
+		print(f"Product for {job['image_name']} already exists on Printify: {existing_id}")
+		return job
+	
+	new_product = job['product']
+	print(f"\nCreating product on Printify for {job['image_name']}...")
+	new_id = printify_service.duplicate_product_from_model(new_product)
+	if not new_id:
+		journal_error(job, journal, f"Failed to create product on Printify: {job['image_name']}")
+		return None
+	print(f"Successfully created product on Printify with ID: {new_id}")
+	
+	# Update the product with the new Printify ID
+	new_product.id = new_id  # Set the external product ID (Printify ID)
+	
+	# Record the id straight away; the window between create and this write is the only
+	# point where a crash could still lead to a duplicate on the next run
+	if journal:
+		record_created(job, journal, new_id)
+	return job
+
+def record_created(job, journal, new_id):
+	"""
+	Journals a freshly created Printify product, retrying a failed write a few times.
+	If it still fails the job stops with an error naming the product, since the next run
+	would otherwise create it again.
+	"""
+	for attempt in range(1, CREATED_JOURNAL_ATTEMPTS + 1):
+		try:
+			journal.record_stage(product_id, shop_id, job['sha256'], "created", printify_product_id=new_id)
 			return
-		print(f"Image uploaded successfully, got image ID: {new_image_id}")
+		except Exception as e:
+			print(f"Attempt {attempt} of {CREATED_JOURNAL_ATTEMPTS} to journal product {new_id} failed: {e}")
+			if attempt < CREATED_JOURNAL_ATTEMPTS:
+				time.sleep(attempt)
+	raise RuntimeError(
+		f"Created Printify product {new_id} for {job['image_name']} but could not journal it; "
+		f"a rerun will create it again unless it is deleted or recorded in generation_jobs by hand"
+	)
+
+def persist_stage(job, product_dao, printify_service, journal=None):
+	"""Saves the created product to the database as a DRAFT."""
+	new_product = job['product']
+	new_id = new_product.id
+	
+	# The mapped model still carries the template's images; save Printify's copy of the
+	# product instead, so its own mockups reach product_images and the mockup cache
+	from_printify = job.get('from_printify', False)
+	if new_id and not from_printify:
+		details = printify_service.get_product_details(new_id)
+		if details:
+			new_product = job['product'] = PrintifyProductModel.from_dict(details)
+			from_printify = True
+		else:
+			print(f"Warning: could not load product {new_id} from Printify; saving it without images")
+			new_product.images = []
+	
+	print(f"\nSaving product {new_id} to database...")
+	# Verify product has required fields before saving
+	if not new_product.id:
+		print("Error: Product ID is missing")
+		return None
 		
-		print("\nGenerating product content...")
-		new_description = text_generator.generate_product_description("trippy mandlebrot set inspired design with crazy trippy patterns", "Amazon", "iphone 16 case")
-		new_title = text_generator.generate_product_title(new_description, "Amazon", "phone case")
+	try:
+		print("Product data being saved:")
+		print(f"Product ID: {new_product.id}")
+		print(f"Title: {new_product.title}")
+		print(f"Description: {(new_product.description or '')[:100]}...")  # First 100 chars
+		print(f"Blueprint ID: {new_product.blueprint_id}")
+		print(f"Print Provider ID: {new_product.print_provider_id}")
 		
-		print(f"Generated Title: {new_title}")
-		print(f"Generated Description: {new_description}")
+		product_dao.insert_or_update_product(new_product, cache_mockups=from_printify)
+		print(f"Successfully saved product {new_id} to database")
 		
-		# Generate bullet points for the product
-		print("\nGenerating bullet points...")
-		bullet_points = text_generator.generate_product_bullets(new_description, "Amazon", "phone case")
-		for i, bullet_point in enumerate(bullet_points, 1):
-			print(f"Bullet point {i}: {bullet_point}")
+		# Verify the product was saved
+		saved_product = product_dao.fetch_product_from_product_id(new_id)
+		if saved_product:
+			print("Successfully verified product in database")
+		else:
+			print("Warning: Product was not found in database after saving")
 		
-		print("\nCreating product from template...")
-		# Map template to new product and replace with custom data
-		new_product = TemplateProductMapper.map_template_to_product(template)
-		if not new_product:
-			print("Failed to map template to product")
-			return
-			
-		new_product = TemplateProductMapper.replace_product_title(new_product, new_title)
-		new_product = TemplateProductMapper.replace_product_description(new_product, new_description)
-		new_product = TemplateProductMapper.replace_all_sku(new_product)
-		new_product = TemplateProductMapper.replace_all_image_ids(new_product, new_image_id)
-		new_product = TemplateProductMapper.replace_product_bullet_points(new_product, bullet_points)
+		# Set initial status as DRAFT
+		product_dao.set_status_by_product_id(new_id, "DRAFT")
+		print(f"Set product {new_id} status to DRAFT")
 		
-		# Verify product data before creating on Printify
-		print("\nVerifying product data before Printify creation:")
-		print(f"Title: {new_product.title}")
-		print(f"Description length: {len(new_product.description or '')}")
-		print(f"Number of variants: {len(new_product.variants)}")
-		print(f"Number of images: {len(new_product.images)}")
+	except Exception as e:
+		journal_error(job, journal, f"Error saving product to database: {e}")
+		import traceback
+		print("Full error:")
+		print(traceback.format_exc())
+		return None
+	
+	if journal:
+		journal.record_stage(product_id, shop_id, job['sha256'], "saved")
+	return job
+
+def process_image(image_name, image_folder, text_generator, printify_service, template, product_dao, journal=None):
+	"""Runs every stage for a single image, one after another."""
+	try:
+		image_path = os.path.join(image_folder, image_name)
 		
-		print("\nCreating product on Printify...")
-		new_id = printify_service.duplicate_product_from_model(new_product)
-		if not new_id:
-			print("Failed to create product on Printify")
+		# Check if the file is an image
+		if not (os.path.isfile(image_path) and image_name.lower().endswith(('.png', '.jpg', '.jpeg'))):
 			return
-		print(f"Successfully created product on Printify with ID: {new_id}")
-		
-		# Update the product with the new Printify ID
-		new_product.id = new_id  # Set the external product ID (Printify ID)
 		
-		print("\nSaving product to database...")
-		# Verify product has required fields before saving
-		if not new_product.id:
-			print("Error: Product ID is missing")
-			return
-			
-		try:
-			print("Product data being saved:")
-			print(f"Product ID: {new_product.id}")
-			print(f"Title: {new_product.title}")
-			print(f"Description: {new_product.description[:100]}...")  # First 100 chars
-			print(f"Blueprint ID: {new_product.blueprint_id}")
-			print(f"Print Provider ID: {new_product.print_provider_id}")
-			
-			product_dao.insert_or_update_product(new_product)
-			print(f"Successfully saved product {new_id} to database")
-			
-			# Verify the product was saved
-			saved_product = product_dao.fetch_product_from_product_id(new_id)
-			if saved_product:
-				print("Successfully verified product in database")
-			else:
-				print("Warning: Product was not found in database after saving")
-			
-			# Set initial status as DRAFT
-			product_dao.set_status_by_product_id(new_id, "DRAFT")
-			print(f"Set product {new_id} status to DRAFT")
-			
-		except Exception as e:
-			print(f"Error saving product to database: {e}")
-			import traceback
-			print("Full error:")
-			print(traceback.format_exc())
+		job = {'image_name': image_name, 'image_path': image_path}
+		job = upload_stage(job, printify_service, journal)
+		job = job and text_stage(job, text_generator, journal)
+		job = job and map_stage(job, template)
+		job = job and create_stage(job, printify_service, journal)
+		job and persist_stage(job, product_dao, printify_service, journal)
 			
 	except Exception as e:
 		print(f"Error in process_image: {e}")
@@ -117,11 +259,53 @@ def process_image(image_name, image_folder, text_generator, printify_service, te
 		print("Full error:")
 		print(traceback.format_exc())
 
+def open_product_dao():
+	"""Per-thread DAO for the persist stage, on its own pooled connection."""
+	db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
+	db_conn.connect()
+	return ProductDAO(db_conn)
+
+def close_product_dao(product_dao):
+	product_dao.close()
+
+def build_pipeline(workers, queue_size, text_generator, printify_service, template, journal=None):
+	"""
+	Stages: upload -> text -> map -> create -> persist.
+	Network-bound stages get `workers` threads each; mapping is pure CPU and cheap, so one
+	thread is enough. Persist workers each hold their own DB connection, so they are capped
+	to leave pool connections for everything else.
+	"""
+	return Pipeline([
+		Stage("upload", lambda job: upload_stage(job, printify_service, journal), workers=workers),
+		Stage("text", lambda job: text_stage(job, text_generator, journal), workers=workers),
+		Stage("map", lambda job: map_stage(job, template), workers=1),
+		Stage("create", lambda job: create_stage(job, printify_service, journal), workers=workers),
+		Stage(
+			"persist", lambda job, dao: persist_stage(job, dao, printify_service, journal), workers=min(workers, MAX_PERSIST_WORKERS),
+			init_worker=open_product_dao, close_worker=close_product_dao
+		),
+	], queue_size=queue_size)
+
+def parse_args():
+	parser = argparse.ArgumentParser(description="Generate Printify products from a folder of images using a template.")
+	parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+						help=f"Worker threads per pipeline stage (default {DEFAULT_WORKERS}); 1 processes images serially")
+	parser.add_argument("--queue-size", type=int, default=None,
+						help="Jobs buffered between stages before upstream stages wait (default 2x workers)")
+	parser.add_argument("--image-folder", default=image_folder, help="Folder of .png/.jpg images to turn into products")
+	parser.add_argument("--text-mode", choices=CONTENT_MODES, default=DEFAULT_CONTENT_MODE,
+						help="combined: one request for description, title and bullets; parallel: description, then title and bullets concurrently")
+	parser.add_argument("--no-resume", action="store_true",
+						help="Ignore the generation_jobs journal and process every image from scratch")
+	return parser.parse_args()
+
 def main():
+	args = parse_args()
+	folder = args.image_folder
 	db_conn = None
 	try:
 		openai_client = OpenAIClient()
-		text_generator = TextGenerator(openai_client)
+		text_generator = TextGenerator(openai_client, content_mode=args.text_mode)
 		product_generator_service = ProductGeneratorService(name="ProductGeneratorService")
 		printify_service = PrintifyService(name="PrintifyService", shop_id=shop_id)
 
@@ -130,6 +314,8 @@ def main():
 		db_conn.connect()
 		template_dao = TemplateDAO(db_conn)
 		product_dao = ProductDAO(db_conn)
+		# The journal shares the main connection; its DAO serialises access across workers
+		journal = None if args.no_resume else GenerationJobDAO(db_conn)
 
 		# Fetch template from the database
 		template = template_dao.fetch_template_from_template_id(product_id)
@@ -138,13 +324,13 @@ def main():
 			return
 
 		# Check if the folder exists
-		if not os.path.exists(image_folder):
-			print(f"Error: Image folder '{image_folder}' not found.")
+		if not os.path.exists(folder):
+			print(f"Error: Image folder '{folder}' not found.")
 			return
 
 		# Get list of image files in the folder
-		image_files = [f for f in os.listdir(image_folder) 
-					if os.path.isfile(os.path.join(image_folder, f)) 
+		image_files = [f for f in os.listdir(folder) 
+					if os.path.isfile(os.path.join(folder, f)) 
 					and f.lower().endswith(('.png', '.jpg', '.jpeg'))]
 		
 		if not image_files:
@@ -152,17 +338,34 @@ def main():
 			return
 			
 		print(f"Found {len(image_files)} images to process")
+		if journal:
+			progress = journal.count_by_stage(product_id, shop_id)
+			if progress:
+				print("Journal from previous runs: " + ", ".join(f"{stage}={count}" for stage, count in progress.items()))
 		
-		# Process images one at a time to avoid memory issues
-		for image_name in image_files:
-			process_image(
-				image_name, 
-				image_folder, 
-				text_generator, 
-				printify_service, 
-				template, 
-				product_dao
+		if args.workers <= 1:
+			# Process images one at a time
+			for image_name in image_files:
+				process_image(
+					image_name, 
+					folder, 
+					text_generator, 
+					printify_service, 
+					template, 
+					product_dao,
+					journal
+				)
+		else:
+			# Staged pipeline: bounded queues between stages keep only a few images in flight
+			queue_size = args.queue_size or args.workers * 2
+			pipeline = build_pipeline(args.workers, queue_size, text_generator, printify_service, template, journal)
+			jobs = (
+				{'image_name': image_name, 'image_path': os.path.join(folder, image_name)}
+				for image_name in image_files
 			)
+			completed = pipeline.run(jobs)
+			print(f"\nCreated and saved {len(completed)} of {len(image_files)} products")
+			print(pipeline.summary())
 			
 		print("All images have been processed.")
 		
@@ -0,0 +1,10 @@
+from config.migrations import run_migrations
+
+
+# Brings the database schema up to date. Run once per deploy, before starting the app or batch jobs.
+def main():
+	run_migrations(host="localhost", user="root", password="", database="print_core_db")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,21 @@
+from config.db_connection import DBConnection
+from dao.catalog_stats_dao import CatalogStatsDAO
+
+
+# Rebuilds the catalog_stats rollup behind the dashboards. Schedule it (e.g. every few
+# minutes from cron) so dashboard requests never have to rebuild stale stats themselves.
+def main():
+	db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
+	db_conn.connect()
+	try:
+		# Wait for a refresh already running in a web worker instead of skipping this one
+		if CatalogStatsDAO(db_conn).refresh(wait_seconds=60):
+			print("Catalog stats refreshed.")
+		else:
+			print("Catalog stats were not refreshed.")
+	finally:
+		db_conn.close()
+
+
+if __name__ == "__main__":
+	main()
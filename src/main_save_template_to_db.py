@@ -26,8 +26,13 @@ def main():
 	print("hey hey hey here")
 	# print(template_model.print_string_verbose())
 
-	# # 2) Store it in DB
-	template_dao.insert_or_update_template(template_model)
+	# # 2) Store it in DB; a failed save is rolled back and re-raised
+	try:
+		template_dao.insert_or_update_template(template_model)
+	except Exception as e:
+		print(f"Failed to save template {template_model.id}: {e}")
+		db_conn.close()
+		return
 
 	template_dao.set_status_by_template_id(template_model.id, "TEMPLATE")
 
@@ -1,6 +1,7 @@
 # file: template_product_mapper.py
 
 from typing import Optional
+import copy
 import random
 import string
 import secrets
@@ -74,6 +75,8 @@ class TemplateProductMapper:
 		)
 
 		# --- Transfer sub-model lists ---
+		# Sub-model data is deep-copied: the replace_* helpers edit it in place, and the
+		# template is shared by every product generated from it.
 
 		# Tags
 		for t in template.tags:
@@ -83,45 +86,45 @@ class TemplateProductMapper:
 		# Options
 		for opt in template.options:
 			# opt is a PrintifyOptionModel with "template_id" and a dict "data"
-			product.options.append(ProductOptionModel(product_id, opt.data))
+			product.options.append(ProductOptionModel(product_id, copy.deepcopy(opt.data)))
 
 		# Variants
 		for var in template.variants:
-			product.variants.append(ProductVariantModel(product_id, var.data))
+			product.variants.append(ProductVariantModel(product_id, copy.deepcopy(var.data)))
 
 		# Images
 		for img in template.images:
-			product.images.append(ProductImageModel(product_id, img.data))
+			product.images.append(ProductImageModel(product_id, copy.deepcopy(img.data)))
 
 		# Print Areas
 		for pa in template.print_areas:
-			product.print_areas.append(ProductPrintAreaModel(product_id, pa.data))
+			product.print_areas.append(ProductPrintAreaModel(product_id, copy.deepcopy(pa.data)))
 
 		# External
 		if template.external is not None:
-			product.external = ProductExternalModel(product_id, template.external.data)
+			product.external = ProductExternalModel(product_id, copy.deepcopy(template.external.data))
 
 		# Sales Channel Properties
 		for scp in template.sales_channel_properties:
 			product.sales_channel_properties.append(
-				ProductSalesChannelPropertyModel(product_id, scp.data)
+				ProductSalesChannelPropertyModel(product_id, copy.deepcopy(scp.data))
 			)
 
 		# Files
 		for f in template.files:
-			product.files.append(ProductFileModel(product_id, f.data))
+			product.files.append(ProductFileModel(product_id, copy.deepcopy(f.data)))
 
 		# Additional Options
 		for ao in template.additional_options:
-			product.additional_options.append(ProductAdditionalOptionModel(product_id, ao.data))
+			product.additional_options.append(ProductAdditionalOptionModel(product_id, copy.deepcopy(ao.data)))
 
 		# Selling Prices
 		for sp in template.selling_prices:
-			product.selling_prices.append(ProductSellingPriceModel(product_id, sp.data))
+			product.selling_prices.append(ProductSellingPriceModel(product_id, copy.deepcopy(sp.data)))
 
 		# Views
 		for v in template.views:
-			product.views.append(ProductViewModel(product_id, v.data))
+			product.views.append(ProductViewModel(product_id, copy.deepcopy(v.data)))
 
 		return product
 
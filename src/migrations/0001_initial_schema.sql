@@ -0,0 +1,239 @@
+-- Initial schema: products, templates and their sub-tables.
+-- Every statement is idempotent so databases created before migrations existed
+-- are adopted as version 1 without changes.
+
+CREATE TABLE IF NOT EXISTS products (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(100) NOT NULL,
+    title VARCHAR(255),
+    description TEXT,
+    blueprint_id INT,
+    print_provider_id INT,
+    user_id INT,
+    shop_id INT,
+    visible TINYINT(1),
+    is_locked TINYINT(1),
+    reviewed TINYINT(1),
+    created_at DATETIME,
+    updated_at DATETIME,
+    UNIQUE KEY unique_product_id (product_id)
+);
+
+CREATE TABLE IF NOT EXISTS product_tags (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    tag VARCHAR(255),
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_variants (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    variant_id INT,
+    sku VARCHAR(50),
+    cost INT,
+    price INT,
+    title VARCHAR(255),
+    grams INT,
+    is_enabled TINYINT(1),
+    is_default TINYINT(1),
+    is_available TINYINT(1),
+    is_printify_express_eligible TINYINT(1),
+    quantity INT,
+    options JSON,
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_images (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    src TEXT,
+    variant_ids JSON,
+    position VARCHAR(50),
+    is_default TINYINT(1),
+    is_selected_for_publishing TINYINT(1),
+    order_index INT NULL,
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_print_areas (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    variant_ids JSON,
+    background VARCHAR(7),
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_placeholders (
+    id VARCHAR(36) PRIMARY KEY,
+    print_area_id VARCHAR(36),
+    position VARCHAR(50),
+    images JSON,
+    FOREIGN KEY (print_area_id) REFERENCES product_print_areas(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_external (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36) UNIQUE,
+    external_id VARCHAR(100),
+    handle TEXT,
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_sales_channel_properties (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    data JSON,
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_views (
+    id VARCHAR(36) PRIMARY KEY,
+    product_id VARCHAR(36),
+    view_id INT,
+    label VARCHAR(255),
+    position VARCHAR(50),
+    FOREIGN KEY (product_id) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_view_files (
+    id VARCHAR(36) PRIMARY KEY,
+    view_id VARCHAR(36),
+    src TEXT,
+    variant_ids JSON,
+    FOREIGN KEY (view_id) REFERENCES product_views(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS product_status (
+    product_fk VARCHAR(36) PRIMARY KEY,
+    status ENUM('DRAFT','PUBLISHED') NOT NULL,
+    FOREIGN KEY (product_fk) REFERENCES products(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS templates (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(100) NOT NULL,
+    title VARCHAR(255),
+    description TEXT,
+    blueprint_id INT,
+    user_id INT,
+    shop_id INT,
+    visible TINYINT(1),
+    is_locked TINYINT(1),
+    reviewed TINYINT(1),
+    created_at DATETIME,
+    updated_at DATETIME,
+    print_provider_id INT,
+    UNIQUE KEY unique_template_id (template_id)
+);
+
+CREATE TABLE IF NOT EXISTS template_tags (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    tag VARCHAR(255),
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_variants (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    variant_id INT,
+    sku VARCHAR(50),
+    cost INT,
+    price INT,
+    title VARCHAR(255),
+    grams INT,
+    is_enabled TINYINT(1),
+    is_default TINYINT(1),
+    is_available TINYINT(1),
+    is_printify_express_eligible TINYINT(1),
+    quantity INT,
+    options JSON,
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_images (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    src TEXT,
+    variant_ids JSON,
+    position VARCHAR(50),
+    is_default TINYINT(1),
+    is_selected_for_publishing TINYINT(1),
+    order_index INT NULL,
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_print_areas (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    variant_ids JSON,
+    background VARCHAR(7),
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_placeholders (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    print_area_id VARCHAR(36),
+    position VARCHAR(50),
+    images JSON,
+    FOREIGN KEY (print_area_id) REFERENCES template_print_areas(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_external (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36) UNIQUE,
+    external_id VARCHAR(100),
+    handle TEXT,
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_sales_channel_properties (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    data JSON,
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_views (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    template_id VARCHAR(36),
+    view_id INT,
+    label VARCHAR(255),
+    position VARCHAR(50),
+    FOREIGN KEY (template_id) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_view_files (
+    id VARCHAR(36) PRIMARY KEY DEFAULT (UUID()),
+    view_id VARCHAR(36),
+    src TEXT,
+    variant_ids JSON,
+    FOREIGN KEY (view_id) REFERENCES template_views(id)
+      ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS template_status (
+    template_fk VARCHAR(36) PRIMARY KEY,
+    status ENUM('DRAFT','PUBLISHED','TEMPLATE') NOT NULL,
+    FOREIGN KEY (template_fk) REFERENCES templates(id)
+      ON DELETE CASCADE
+);
@@ -0,0 +1,20 @@
+-- Indexes for the dashboard listing queries.
+--
+-- fetch_products_paginated / fetch_templates_paginated sort by updated_at, created_at
+-- or title and read one page; these indexes let MySQL walk the sort order and stop at
+-- LIMIT instead of sorting the whole table. InnoDB appends the primary key to every
+-- secondary index, so each one is effectively (sort_key, id).
+--
+-- Status lives in its own table, so the status filter is served by (status, fk): it
+-- covers count_products(status=...) and the join behind fetch_max_draft_product_id,
+-- and lets the paginated query probe status by primary key while walking updated_at.
+
+CREATE INDEX idx_products_updated_at ON products (updated_at);
+CREATE INDEX idx_products_created_at ON products (created_at);
+CREATE INDEX idx_products_title ON products (title);
+CREATE INDEX idx_product_status_status ON product_status (status, product_fk);
+
+CREATE INDEX idx_templates_updated_at ON templates (updated_at);
+CREATE INDEX idx_templates_created_at ON templates (created_at);
+CREATE INDEX idx_templates_title ON templates (title);
+CREATE INDEX idx_template_status_status ON template_status (status, template_fk);
@@ -0,0 +1,5 @@
+-- FULLTEXT indexes backing product and template search, replacing the
+-- '%term%' LIKE scans over title and description.
+
+ALTER TABLE products ADD FULLTEXT INDEX ft_products_title_description (title, description);
+ALTER TABLE templates ADD FULLTEXT INDEX ft_templates_title_description (title, description);
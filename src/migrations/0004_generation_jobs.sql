@@ -0,0 +1,24 @@
+-- Journal for main_generate_product_from_template.py runs.
+--
+-- One row per (template, shop, image content) records how far that image got through
+-- the pipeline and the outputs of each finished stage, so an interrupted run resumes
+-- without re-uploading, regenerating text or creating duplicate Printify products.
+-- stage is one of: uploaded, text_generated, created, saved.
+
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    template_id VARCHAR(100) NOT NULL,
+    shop_id VARCHAR(32) NOT NULL,
+    image_sha256 CHAR(64) NOT NULL,
+    image_name VARCHAR(512),
+    stage VARCHAR(32) NOT NULL,
+    image_upload JSON,
+    title VARCHAR(255),
+    description TEXT,
+    bullet_points JSON,
+    printify_product_id VARCHAR(100),
+    last_error TEXT,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_generation_job (template_id, shop_id, image_sha256)
+);
@@ -0,0 +1,17 @@
+-- Shared cache of Printify mockup image URLs for the dashboards.
+--
+-- Keyed by the Printify product id (templates are Printify products too), so every
+-- web worker reads the same entries and they survive restarts. Rows are written
+-- whenever a product or template is saved, since its images are in hand then, and
+-- when a listing page had to fetch a missing mockup from Printify.
+-- fetched_at drives expiry; last_used_at drives least-recently-used eviction.
+
+CREATE TABLE IF NOT EXISTS mockup_cache (
+    printify_id VARCHAR(100) PRIMARY KEY,
+    kind VARCHAR(16) NOT NULL,
+    mockup_url TEXT,
+    image_urls JSON,
+    fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_used_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    KEY idx_mockup_cache_last_used (last_used_at)
+);
@@ -0,0 +1,17 @@
+-- Pre-aggregated catalog statistics for the dashboards.
+--
+-- One row per (scope, metric, name): scope is 'product', 'template' or 'catalog'
+-- (both together); metric is one of total, status, tag, unique_tags, price_bucket,
+-- price_sum, priced, updated_7d; name distinguishes rows within a metric (a status,
+-- a tag, a price bucket) and is '' otherwise. The whole table is rebuilt by
+-- CatalogStatsDAO.refresh, so dashboards read a few dozen rows instead of
+-- aggregating the catalog on every request.
+
+CREATE TABLE IF NOT EXISTS catalog_stats (
+    scope VARCHAR(16) NOT NULL,
+    metric VARCHAR(32) NOT NULL,
+    name VARCHAR(255) NOT NULL DEFAULT '',
+    value DECIMAL(18,2) NOT NULL,
+    refreshed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (scope, metric, name)
+);
@@ -380,3 +380,42 @@ class PrintifyTemplateModel:
 			model.views.append(PrintifyViewModel(pid, v))
 
 		return model
+
+# ----------------------------------------------------------------------
+
+class PrintifyTemplateSummaryModel:
+	"""
+	Slim, read-only view of a template for listing pages, built from a summary
+	query row and its tags. It carries no variants, images or print areas; load the
+	full PrintifyTemplateModel for detail and edit views.
+	"""
+	__slots__ = (
+		"id", "internal_id", "title", "description", "created_at", "updated_at",
+		"status", "price", "tags", "mockup_url", "image_url"
+	)
+
+	def __init__(
+		self,
+		id: str,
+		internal_id: str,
+		title: Optional[str],
+		description: Optional[str],
+		created_at: Optional[str],
+		updated_at: Optional[str],
+		status: str,
+		price: Optional[int],
+		tags: List[str],
+		mockup_url: Optional[str] = None,
+		image_url: Optional[str] = None
+	):
+		self.id = id  # external template id
+		self.internal_id = internal_id
+		self.title = title
+		self.description = description  # first SUMMARY_DESCRIPTION_CHARS characters only
+		self.created_at = created_at
+		self.updated_at = updated_at
+		self.status = status
+		self.price = price  # first variant's price
+		self.tags = tags
+		self.mockup_url = mockup_url  # from the mockup cache, None when not cached
+		self.image_url = image_url  # first stored image, a fallback for uncached mockups
@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from dao.mockup_cache_dao import MockupCacheDAO, mockup_urls_from_images
+
+# Printify lookups run in parallel on a shared pool of this many threads per process
+MOCKUP_PREFETCH_WORKERS = int(os.getenv("MOCKUP_PREFETCH_WORKERS", "8"))
+# How long a listing page waits for missing mockups before rendering placeholders
+MOCKUP_PREFETCH_DEADLINE_SECONDS = float(os.getenv("MOCKUP_PREFETCH_DEADLINE_SECONDS", "1.5"))
+# Finished lookups nobody collected are dropped after this long
+MOCKUP_PREFETCH_RESULT_SECONDS = 300
+
+
+class MockupCacheService:
+    """
+    Resolves the mockup image shown for each product or template on listing pages.
+
+    Lookups go to the shared 'mockup_cache' table first. Entries are written whenever a
+    product or template is saved, so a warm cache answers a whole page with one query.
+    For misses, images already loaded with the models are used next, and only then is
+    Printify asked; every answer is written back so other workers and later requests
+    reuse it.
+
+    Printify lookups for a page run concurrently on a pool shared by all requests in the
+    process. With a deadline, lookups that have not finished in time keep running in the
+    background; their ids are reported as pending and a later call (e.g. from
+    /media/api/mockups) collects the result instead of asking Printify again.
+    """
+
+    # Expired and least recently used rows are pruned after this many fills per process
+    EVICT_EVERY = 500
+
+    _fills = 0
+    _fills_lock = threading.Lock()
+
+    # Shared across requests: the pool, and the lookups still running or not yet collected
+    _executor = ThreadPoolExecutor(max_workers=MOCKUP_PREFETCH_WORKERS, thread_name_prefix="mockup-prefetch")
+    _inflight = {}
+    _inflight_lock = threading.Lock()
+
+    def __init__(self, db_conn, printify_service=None):
+        """
+        :param db_conn: Database connection for the mockup_cache table.
+        :param printify_service: PrintifyService used to fetch mockups that are not cached;
+            without one, misses are simply returned without a URL.
+        """
+        self.dao = MockupCacheDAO(db_conn)
+        self.printify_service = printify_service
+
+    def get_mockup_urls(self, printify_ids, kind, known_images=None, deadline=None):
+        """
+        Returns {printify_id: mockup_url} for the given products or templates.
+
+        :param kind: "product" or "template".
+        :param known_images: Optional {printify_id: images} from already loaded models,
+            used for cache misses before falling back to Printify.
+        :param deadline: Seconds to wait for Printify lookups; None waits for all of them.
+        """
+        mockup_urls, _ = self.resolve_mockups(printify_ids, kind, known_images, deadline)
+        return mockup_urls
+
+    def resolve_mockups(self, printify_ids, kind, known_images=None, deadline=None):
+        """
+        Like get_mockup_urls, but also returns the ids whose Printify lookup was still
+        running at the deadline, as ({printify_id: mockup_url}, pending_ids).
+        """
+        mockup_urls = self.dao.fetch_mockup_urls(printify_ids)
+        known_images = known_images or {}
+
+        to_fetch = []
+        for printify_id in dict.fromkeys(printify_ids):
+            if not printify_id or printify_id in mockup_urls:
+                continue
+            image_urls = mockup_urls_from_images(known_images.get(printify_id))
+            if image_urls:
+                self.remember(printify_id, kind, image_urls)
+                mockup_urls[printify_id] = image_urls[0]
+            else:
+                to_fetch.append(printify_id)
+
+        if not to_fetch or not self.printify_service:
+            return mockup_urls, []
+
+        # Every lookup starts at once; the page only waits until the deadline
+        futures = {printify_id: self._submit(printify_id) for printify_id in to_fetch}
+        wait(futures.values(), timeout=deadline)
+
+        pending = []
+        for printify_id, future in futures.items():
+            if not future.done():
+                pending.append(printify_id)
+                continue
+            self._collect(printify_id, future)
+            image_urls = future.result()
+            if image_urls:
+                self.remember(printify_id, kind, image_urls)
+                mockup_urls[printify_id] = image_urls[0]
+
+        return mockup_urls, pending
+
+    def resolve_known_mockups(self, printify_ids, kind, deadline=None):
+        """
+        resolve_mockups for ids supplied by a client: only ids of products or templates
+        stored in the database are looked up on Printify, anything else is answered from
+        the cache alone, so arbitrary ids cannot spend the shared Printify rate limit.
+        """
+        known_ids = self.dao.fetch_known_ids(printify_ids, kind)
+        mockup_urls, pending = self.resolve_mockups(
+            [printify_id for printify_id in printify_ids if printify_id in known_ids], kind, deadline=deadline
+        )
+        mockup_urls.update(self.dao.fetch_mockup_urls([pid for pid in printify_ids if pid not in known_ids]))
+        return mockup_urls, pending
+
+    def resolve_summary_mockups(self, summaries, kind, deadline=None):
+        """
+        resolve_mockups for product or template summaries, whose listing query already
+        read the cached mockup_url. Only summaries without one are looked up, with their
+        first stored image (image_url) used before asking Printify.
+        """
+        mockup_urls = {summary.id: summary.mockup_url for summary in summaries if summary.mockup_url}
+        missing = [summary for summary in summaries if not summary.mockup_url]
+        known_images = {summary.id: [{"src": summary.image_url}] for summary in missing if summary.image_url}
+        fetched_urls, pending = self.resolve_mockups(
+            [summary.id for summary in missing], kind, known_images, deadline
+        )
+        mockup_urls.update(fetched_urls)
+        return mockup_urls, pending
+
+    def _submit(self, printify_id):
+        """Starts a Printify lookup, or joins the one already running for the same id."""
+        now = time.monotonic()
+        with MockupCacheService._inflight_lock:
+            # Drop results that were never collected, so the registry stays small
+            for stale_id, (future, started) in list(MockupCacheService._inflight.items()):
+                if future.done() and now - started > MOCKUP_PREFETCH_RESULT_SECONDS:
+                    del MockupCacheService._inflight[stale_id]
+
+            entry = MockupCacheService._inflight.get(printify_id)
+            if entry is None:
+                entry = (self._executor.submit(self.fetch_from_printify, printify_id), now)
+                MockupCacheService._inflight[printify_id] = entry
+            return entry[0]
+
+    @staticmethod
+    def _collect(printify_id, future):
+        """Forgets a finished lookup once its result has been stored."""
+        with MockupCacheService._inflight_lock:
+            entry = MockupCacheService._inflight.get(printify_id)
+            if entry is not None and entry[0] is future:
+                del MockupCacheService._inflight[printify_id]
+
+    def fetch_from_printify(self, printify_id):
+        """Mockup URLs for one product or template straight from Printify; [] on failure."""
+        if not self.printify_service:
+            return []
+        try:
+            details = self.printify_service.get_product_details(printify_id)
+            return mockup_urls_from_images(details.get("images")) if details else []
+        except Exception as e:
+            print(f"Error fetching mockup for {printify_id}: {str(e)}")
+            return []
+
+    def remember(self, printify_id, kind, image_urls):
+        """Stores mockup URLs in the shared cache, pruning it now and then."""
+        self.dao.store_mockups(printify_id, kind, image_urls)
+        with MockupCacheService._fills_lock:
+            MockupCacheService._fills += 1
+            evict = MockupCacheService._fills % self.EVICT_EVERY == 0
+        if evict:
+            self.dao.evict()
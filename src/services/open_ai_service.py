@@ -4,11 +4,14 @@ import re
 import os
 import requests
 from dotenv import load_dotenv
+from clients.open_ai_client import OpenAIClient
 
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
 client = OpenAI()
+# Text completions go through OpenAIClient for its retries and token budget
+text_client = OpenAIClient()
 
 class OpenAiService:
     def __init__(self, name):
@@ -17,21 +20,9 @@ class OpenAiService:
     @staticmethod
     def _generate_response(system_message, user_message, model="gpt-3.5-turbo", max_tokens=150, temperature=0.7):
         """Handles API calls for text generation, reducing redundancy."""
-        try:
-            response = client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                model=model,
-                max_tokens=max_tokens,
-                n=1,
-                temperature=temperature
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"Error in API call: {e}")
-            return None
+        return text_client.generate_text(
+            system_message, user_message, model=model, max_tokens=max_tokens, temperature=temperature, use_cache=False
+        )
 
     def generate_psychedelic_prompt(self):
         """Generates a creative prompt for psychedelic and fractal art."""
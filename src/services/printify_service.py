@@ -6,8 +6,9 @@ from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 import json
 
-from clients.printify_client import PrintifyClient
+from clients.printify_client import PrintifyClient, get_shared_client
 from models.printify_product_models import PrintifyProductModel, PrintifyTagModel
+from util.upload_cache import UploadCache, file_sha256, get_upload_cache
 
 load_dotenv()
 
@@ -24,21 +25,28 @@ headers = {
 }
 
 class PrintifyService:
-	def __init__(self, name: str, shop_id: str):
+	def __init__(self, name: str, shop_id: str, client: Optional[PrintifyClient] = None,
+				 upload_cache: Optional[UploadCache] = None):
 		"""
 		Initialize the Printify Service.
 		
 		Args:
 			name: Arbitrary descriptor for this service instance
 			shop_id: Your Printify shop ID, e.g., '20434486'
+			client: PrintifyClient to use; defaults to the shared client so services
+				created per request reuse its pooled connections
+			upload_cache: Cache of previous image uploads; defaults to the shared local cache
 		"""
 		self.name = name
 		self.shop_id = shop_id
-		self.client = PrintifyClient()
+		self.client = client or get_shared_client()
+		self.upload_cache = upload_cache or get_upload_cache()
 
 	def upload_image(self, image_path: str) -> Optional[Dict[str, Any]]:
 		"""
 		Upload an image to Printify.
+		Files whose exact bytes were uploaded before are served from the upload cache
+		without touching the network, so re-runs skip art that is already on Printify.
 		
 		Args:
 			image_path: Path to the image file
@@ -46,7 +54,38 @@ class PrintifyService:
 		Returns:
 			Dict with image data including ID if successful, None otherwise
 		"""
-		return self.client.upload_image(image_path)
+		digest = None
+		if self.upload_cache and os.path.isfile(image_path):
+			try:
+				digest = file_sha256(image_path)
+				cached = self.upload_cache.get(digest)
+				if cached:
+					print(f"Image already uploaded, reusing image ID {cached.get('id')} from the upload cache")
+					return cached
+			except Exception as e:
+				print(f"Upload cache lookup failed, uploading anyway: {e}")
+		
+		response = self.client.upload_image(image_path)
+		
+		if response and digest:
+			try:
+				self.upload_cache.put(digest, response, os.path.basename(image_path))
+			except Exception as e:
+				print(f"Could not record upload in the upload cache: {e}")
+		return response
+
+	def upload_image_from_url(self, image_url: str, file_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+		"""
+		Upload an image already hosted elsewhere; Printify downloads it from the URL.
+		
+		Args:
+			image_url: Publicly reachable URL of the image
+			file_name: Name to store the image under (optional)
+			
+		Returns:
+			Dict with image data including ID if successful, None otherwise
+		"""
+		return self.client.upload_image_from_url(image_url, file_name)
 
 	def get_product_details(self, product_id: str) -> Optional[Dict[str, Any]]:
 		"""
@@ -318,7 +357,8 @@ class PrintifyService:
 
 		# Get the mockup image URL
 		mockup_url = mockups[mockup_index]["src"]
-		image_response = requests.get(mockup_url, stream=True)
+		# Mockups live on a CDN host, so fetch them without the API session (and its auth header)
+		image_response = requests.get(mockup_url, stream=True, timeout=self.client.timeout)
 
 		if image_response.status_code == 200:
 			image_filename = os.path.join(save_folder, f"{product_id}_mockup_{mockup_index+1}.jpg")
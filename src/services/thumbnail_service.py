@@ -0,0 +1,148 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+
+import requests
+from PIL import Image
+
+# Where generated thumbnails are kept; safe to delete, they are rebuilt on demand
+THUMBNAIL_DIR = os.path.expanduser(os.getenv("THUMBNAIL_DIR", "~/.print_core/thumbnails"))
+# Widths in pixels that thumbnails are produced at; requests snap to the next one up
+THUMBNAIL_WIDTHS = (200, 400, 800)
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", "80"))
+# Largest source image that will be downloaded
+MAX_SOURCE_BYTES = 30 * 1024 * 1024
+SOURCE_TIMEOUT = (5, 30)
+
+
+def snap_width(width) -> int:
+    """The smallest thumbnail width at least `width` (the largest one if none is)."""
+    try:
+        width = int(width)
+    except (TypeError, ValueError):
+        return THUMBNAIL_WIDTHS[0]
+    for candidate in THUMBNAIL_WIDTHS:
+        if candidate >= width:
+            return candidate
+    return THUMBNAIL_WIDTHS[-1]
+
+
+class ThumbnailService:
+    """
+    Builds and stores resized copies of mockup images on local disk.
+
+    The first request for an image downloads the full-size mockup once and writes every
+    width in every format, so later requests are served straight from disk. File names
+    include a hash of the source URL: when a product's mockup changes, new thumbnails
+    are built under new names (and new ETags) instead of serving stale ones.
+    """
+
+    # Striped locks keyed by source image, so concurrent requests build it only once per
+    # process; a fixed number keeps memory flat however many images are served
+    LOCK_STRIPES = 64
+    _locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def __init__(self, base_dir: str = THUMBNAIL_DIR):
+        self.base_dir = base_dir
+
+    @staticmethod
+    def source_key(source_url: str) -> str:
+        """Short, stable identifier for a source image URL."""
+        return hashlib.sha256(source_url.encode("utf-8")).hexdigest()[:16]
+
+    def thumbnail_path(self, printify_id: str, source_url: str, width: int, fmt: str) -> str:
+        """Where the thumbnail for a source image, width and format is stored."""
+        safe_id = "".join(c for c in printify_id if c.isalnum() or c in "-_") or "unknown"
+        return os.path.join(self.base_dir, safe_id, f"{self.source_key(source_url)}-{width}.{fmt}")
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[int(key, 16) % self.LOCK_STRIPES]
+
+    def get_thumbnail(self, printify_id: str, source_url: str, width: int, fmt: str):
+        """
+        Returns the path of the thumbnail, building all thumbnails for the source image
+        first if they are not on disk yet. Returns None if the source cannot be fetched
+        or decoded.
+        """
+        if fmt not in THUMBNAIL_FORMATS:
+            raise ValueError(f"Invalid thumbnail format '{fmt}'. Expected one of: {', '.join(THUMBNAIL_FORMATS)}")
+        width = snap_width(width)
+        path = self.thumbnail_path(printify_id, source_url, width, fmt)
+        if os.path.exists(path):
+            return path
+
+        with self._lock_for(self.source_key(source_url)):
+            # Another request may have built it while this one waited
+            if not os.path.exists(path):
+                if not self._build_all(printify_id, source_url):
+                    return None
+        return path if os.path.exists(path) else None
+
+    def _download(self, source_url: str):
+        """Downloads the source image into memory, refusing oversized files."""
+        try:
+            response = requests.get(source_url, stream=True, timeout=SOURCE_TIMEOUT)
+            if response.status_code != 200:
+                print(f"Failed to fetch mockup {source_url}: {response.status_code}")
+                return None
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=256 * 1024):
+                buffer.write(chunk)
+                if buffer.tell() > MAX_SOURCE_BYTES:
+                    print(f"Mockup {source_url} is larger than {MAX_SOURCE_BYTES} bytes; not thumbnailing it")
+                    return None
+            buffer.seek(0)
+            return buffer
+        except Exception as e:
+            print(f"Error fetching mockup {source_url}: {e}")
+            return None
+
+    def _build_all(self, printify_id: str, source_url: str) -> bool:
+        """Writes every width and format for a source image; each file appears atomically."""
+        source = self._download(source_url)
+        if source is None:
+            return False
+
+        try:
+            with Image.open(source) as original:
+                original.load()
+                has_alpha = original.mode in ("RGBA", "LA") or (original.mode == "P" and "transparency" in original.info)
+                base = original.convert("RGBA" if has_alpha else "RGB")
+        except Exception as e:
+            print(f"Error decoding mockup {source_url}: {e}")
+            return False
+
+        for width in THUMBNAIL_WIDTHS:
+            resized = base.copy()
+            # Never upscale; keep the aspect ratio
+            resized.thumbnail((width, width * 4), Image.LANCZOS)
+            for fmt, (pil_format, _) in THUMBNAIL_FORMATS.items():
+                image = resized
+                if pil_format == "JPEG" and image.mode != "RGB":
+                    # JPEG has no alpha channel; flatten onto white like the dashboards' cards
+                    flattened = Image.new("RGB", image.size, (255, 255, 255))
+                    flattened.paste(image, mask=image.getchannel("A"))
+                    image = flattened
+                self._write(self.thumbnail_path(printify_id, source_url, width, fmt), image, pil_format)
+        return True
+
+    @staticmethod
+    def _write(path: str, image, pil_format: str):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp file and rename, so no reader ever sees a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                image.save(f, format=pil_format, quality=THUMBNAIL_QUALITY, optimize=True)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,84 @@
+"""
+Helpers for tests that need a real MySQL database.
+
+They run against the database named by TEST_MYSQL_DATABASE (with TEST_MYSQL_HOST,
+TEST_MYSQL_USER and TEST_MYSQL_PASSWORD) and are skipped when it is not set. The
+database is migrated to the latest schema first; use a dedicated, disposable one.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# Tests import the app modules the same way the scripts in src/ do
+SRC_DIR = Path(__file__).resolve().parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def mysql_test_config():
+    """Connection settings for the test database, or None when none is configured."""
+    database = os.getenv("TEST_MYSQL_DATABASE")
+    if not database:
+        return None
+    return {
+        "host": os.getenv("TEST_MYSQL_HOST", "localhost"),
+        "user": os.getenv("TEST_MYSQL_USER", "root"),
+        "password": os.getenv("TEST_MYSQL_PASSWORD", ""),
+        "database": database,
+    }
+
+
+def connect_test_db():
+    """
+    Returns a connected, migrated DBConnection to the test database.
+    Raises unittest.SkipTest when no test database is configured or reachable.
+    """
+    config = mysql_test_config()
+    if config is None:
+        raise unittest.SkipTest("Set TEST_MYSQL_DATABASE to run tests against MySQL")
+    try:
+        from config.db_connection import DBConnection
+        from config.migrations import MigrationRunner
+    except ImportError as e:
+        raise unittest.SkipTest(f"MySQL client not installed: {e}")
+
+    db_conn = DBConnection(**config)
+    db_conn.connect()
+    if db_conn.connection is None:
+        raise unittest.SkipTest(f"Could not connect to test database '{config['database']}'")
+    MigrationRunner(db_conn).migrate()
+    return db_conn
+
+
+class RecordingCursor:
+    """Cursor wrapper remembering every (sql, params) executed through it."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+        return self._cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def find(self, fragment):
+        """The last statement containing `fragment`, as (sql, params)."""
+        for sql, params in reversed(self.statements):
+            if fragment in sql:
+                return sql, params
+        raise AssertionError(f"No statement containing {fragment!r} was executed")
+
+
+def explain_keys(db_conn, sql, params=None) -> set:
+    """Names of the indexes MySQL plans to use for `sql`, from EXPLAIN's 'key' column."""
+    cursor = db_conn.connection.cursor(dictionary=True)
+    try:
+        cursor.execute("EXPLAIN " + sql.strip().rstrip(";"), params)
+        return {row["key"] for row in cursor.fetchall() if row.get("key")}
+    finally:
+        cursor.close()
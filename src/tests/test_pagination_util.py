@@ -0,0 +1,144 @@
+"""
+Tests for keyset pagination, in particular page boundaries on NULL sort keys.
+
+The page walks run the generated seek/order SQL on SQLite, which orders NULLs
+like MySQL (first when ascending, last when descending), so they need no server.
+"""
+
+import sqlite3
+import unittest
+
+from tests.mysql_support import connect_test_db
+from util.pagination_util import decode_cursor, encode_cursor, order_clause, page_cursors, seek_clause
+
+PAGE_SIZE = 3
+
+
+def walk_pages(connection, sort_by, descending, cursor=None, direction="next", max_pages=50):
+    """
+    Follows cursors in one direction from `cursor` and returns the ids of every page,
+    built the same way ProductDAO.fetch_products_page builds its query.
+    """
+    pages = []
+    first_page = cursor is None
+    for _ in range(max_pages):
+        position = decode_cursor(cursor, sort_by) if cursor else None
+        if cursor and position is None:
+            raise AssertionError(f"cursor was rejected: {cursor}")
+        page_direction = position["d"] if position else "next"
+
+        sql = "SELECT id, sort_key FROM items"
+        params = []
+        if position:
+            seek_sql, params = seek_clause("sort_key", "id", descending, page_direction, position["k"], position["i"])
+            sql += " WHERE " + seek_sql
+        sql += " ORDER BY " + order_clause("sort_key", "id", descending, page_direction)
+        sql += " LIMIT ?"
+        params = list(params) + [PAGE_SIZE + 1]
+
+        rows = [{"id": r[0], "sort_key": r[1]} for r in connection.execute(sql.replace("%s", "?"), params)]
+        has_more = len(rows) > PAGE_SIZE
+        rows = rows[:PAGE_SIZE]
+        if page_direction == "prev":
+            rows.reverse()
+        pages.append([row["id"] for row in rows])
+
+        next_cursor, prev_cursor = page_cursors(
+            sort_by, rows, "sort_key", "id", page_direction, has_more, not first_page
+        )
+        first_page = False
+        cursor = next_cursor if direction == "next" else prev_cursor
+        if cursor is None:
+            return pages
+    raise AssertionError("pagination did not terminate")
+
+
+class KeysetNullKeyTest(unittest.TestCase):
+
+    # NULL keys sit on page boundaries for PAGE_SIZE 3 in both sort directions
+    ITEMS = [
+        ("a1", "apple"), ("a2", None), ("a3", "cherry"), ("a4", None), ("a5", "banana"),
+        ("a6", None), ("a7", "banana"), ("a8", None), ("a9", "date"), ("b1", None),
+    ]
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE items (id TEXT PRIMARY KEY, sort_key TEXT)")
+        self.connection.executemany("INSERT INTO items VALUES (?, ?)", self.ITEMS)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def expected_order(self, descending):
+        order = "DESC" if descending else "ASC"
+        return [r[0] for r in self.connection.execute(f"SELECT id FROM items ORDER BY sort_key {order}, id {order}")]
+
+    def test_cursor_with_null_key_round_trips(self):
+        token = encode_cursor("title", None, "a2", "next")
+        self.assertEqual(decode_cursor(token, "title"), {"s": "title", "k": None, "i": "a2", "d": "next"})
+
+    def test_forward_walk_reaches_every_row_once(self):
+        for descending in (False, True):
+            with self.subTest(descending=descending):
+                pages = walk_pages(self.connection, "title", descending)
+                self.assertEqual([i for page in pages for i in page], self.expected_order(descending))
+
+    def test_backward_walk_from_last_page(self):
+        for descending in (False, True):
+            with self.subTest(descending=descending):
+                expected = self.expected_order(descending)
+                # Start from a 'prev' cursor just past the last row and walk back to the start
+                last = dict(self.ITEMS)[expected[-1]]
+                start = encode_cursor("title", last, expected[-1], "prev")
+                pages = walk_pages(self.connection, "title", descending, cursor=start, direction="prev")
+                self.assertEqual([i for page in reversed(pages) for i in page], expected[:-1])
+
+    def test_boundary_on_null_key(self):
+        # The first ascending page ends on a NULL key; the next page must continue after it
+        first_page = walk_pages(self.connection, "title", False, max_pages=50)[0]
+        self.assertIsNone(dict(self.ITEMS)[first_page[-1]])
+        token = encode_cursor("title", None, first_page[-1], "next")
+        second_page = walk_pages(self.connection, "title", False, cursor=token)[0]
+        self.assertEqual(second_page, self.expected_order(False)[PAGE_SIZE:2 * PAGE_SIZE])
+
+
+class ProductPageNullTitleTest(unittest.TestCase):
+    """Walks fetch_products_page over products with NULL titles on a real MySQL."""
+
+    SEED_PREFIX = "nullkey-"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = connect_test_db()
+        import uuid
+        rows = []
+        for i in range(7):
+            rows.append((str(uuid.uuid4()), f"{cls.SEED_PREFIX}{i}", None if i % 2 else f"Seed {i}"))
+        cls.db.cursor.executemany("INSERT INTO products (id, product_id, title) VALUES (%s, %s, %s)", rows)
+        cls.db.connection.commit()
+        cls.seeded = {row[1] for row in rows}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.cursor.execute("DELETE FROM products WHERE product_id LIKE %s", (cls.SEED_PREFIX + "%",))
+        cls.db.connection.commit()
+        cls.db.close()
+
+    def test_walk_by_title_reaches_null_titles(self):
+        from dao.product_dao import ProductDAO
+        dao = ProductDAO(self.db)
+        seen = []
+        cursor = None
+        for _ in range(10000):
+            products, _, cursor, _ = dao.fetch_products_page(limit=2, cursor=cursor, sort_by="title")
+            seen.extend(product.id for product in products)
+            if cursor is None:
+                break
+        else:
+            self.fail("pagination did not terminate")
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertTrue(self.seeded <= set(seen))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Query-plan regression tests for the listing indexes added in migrations/0002.
+
+Each test runs a DAO method, captures the SQL it sent and checks with EXPLAIN
+that MySQL plans to use the expected index, so a change to a query shape that
+stops it from walking its index shows up here instead of as a slow dashboard.
+"""
+
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from tests.mysql_support import RecordingCursor, connect_test_db, explain_keys
+
+# External ids of the seeded rows, so tearDown only removes what the test added
+SEED_PREFIX = "qplan-"
+# Enough rows that the optimizer prefers the index over a full scan and filesort
+SEED_ROWS = 2000
+
+
+class ListingQueryPlanTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = connect_test_db()
+        from util.db_util import execute_batched
+
+        now = datetime(2026, 1, 1)
+        products, product_status, templates, template_status = [], [], [], []
+        for i in range(SEED_ROWS):
+            stamp = now - timedelta(minutes=i)
+            status = "DRAFT" if i % 2 else "PUBLISHED"
+            product_id = str(uuid.uuid4())
+            products.append((product_id, f"{SEED_PREFIX}{i:06d}", f"Product {i}", stamp, stamp))
+            product_status.append((product_id, status))
+            template_id = str(uuid.uuid4())
+            templates.append((template_id, f"{SEED_PREFIX}{i:06d}", f"Template {i}", stamp, stamp))
+            template_status.append((template_id, "TEMPLATE" if i % 2 else "DRAFT"))
+
+        cursor = cls.db.cursor
+        execute_batched(cursor, "INSERT INTO products (id, product_id, title, created_at, updated_at) VALUES (%s, %s, %s, %s, %s)", products)
+        execute_batched(cursor, "INSERT INTO product_status (product_fk, status) VALUES (%s, %s)", product_status)
+        execute_batched(cursor, "INSERT INTO templates (id, template_id, title, created_at, updated_at) VALUES (%s, %s, %s, %s, %s)", templates)
+        execute_batched(cursor, "INSERT INTO template_status (template_fk, status) VALUES (%s, %s)", template_status)
+        cls.db.connection.commit()
+        for table in ("products", "product_status", "templates", "template_status"):
+            cursor.execute(f"ANALYZE TABLE {table}")
+            cursor.fetchall()
+
+    @classmethod
+    def tearDownClass(cls):
+        # Status rows go with their products and templates through ON DELETE CASCADE
+        cls.db.cursor.execute("DELETE FROM products WHERE product_id LIKE %s", (SEED_PREFIX + "%",))
+        cls.db.cursor.execute("DELETE FROM templates WHERE template_id LIKE %s", (SEED_PREFIX + "%",))
+        cls.db.connection.commit()
+        cls.db.close()
+
+    def setUp(self):
+        self.recorder = RecordingCursor(self.db.cursor)
+        self.db.cursor = self.recorder
+
+    def tearDown(self):
+        self.db.cursor = self.recorder._cursor
+
+    def assertUsesIndex(self, fragment, index_name):
+        sql, params = self.recorder.find(fragment)
+        keys = explain_keys(self.db, sql, params)
+        self.assertIn(index_name, keys, f"expected {index_name} in the plan of:\n{sql}\nplanned keys: {keys}")
+
+    def test_count_products_by_status(self):
+        from dao.product_dao import ProductDAO
+        ProductDAO(self.db).count_products(status="DRAFT")
+        self.assertUsesIndex("COUNT(p.id)", "idx_product_status_status")
+
+    def test_fetch_products_paginated(self):
+        from dao.product_dao import ProductDAO
+        for sort_by, index_name in (
+            ("updated_at", "idx_products_updated_at"),
+            ("created_at", "idx_products_created_at"),
+            ("title", "idx_products_title"),
+        ):
+            with self.subTest(sort_by=sort_by):
+                ProductDAO(self.db).fetch_products_paginated(limit=12, offset=0, sort_by=sort_by)
+                self.assertUsesIndex("SELECT p.*", index_name)
+
+    def test_fetch_templates_paginated(self):
+        from dao.template_dao import TemplateDAO
+        for sort_by, index_name in (
+            ("updated_at", "idx_templates_updated_at"),
+            ("created_at", "idx_templates_created_at"),
+            ("title", "idx_templates_title"),
+        ):
+            with self.subTest(sort_by=sort_by):
+                TemplateDAO(self.db).fetch_templates_paginated(limit=12, offset=0, sort_by=sort_by)
+                self.assertUsesIndex("SELECT t.template_id", index_name)
+
+    def test_fetch_max_draft_product_id(self):
+        from dao.product_dao import ProductDAO
+        ProductDAO(self.db).fetch_max_draft_product_id()
+        self.assertUsesIndex("MAX(p.product_id)", "idx_product_status_status")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,466 @@
+import json
+import os
+import threading
+import time
+import uuid
+
+# Rows sent per multi-row INSERT, overridable from the environment
+DEFAULT_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))
+
+# How long a cached listing total may be reused before it is recounted
+LISTING_COUNT_TTL_SECONDS = float(os.getenv("LISTING_COUNT_TTL_SECONDS", "60"))
+
+# Characters of the description carried by listing summaries; cards show far fewer
+SUMMARY_DESCRIPTION_CHARS = 200
+
+
+def first_variant_price_sql(variant_table: str, owner_column: str, owner_id_sql: str) -> str:
+    """
+    Correlated subquery for the price shown for a product or template: its default
+    variant, else the one with the lowest Printify variant id. Both keys come from
+    Printify, so the choice is stable across runs and re-syncs (sub-table primary
+    keys are random UUIDs and say nothing about order).
+    """
+    return (
+        f"(SELECT v.price FROM {variant_table} v WHERE v.{owner_column} = {owner_id_sql} "
+        f"ORDER BY v.is_default DESC, v.variant_id LIMIT 1)"
+    )
+
+
+def chunked(rows, size):
+    """Yields successive slices of at most `size` items from `rows`."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def execute_batched(cursor, sql, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Executes a parameterised INSERT for every row in `rows` using executemany.
+
+    mysql.connector rewrites `INSERT ... VALUES (...)` executemany calls into a single
+    multi-row INSERT, so each chunk of `batch_size` rows costs one round trip.
+    Chunking keeps each statement comfortably below max_allowed_packet.
+    """
+    if not rows:
+        return
+    for batch in chunked(rows, batch_size):
+        cursor.executemany(sql, batch)
+
+
+def canonical_json(value):
+    """Stable JSON text for a value, independent of key order and whitespace."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def normalize_db_value(value, is_json=False):
+    """
+    Normalises a column value so rows read back from MySQL compare equal to rows
+    built in Python: JSON columns are parsed and booleans become 0/1.
+    """
+    if is_json and isinstance(value, (str, bytes, bytearray)):
+        return json.loads(value)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def diff_rows(stored, incoming, key, signature=None):
+    """
+    Matches stored rows to incoming rows by natural key.
+
+    Returns (to_insert, to_update, to_delete) where to_insert holds incoming rows
+    with no stored counterpart, to_update holds (stored_row, incoming_row) pairs whose
+    `signature` differs, and to_delete holds stored rows with no incoming counterpart.
+    Rows sharing a key are paired up in order.
+    """
+    buckets = {}
+    for row in stored:
+        buckets.setdefault(key(row), []).append(row)
+
+    to_insert = []
+    to_update = []
+    for row in incoming:
+        matches = buckets.get(key(row))
+        if matches:
+            old = matches.pop(0)
+            if signature is not None and signature(old) != signature(row):
+                to_update.append((old, row))
+        else:
+            to_insert.append(row)
+
+    to_delete = [row for rows in buckets.values() for row in rows]
+    return to_insert, to_update, to_delete
+
+
+# JSON-typed columns of the product_*/template_* sub-tables
+SUB_MODEL_JSON_COLUMNS = {"options", "variant_ids", "images", "data"}
+
+
+def fetch_rows_in(cursor, select_sql, column, values):
+    """Runs `select_sql WHERE column IN (...)` for the given values and returns all rows."""
+    if not values:
+        return []
+    placeholders = ", ".join(["%s"] * len(values))
+    cursor.execute(f"{select_sql} WHERE {column} IN ({placeholders})", tuple(values))
+    return cursor.fetchall()
+
+
+def fetch_tags_by_owner(cursor, tag_table, owner_column, owner_ids):
+    """
+    {owner internal id: [tags]} for a page of products or templates, from one IN (...)
+    query on `tag_table`. Owners without tags map to an empty list.
+    """
+    tags = {owner_id: [] for owner_id in owner_ids}
+    for row in fetch_rows_in(cursor, f"SELECT {owner_column}, tag FROM {tag_table}", owner_column, list(tags)):
+        tags.setdefault(row[owner_column], []).append(row["tag"])
+    return tags
+
+
+class SubModelTables:
+    """
+    Writes the sub-model tables of products or templates, which share one layout:
+    '<prefix>_tags', '<prefix>_variants', ... each referencing the owner's internal
+    id through `owner_column`, plus placeholders and view files hanging off print
+    areas and views.
+
+    None of the methods commit; the owning DAO runs them inside its transaction.
+    """
+
+    _VARIANT_COLUMNS = ("sku", "cost", "price", "title", "grams", "is_enabled", "is_default",
+                        "is_available", "is_printify_express_eligible", "quantity", "options")
+    _IMAGE_COLUMNS = ("variant_ids", "position", "is_default", "is_selected_for_publishing", "order_index")
+    _EXTERNAL_COLUMNS = ("external_id", "handle")
+
+    def __init__(self, prefix, owner_column):
+        """
+        :param prefix: Table name prefix, "product" or "template".
+        :param owner_column: Column referencing the owner's internal id, e.g. "product_id".
+        """
+        self.prefix = prefix
+        self.owner_column = owner_column
+        owner = owner_column
+        # Column layout of each sub-table, in insert order (parents before children)
+        self.columns = {
+            f"{prefix}_tags": ("id", owner, "tag"),
+            f"{prefix}_variants": (
+                "id", owner, "variant_id", "sku", "cost", "price", "title",
+                "grams", "is_enabled", "is_default", "is_available",
+                "is_printify_express_eligible", "quantity", "options"
+            ),
+            f"{prefix}_images": (
+                "id", owner, "src", "variant_ids", "position",
+                "is_default", "is_selected_for_publishing", "order_index"
+            ),
+            f"{prefix}_print_areas": ("id", owner, "variant_ids", "background"),
+            f"{prefix}_placeholders": ("id", "print_area_id", "position", "images"),
+            f"{prefix}_external": ("id", owner, "external_id", "handle"),
+            f"{prefix}_sales_channel_properties": ("id", owner, "data"),
+            f"{prefix}_views": ("id", owner, "view_id", "label", "position"),
+            f"{prefix}_view_files": ("id", "view_id", "src", "variant_ids"),
+        }
+        # Tables keyed directly by the owner; the rest cascade from print areas and views
+        self.owned_tables = [table for table, cols in self.columns.items() if owner in cols]
+
+    def table(self, name):
+        return f"{self.prefix}_{name}"
+
+    def delete_all(self, cursor, internal_id):
+        """Deletes every sub-row of the owner (placeholders and view files cascade)."""
+        for table in self.owned_tables:
+            cursor.execute(f"DELETE FROM {table} WHERE {self.owner_column} = %s", (internal_id,))
+
+    def build_rows(self, model, internal_id):
+        """
+        Converts a product or template model's sub-models into column dicts keyed by
+        table name, laid out as in `columns`. Every row gets a fresh UUID; child rows
+        (placeholders, view files) reference their parent's new UUID. Sub-models
+        without dict data are skipped.
+        """
+        def bool_to_int(b):
+            return 1 if b else 0
+
+        owner = self.owner_column
+        t = self.table
+        rows = {table: [] for table in self.columns}
+
+        for tmodel in model.tags:
+            rows[t("tags")].append({
+                "id": str(uuid.uuid4()),
+                owner: internal_id,
+                "tag": tmodel.tag
+            })
+
+        for vmodel in model.variants:
+            vdata = vmodel.data
+            if not isinstance(vdata, dict):
+                continue
+            rows[t("variants")].append({
+                "id": str(uuid.uuid4()),
+                owner: internal_id,
+                "variant_id": vdata.get("id"),
+                "sku": vdata.get("sku"),
+                "cost": vdata.get("cost"),
+                "price": vdata.get("price"),
+                "title": vdata.get("title"),
+                "grams": vdata.get("grams"),
+                "is_enabled": bool_to_int(vdata.get("is_enabled", False)),
+                "is_default": bool_to_int(vdata.get("is_default", False)),
+                "is_available": bool_to_int(vdata.get("is_available", False)),
+                "is_printify_express_eligible": bool_to_int(vdata.get("is_printify_express_eligible", False)),
+                "quantity": vdata.get("quantity", 1),
+                "options": json.dumps(vdata.get("options", []))
+            })
+
+        for imodel in model.images:
+            idata = imodel.data
+            if not isinstance(idata, dict):
+                continue
+            rows[t("images")].append({
+                "id": str(uuid.uuid4()),
+                owner: internal_id,
+                "src": idata.get("src"),
+                "variant_ids": json.dumps(idata.get("variant_ids", [])),
+                "position": idata.get("position"),
+                "is_default": bool_to_int(idata.get("is_default", False)),
+                "is_selected_for_publishing": bool_to_int(idata.get("is_selected_for_publishing", False)),
+                "order_index": idata.get("order")
+            })
+
+        for pa_model in model.print_areas:
+            pa_data = pa_model.data
+            if not isinstance(pa_data, dict):
+                continue
+            new_area_id = str(uuid.uuid4())
+            rows[t("print_areas")].append({
+                "id": new_area_id,
+                owner: internal_id,
+                "variant_ids": json.dumps(pa_data.get("variant_ids", [])),
+                "background": pa_data.get("background")
+            })
+            for ph in pa_data.get("placeholders", []):
+                rows[t("placeholders")].append({
+                    "id": str(uuid.uuid4()),
+                    "print_area_id": new_area_id,
+                    "position": ph.get("position"),
+                    "images": json.dumps(ph.get("images", []))
+                })
+
+        if model.external and isinstance(model.external.data, dict):
+            ext_data = model.external.data
+            rows[t("external")].append({
+                "id": str(uuid.uuid4()),
+                owner: internal_id,
+                "external_id": ext_data.get("id"),
+                "handle": ext_data.get("handle")
+            })
+
+        for scp_model in model.sales_channel_properties:
+            scp_data = scp_model.data if isinstance(scp_model.data, dict) else {}
+            rows[t("sales_channel_properties")].append({
+                "id": str(uuid.uuid4()),
+                owner: internal_id,
+                "data": json.dumps(scp_data)
+            })
+
+        for v_model in model.views:
+            vdata = v_model.data
+            if not isinstance(vdata, dict):
+                continue
+            new_view_id = str(uuid.uuid4())
+            rows[t("views")].append({
+                "id": new_view_id,
+                owner: internal_id,
+                "view_id": vdata.get("id"),
+                "label": vdata.get("label"),
+                "position": vdata.get("position")
+            })
+            for vf in vdata.get("files", []):
+                rows[t("view_files")].append({
+                    "id": str(uuid.uuid4()),
+                    "view_id": new_view_id,
+                    "src": vf.get("src"),
+                    "variant_ids": json.dumps(vf.get("variant_ids", []))
+                })
+
+        return rows
+
+    def insert_rows(self, cursor, rows_by_table, batch_size=DEFAULT_BATCH_SIZE):
+        """Sends sub-model rows as batched multi-row INSERTs, parents before children."""
+        for table, columns in self.columns.items():
+            rows = rows_by_table.get(table)
+            if not rows:
+                continue
+            sql = (
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})"
+            )
+            execute_batched(cursor, sql, [tuple(row[c] for c in columns) for row in rows], batch_size)
+
+    def sync(self, cursor, internal_id, rows_by_table, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Brings the stored sub-model rows of an existing owner in line with
+        `rows_by_table` by applying only the needed inserts, updates and deletes.
+
+        Rows are matched on natural keys: variants by variant_id, images by src,
+        tags by tag text. Print areas and views are matched on their full content
+        including placeholders/files, so a changed area or view is replaced as a unit
+        (its children go with it through ON DELETE CASCADE).
+
+        Returns (inserted, updated, deleted) row counts.
+        """
+        def parse(column, value):
+            return normalize_db_value(value, column in SUB_MODEL_JSON_COLUMNS)
+
+        def signature(columns):
+            return lambda row: tuple(parse(c, row[c]) for c in columns)
+
+        def group_by(rows, column):
+            grouped = {}
+            for row in rows:
+                grouped.setdefault(row[column], []).append(row)
+            return grouped
+
+        t = self.table
+
+        # Load what is stored now
+        stored = {}
+        for table in self.owned_tables:
+            stored[table] = fetch_rows_in(cursor, f"SELECT * FROM {table}", self.owner_column, [internal_id])
+        stored[t("placeholders")] = fetch_rows_in(
+            cursor, f"SELECT * FROM {t('placeholders')}", "print_area_id",
+            [row["id"] for row in stored[t("print_areas")]]
+        )
+        stored[t("view_files")] = fetch_rows_in(
+            cursor, f"SELECT * FROM {t('view_files')}", "view_id",
+            [row["id"] for row in stored[t("views")]]
+        )
+
+        stored_placeholders = group_by(stored[t("placeholders")], "print_area_id")
+        new_placeholders = group_by(rows_by_table[t("placeholders")], "print_area_id")
+        stored_files = group_by(stored[t("view_files")], "view_id")
+        new_files = group_by(rows_by_table[t("view_files")], "view_id")
+
+        def print_area_key(children_by_parent):
+            return lambda row: canonical_json([
+                parse("variant_ids", row["variant_ids"]),
+                row["background"],
+                sorted(
+                    canonical_json([ph["position"], parse("images", ph["images"])])
+                    for ph in children_by_parent.get(row["id"], [])
+                )
+            ])
+
+        def view_key(children_by_parent):
+            return lambda row: canonical_json([
+                row["view_id"],
+                row["label"],
+                row["position"],
+                sorted(
+                    canonical_json([vf["src"], parse("variant_ids", vf["variant_ids"])])
+                    for vf in children_by_parent.get(row["id"], [])
+                )
+            ])
+
+        def pairs(name, stored_key, incoming_key, sig=None):
+            # diff_rows takes a single key function, so tag each row with its key first
+            tagged_stored = [dict(row, _key=stored_key(row)) for row in stored[t(name)]]
+            tagged_incoming = [dict(row, _key=incoming_key(row)) for row in rows_by_table[t(name)]]
+            return diff_rows(tagged_stored, tagged_incoming, lambda row: row["_key"], sig)
+
+        def scp_key(row):
+            return canonical_json(parse("data", row["data"]))
+
+        diffs = {
+            t("tags"): pairs("tags", lambda row: row["tag"], lambda row: row["tag"]),
+            t("variants"): pairs(
+                "variants", lambda row: row["variant_id"], lambda row: row["variant_id"],
+                signature(self._VARIANT_COLUMNS)
+            ),
+            t("images"): pairs(
+                "images", lambda row: row["src"], lambda row: row["src"],
+                signature(self._IMAGE_COLUMNS)
+            ),
+            t("print_areas"): pairs("print_areas", print_area_key(stored_placeholders), print_area_key(new_placeholders)),
+            t("external"): pairs(
+                "external", lambda row: None, lambda row: None,
+                signature(self._EXTERNAL_COLUMNS)
+            ),
+            t("sales_channel_properties"): pairs("sales_channel_properties", scp_key, scp_key),
+            t("views"): pairs("views", view_key(stored_files), view_key(new_files)),
+        }
+        update_columns = {
+            t("variants"): self._VARIANT_COLUMNS,
+            t("images"): self._IMAGE_COLUMNS,
+            t("external"): self._EXTERNAL_COLUMNS,
+        }
+
+        inserts = {table: [] for table in self.columns}
+        inserted = updated = deleted = 0
+        for table, (to_insert, to_update, to_delete) in diffs.items():
+            inserts[table].extend(to_insert)
+            inserted += len(to_insert)
+
+            # New print areas and views bring their children along
+            for row in to_insert:
+                if table == t("print_areas"):
+                    inserts[t("placeholders")].extend(new_placeholders.get(row["id"], []))
+                elif table == t("views"):
+                    inserts[t("view_files")].extend(new_files.get(row["id"], []))
+
+            if to_delete:
+                ids = [row["id"] for row in to_delete]
+                placeholders = ", ".join(["%s"] * len(ids))
+                cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", tuple(ids))
+                deleted += len(ids)
+
+            if to_update:
+                columns = update_columns[table]
+                sql = f"UPDATE {table} SET {', '.join(f'{c} = %s' for c in columns)} WHERE id = %s"
+                cursor.executemany(
+                    sql,
+                    [tuple(new[c] for c in columns) + (old["id"],) for old, new in to_update]
+                )
+                updated += len(to_update)
+
+        self.insert_rows(cursor, inserts, batch_size)
+        return inserted, updated, deleted
+
+
+class CountCache:
+    """
+    Thread-safe TTL cache for listing totals, keyed by the filter values.
+
+    DAOs are created per request, so each DAO class keeps one instance at class level.
+    Writes made through the DAOs in this process invalidate it right away; writes from
+    other processes show up once the entry expires, so totals are approximate for at
+    most `ttl` seconds.
+    """
+
+    def __init__(self, ttl=LISTING_COUNT_TTL_SECONDS, max_entries=1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            # Search terms are free text, so drop the oldest entry once full
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, time.monotonic())
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,100 @@
+import base64
+import binascii
+import json
+
+# Sort orders that support keyset pagination, mapped to whether they sort descending.
+# Each is paired with the primary key as a tie-breaker so positions are unique.
+# The sort columns are nullable; MySQL orders NULL below every value (first when
+# ascending, last when descending), and seek_clause follows the same order.
+KEYSET_SORTS = {
+    "updated_at": True,
+    "created_at": True,
+    "title": False,
+}
+
+
+def encode_cursor(sort_by, key, row_id, direction):
+    """
+    Builds an opaque, URL-safe token pointing just past (direction='next') or just
+    before (direction='prev') the row identified by its sort key and id.
+    """
+    payload = {
+        "s": sort_by,
+        "k": str(key) if key is not None else None,
+        "i": row_id,
+        "d": direction,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, sort_by):
+    """
+    Decodes a token produced by encode_cursor. Returns None for malformed tokens or
+    tokens issued for a different sort order, so callers restart from the first page.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("s") != sort_by:
+        return None
+    # A None key is a valid position: the boundary row had a NULL sort key
+    if payload.get("d") not in ("next", "prev") or "k" not in payload or not payload.get("i"):
+        return None
+    return payload
+
+
+def seek_clause(sort_column, id_column, descending, direction, key, row_id):
+    """
+    Returns (sql, params) selecting the rows strictly after (direction='next') or
+    before (direction='prev') the position (key, row_id) in the listing order.
+
+    The leading inclusive bound on the sort column gives MySQL a range to seek on
+    its index; the OR resolves ties on the primary key. NULL keys sort below every
+    value, as MySQL orders them, so they get their own IS NULL branches: a NULL
+    `key` means the position lies among the NULL rows.
+    """
+    # Walking forward through a descending list means smaller keys, and vice versa
+    forward = (direction == "next")
+    op = "<" if descending == forward else ">"
+    if key is None:
+        if op == ">":
+            # Past the position: later NULL rows, then every non-NULL row
+            return f"(({sort_column} IS NULL AND {id_column} > %s) OR {sort_column} IS NOT NULL)", [row_id]
+        return f"({sort_column} IS NULL AND {id_column} < %s)", [row_id]
+    sql = f"({sort_column} {op}= %s AND ({sort_column} {op} %s OR {id_column} {op} %s))"
+    if op == "<":
+        # Every NULL row lies below a non-NULL position
+        sql = f"({sql} OR {sort_column} IS NULL)"
+    return sql, [key, key, row_id]
+
+
+def order_clause(sort_column, id_column, descending, direction):
+    """
+    ORDER BY expression for a keyset page. Previous pages are read in reverse order
+    (and flipped back by the caller) so LIMIT keeps the rows nearest the cursor.
+    """
+    reverse = (direction == "prev")
+    order = "DESC" if descending != reverse else "ASC"
+    return f"{sort_column} {order}, {id_column} {order}"
+
+
+def page_cursors(sort_by, rows, key_column, id_column, direction, has_more, from_cursor):
+    """
+    Computes (next_cursor, prev_cursor) for a page of rows already in display order.
+    `has_more` says whether the query found rows beyond the page in `direction`;
+    `from_cursor` says whether the page was reached through a cursor at all.
+    """
+    if not rows:
+        return None, None
+    first, last = rows[0], rows[-1]
+    if direction == "next":
+        more_after, more_before = has_more, from_cursor
+    else:
+        more_after, more_before = True, has_more
+
+    next_cursor = encode_cursor(sort_by, last[key_column], last[id_column], "next") if more_after else None
+    prev_cursor = encode_cursor(sort_by, first[key_column], first[id_column], "prev") if more_before else None
+    return next_cursor, prev_cursor
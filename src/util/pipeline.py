@@ -0,0 +1,149 @@
+import queue
+import threading
+import time
+import traceback
+from typing import Any, Callable, Iterable, List, Optional
+
+# Marks the end of input on a stage queue; one is sent per worker
+_END = object()
+
+
+class Stage:
+    """
+    One step of a Pipeline: `workers` threads that each take an item from the stage's
+    bounded input queue, call `func`, and pass the result on to the next stage.
+
+    `func(item)` (or `func(item, resource)` when `init_worker` is given) returns the item
+    for the next stage, or None to drop it, e.g. after a failure it has already reported.
+    `init_worker()` runs once in each worker thread to create a per-thread resource such
+    as a database connection; `close_worker(resource)` releases it when the thread exits.
+    """
+
+    def __init__(self, name: str, func: Callable, workers: int = 1,
+                 init_worker: Optional[Callable[[], Any]] = None,
+                 close_worker: Optional[Callable[[Any], None]] = None):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.init_worker = init_worker
+        self.close_worker = close_worker
+
+        # Counters, updated under the pipeline lock
+        self.processed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+
+
+class Pipeline:
+    """
+    Runs items through a chain of stages, each with its own worker pool.
+
+    Stages are connected by bounded queues. When a downstream stage falls behind, its
+    queue fills up and upstream workers block on put(), so work in flight (and memory)
+    stays bounded by roughly `queue_size` items per stage plus one per worker.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in stages]
+        self._lock = threading.Lock()
+        self._running = [0] * len(stages)
+        self.results = []
+
+    def _worker(self, index: int):
+        stage = self.stages[index]
+        inbox = self.queues[index]
+        outbox = self.queues[index + 1] if index + 1 < len(self.stages) else None
+
+        resource = None
+        try:
+            if stage.init_worker:
+                resource = stage.init_worker()
+
+            while True:
+                item = inbox.get()
+                if item is _END:
+                    break
+
+                started = time.monotonic()
+                try:
+                    result = stage.func(item, resource) if stage.init_worker else stage.func(item)
+                except Exception as e:
+                    result = None
+                    with self._lock:
+                        stage.failed += 1
+                    print(f"[{stage.name}] failed: {e}")
+                    print(traceback.format_exc())
+                else:
+                    with self._lock:
+                        if result is None:
+                            stage.dropped += 1
+                        else:
+                            stage.processed += 1
+                finally:
+                    with self._lock:
+                        stage.busy_seconds += time.monotonic() - started
+
+                if result is not None:
+                    if outbox is not None:
+                        outbox.put(result)
+                    else:
+                        with self._lock:
+                            self.results.append(result)
+        except Exception as e:
+            print(f"[{stage.name}] worker stopped: {e}")
+            print(traceback.format_exc())
+            # Keep draining so upstream workers never block on a dead stage
+            while inbox.get() is not _END:
+                with self._lock:
+                    stage.failed += 1
+        finally:
+            if resource is not None and stage.close_worker:
+                try:
+                    stage.close_worker(resource)
+                except Exception as e:
+                    print(f"[{stage.name}] error releasing worker resource: {e}")
+
+            # The last worker out tells the next stage that no more input is coming
+            with self._lock:
+                self._running[index] -= 1
+                last = self._running[index] == 0
+            if last and outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    outbox.put(_END)
+
+    def run(self, items: Iterable[Any]) -> list:
+        """
+        Feeds `items` into the first stage, waits for every stage to finish, and returns
+        the items that made it through the last stage.
+        """
+        threads = []
+        for index, stage in enumerate(self.stages):
+            self._running[index] = stage.workers
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker, args=(index,), name=f"{stage.name}-{n + 1}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        # Blocks whenever the first stage's queue is full
+        for item in items:
+            self.queues[0].put(item)
+        for _ in range(self.stages[0].workers):
+            self.queues[0].put(_END)
+
+        for thread in threads:
+            thread.join()
+        return self.results
+
+    def summary(self) -> str:
+        """One line per stage with its throughput counters."""
+        lines = []
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name:<10} workers={stage.workers:<3} ok={stage.processed:<5} "
+                f"skipped={stage.dropped:<5} failed={stage.failed:<5} busy={stage.busy_seconds:.1f}s"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import List, Optional
+
+# Opt-in: completions are only cached when OPENAI_PROMPT_CACHE=1 (or a PromptCache is passed in)
+PROMPT_CACHE_ENABLED = os.getenv("OPENAI_PROMPT_CACHE", "0") == "1"
+DEFAULT_PROMPT_CACHE_PATH = os.path.expanduser(
+    os.getenv("OPENAI_PROMPT_CACHE_PATH", "~/.print_core/prompt_cache.sqlite3")
+)
+# Entries older than this are regenerated; 0 keeps them until evicted
+PROMPT_CACHE_TTL_SECONDS = float(os.getenv("OPENAI_PROMPT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# Least recently used entries beyond this count are evicted
+PROMPT_CACHE_MAX_ENTRIES = int(os.getenv("OPENAI_PROMPT_CACHE_MAX_ENTRIES", "5000"))
+# Completions sampled per prompt and served round-robin; 1 always serves the same text
+PROMPT_CACHE_VARIANTS = int(os.getenv("OPENAI_PROMPT_CACHE_VARIANTS", "1"))
+
+
+def prompt_key(model: str, system_message: str, user_message: str,
+               temperature: float, max_tokens: int, seed: Optional[int] = None, variants: int = 1) -> str:
+    """Hex SHA-256 identifying a completion request."""
+    payload = json.dumps(
+        [model, system_message, user_message, temperature, max_tokens, seed, variants],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """
+    Persistent cache of chat completions, keyed by everything that shapes the response
+    (model, system and user messages, temperature, max_tokens, seed).
+
+    Each entry holds one or more completions. With several (the "diversity" mode, see
+    PROMPT_CACHE_VARIANTS) every lookup returns the next one in turn, so repeated
+    prompts such as listing titles stay varied while still being paid for only once.
+
+    Entries expire after `ttl_seconds` and the least recently used ones are evicted once
+    there are more than `max_entries`. Like UploadCache, each operation opens its own
+    SQLite connection, so one instance can be shared across threads and processes.
+    """
+
+    def __init__(self, path: str = DEFAULT_PROMPT_CACHE_PATH, ttl_seconds: float = PROMPT_CACHE_TTL_SECONDS,
+                 max_entries: int = PROMPT_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS prompt_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                responses TEXT NOT NULL,
+                next_index INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_prompt_responses_last_used ON prompt_responses (last_used_at)")
+
+    def _connect(self):
+        # Autocommit mode, so lookups can take the write lock up front with BEGIN IMMEDIATE
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns a cached completion for the key, or None on a miss or an expired entry.
+        Entries with several completions return the next one on each call.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # The round-robin index is read and advanced atomically across processes
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT responses, next_index, created_at FROM prompt_responses WHERE cache_key = ?",
+                    (key,)
+                ).fetchone()
+                if not row:
+                    conn.execute("COMMIT")
+                    return None
+                if self._expired(row[2], now):
+                    conn.execute("DELETE FROM prompt_responses WHERE cache_key = ?", (key,))
+                    conn.execute("COMMIT")
+                    return None
+
+                responses = json.loads(row[0])
+                index = row[1] % len(responses)
+                conn.execute(
+                    "UPDATE prompt_responses SET next_index = ?, last_used_at = ? WHERE cache_key = ?",
+                    ((index + 1) % len(responses), now, key)
+                )
+                conn.execute("COMMIT")
+                return responses[index]
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def put(self, key: str, model: str, responses: List[str], served: int = 0):
+        """
+        Stores (or replaces) the completions for a key. `served` is how many of them the
+        caller already returned, so the next lookup continues with the one after.
+        """
+        responses = [response for response in responses if response]
+        if not responses:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO prompt_responses "
+                    "(cache_key, model, responses, next_index, created_at, last_used_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, json.dumps(responses), served % len(responses), now, now)
+                )
+                # Least recently used entries beyond the size bound go first
+                conn.execute(
+                    "DELETE FROM prompt_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM prompt_responses ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str):
+        """Forgets an entry so the next request regenerates it."""
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM prompt_responses WHERE cache_key = ?", (key,))
+
+    def clear(self):
+        """Removes every cached completion."""
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM prompt_responses")
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> Optional[PromptCache]:
+    """
+    Returns the process-wide PromptCache when enabled with OPENAI_PROMPT_CACHE=1, or None
+    when it is disabled or the cache file cannot be opened (completions are then always
+    requested from the API).
+    """
+    global _shared_cache
+    if not PROMPT_CACHE_ENABLED:
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                try:
+                    _shared_cache = PromptCache()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Prompt cache unavailable, generating without it: {e}")
+                    return None
+    return _shared_cache
@@ -0,0 +1,48 @@
+import os
+import re
+
+# Must match the server's innodb_ft_min_token_size; shorter words are not indexed
+FULLTEXT_MIN_TOKEN_LENGTH = int(os.getenv("FULLTEXT_MIN_TOKEN_LENGTH", "3"))
+
+# InnoDB's default stopword list. A required (+) stopword would make a boolean
+# search match nothing, so these are dropped from the query.
+INNODB_STOPWORDS = {
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for",
+    "from", "how", "i", "in", "is", "it", "la", "of", "on", "or", "that", "the",
+    "this", "to", "was", "what", "when", "where", "who", "will", "with", "und", "www",
+}
+
+
+def build_boolean_query(search_term):
+    """
+    Turns free text into a MySQL boolean-mode query where every word is required
+    and matched as a prefix, e.g. "trippy phon" -> "+trippy* +phon*".
+    Boolean operators typed by the user are stripped. Returns None when no word
+    is long enough to be in the FULLTEXT index.
+    """
+    words = [
+        word for word in re.findall(r"\w+", search_term.lower())
+        if len(word) >= FULLTEXT_MIN_TOKEN_LENGTH and word not in INNODB_STOPWORDS
+    ]
+    if not words:
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+
+def search_clause(columns, search_term):
+    """
+    Builds the search predicate for `columns` (which must carry a FULLTEXT index).
+
+    Returns (condition_sql, condition_params, relevance_sql, relevance_params).
+    relevance_sql scores rows for ORDER BY ... DESC; it is None when the term is
+    too short for the index and the predicate falls back to a LIKE scan.
+    """
+    column_list = ", ".join(columns)
+    boolean_query = build_boolean_query(search_term)
+    if boolean_query is None:
+        pattern = f"%{search_term}%"
+        condition = "(" + " OR ".join(f"{column} LIKE %s" for column in columns) + ")"
+        return condition, [pattern] * len(columns), None, []
+
+    match_sql = f"MATCH({column_list}) AGAINST (%s IN BOOLEAN MODE)"
+    return match_sql, [boolean_query], match_sql, [boolean_query]
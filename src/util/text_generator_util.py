@@ -1,15 +1,26 @@
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+# How generate_product_content produces listing text: "combined" or "parallel"
+CONTENT_MODES = ("combined", "parallel")
+DEFAULT_CONTENT_MODE = os.getenv("TEXT_GENERATION_MODE", "combined")
 
 class TextGenerator:
     """Handles text generation tasks using OpenAIClient."""
 
-    def __init__(self, client):
+    def __init__(self, client, content_mode=DEFAULT_CONTENT_MODE):
         """
         Initializes the TextGenerator with an OpenAIClient.
         
         :param client: An instance of OpenAIClient.
+        :param content_mode: Default mode for generate_product_content, "combined" or "parallel".
         """
+        if content_mode not in CONTENT_MODES:
+            raise ValueError(f"Invalid content mode '{content_mode}'. Expected one of: {', '.join(CONTENT_MODES)}")
         self.client = client
+        self.content_mode = content_mode
 
     def generate_psychedelic_prompt(self):
         """Generates a creative prompt for psychedelic and fractal art."""
@@ -39,20 +50,26 @@ class TextGenerator:
             f"Format your response as a JSON array with exactly 5 strings, each string being a bullet point."
         )
         json_response = self.client.generate_text(system_message, prompt, max_tokens=350, temperature=0.7)
-        
+        return self._parse_bullets(json_response, product_type)
+
+    @staticmethod
+    def _parse_bullets(json_response, product_type):
+        """Parses a JSON array of bullet points, padding or trimming it to exactly 5."""
         try:
-            # Parse the JSON response
-            import json
-            # Clean up the response in case there's extra text around the JSON
-            json_text = json_response.strip()
-            if not json_text.startswith('['):
-                # Try to extract JSON array if it's not the entire response
-                start_idx = json_text.find('[')
-                end_idx = json_text.rfind(']') + 1
-                if start_idx >= 0 and end_idx > start_idx:
-                    json_text = json_text[start_idx:end_idx]
-            
-            bullet_points = json.loads(json_text)
+            if isinstance(json_response, list):
+                # Already parsed, e.g. from a combined content response
+                bullet_points = [str(point) for point in json_response]
+            else:
+                # Clean up the response in case there's extra text around the JSON
+                json_text = json_response.strip()
+                if not json_text.startswith('['):
+                    # Try to extract JSON array if it's not the entire response
+                    start_idx = json_text.find('[')
+                    end_idx = json_text.rfind(']') + 1
+                    if start_idx >= 0 and end_idx > start_idx:
+                        json_text = json_text[start_idx:end_idx]
+
+                bullet_points = json.loads(json_text)
             
             # Ensure we have exactly 5 bullet points
             if len(bullet_points) > 5:
@@ -82,9 +99,84 @@ class TextGenerator:
             f"You have a strong focus on SEO. Using the provided description, generate a single unique title for a {store_name} listing that is under 125 characters."
         )
         title = self.client.generate_text(system_message, description, max_tokens=60, temperature=0.7)
+        return self._format_title(title, product_type)
 
+    @staticmethod
+    def _format_title(title, product_type):
+        """Strips digits, quotes, dots and dashes and prefixes the product type."""
         if title:
             clean_title = re.sub(r'[\d"|\']', '', title).replace(".", "").replace("-", "")
             return f"{product_type.capitalize()} - {clean_title}"
         return None
 
+    def generate_product_content(self, prompt, store_name, product_type, listing_product_type=None, mode=None):
+        """
+        Generates the description, title and bullet points for a product together.
+
+        mode="combined" asks for all three in a single JSON completion (one round trip).
+        mode="parallel" generates the description first, then the title and bullets
+        concurrently (two round trips). A combined response that cannot be parsed falls
+        back to the parallel mode. Defaults to the generator's content_mode.
+
+        :param listing_product_type: Product type used for the title and bullets when it
+            differs from the one in the description (e.g. "phone case" vs "iphone 16 case").
+        :return: A dict with 'description', 'title' and 'bullet_points'.
+        """
+        mode = mode or self.content_mode
+        listing_product_type = listing_product_type or product_type
+        if mode == "combined":
+            content = self._generate_combined_content(prompt, store_name, product_type, listing_product_type)
+            if content:
+                return content
+            print("Combined generation failed; generating description, title and bullets separately")
+
+        description = self.generate_product_description(prompt, store_name, product_type)
+
+        # Title and bullets both depend only on the description, so request them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            title_future = executor.submit(self.generate_product_title, description, store_name, listing_product_type)
+            bullets_future = executor.submit(self.generate_product_bullets, description, store_name, listing_product_type)
+            return {
+                "description": description,
+                "title": title_future.result(),
+                "bullet_points": bullets_future.result(),
+            }
+
+    def _generate_combined_content(self, prompt, store_name, product_type, listing_product_type):
+        """Single completion returning description, title and bullets as one JSON object; None on failure."""
+        system_message = (
+            f"You are an AI that helps generate creative and SEO-focused listings for {product_type}s sold on {store_name}. "
+            f"You have a strong focus on {store_name} SEO. Using the description of the products design, write:\n"
+            f"- description: a unique, engaging, and SEO-heavy product description\n"
+            f"- title: a single unique title for a {store_name} listing, under 125 characters, based on that description\n"
+            f"- bullet_points: exactly 5 unique, engaging, and SEO-heavy bullet points, each under 300 characters and highlighting a different aspect of the product\n"
+            f"Respond with only a JSON object with the keys \"description\", \"title\" and \"bullet_points\" (an array of 5 strings)."
+        )
+        response = self.client.generate_text(system_message, prompt, max_tokens=1100, temperature=0.7)
+        if not response:
+            return None
+
+        try:
+            # Clean up the response in case there's extra text around the JSON
+            json_text = response.strip()
+            start_idx = json_text.find('{')
+            end_idx = json_text.rfind('}') + 1
+            if start_idx >= 0 and end_idx > start_idx:
+                json_text = json_text[start_idx:end_idx]
+            content = json.loads(json_text)
+
+            description = content.get("description")
+            title = content.get("title")
+            if not description or not title or not isinstance(content.get("bullet_points"), list):
+                raise ValueError("missing description, title or bullet_points")
+
+            return {
+                "description": description,
+                "title": self._format_title(title, listing_product_type),
+                "bullet_points": self._parse_bullets(content["bullet_points"], listing_product_type),
+            }
+        except Exception as e:
+            print(f"Error parsing combined product content: {str(e)}")
+            print(f"Raw response: {response}")
+            return None
+
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+# Local SQLite file mapping image content hashes to Printify upload responses
+DEFAULT_UPLOAD_CACHE_PATH = os.path.expanduser(
+    os.getenv("PRINTIFY_UPLOAD_CACHE_PATH", "~/.print_core/upload_cache.sqlite3")
+)
+UPLOAD_CACHE_ENABLED = os.getenv("PRINTIFY_UPLOAD_CACHE", "1") == "1"
+
+# Bytes read per step while hashing, so large print files are never fully in memory
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Content-addressed cache of Printify image uploads.
+
+    Entries are keyed by the SHA-256 of the file bytes (so renamed or moved copies still
+    hit) and by the Printify account, since uploaded image ids are only valid for the
+    account that uploaded them. Each operation opens its own SQLite connection, so one
+    instance can be shared across threads and processes.
+    """
+
+    def __init__(self, path: str = DEFAULT_UPLOAD_CACHE_PATH, account: Optional[str] = None):
+        self.path = path
+        # Never store the API key itself, only a short fingerprint of it
+        api_key = account if account is not None else os.getenv("PRINTIFY_API_KEY", "")
+        self.account = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS image_uploads (
+                sha256 TEXT NOT NULL,
+                account TEXT NOT NULL,
+                file_name TEXT,
+                response TEXT NOT NULL,
+                uploaded_at REAL NOT NULL,
+                PRIMARY KEY (sha256, account)
+            )
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """Returns the stored upload response for a content hash, or None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT response FROM image_uploads WHERE sha256 = ? AND account = ?",
+                (sha256, self.account)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, sha256: str, response: Dict[str, Any], file_name: Optional[str] = None):
+        """Stores (or replaces) the upload response for a content hash."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO image_uploads (sha256, account, file_name, response, uploaded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sha256, self.account, file_name, json.dumps(response), time.time())
+            )
+
+    def delete(self, sha256: str):
+        """Forgets an entry, e.g. after the image was removed from the Printify library."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM image_uploads WHERE sha256 = ? AND account = ?",
+                (sha256, self.account)
+            )
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_upload_cache() -> Optional[UploadCache]:
+    """
+    Returns the process-wide UploadCache, or None when disabled with PRINTIFY_UPLOAD_CACHE=0
+    or when the cache file cannot be opened (uploads then simply go to the network).
+    """
+    global _shared_cache
+    if not UPLOAD_CACHE_ENABLED:
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                try:
+                    _shared_cache = UploadCache()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Upload cache unavailable, uploading without it: {e}")
+                    return None
+    return _shared_cache
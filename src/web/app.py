@@ -17,14 +17,18 @@ if ENV_FILE:
 sys.path.append(str(Path(__file__).parent.parent))
 
 from config.db_connection import DBConnection
+from config.migrations import run_migrations
 from dao.template_dao import TemplateDAO
 from dao.product_dao import ProductDAO
+from dao.catalog_stats_dao import CatalogStatsDAO, catalog_summary
 from controllers import all_blueprints
 
 # Create Flask app with standard template folder
 app = Flask(__name__, template_folder='templates')
 # Use any available secret key from environment or generate random key
 app.secret_key = os.environ.get("AUTH0_CLIENT_SECRET", os.urandom(24))
+# Let a fronting nginx/Apache send thumbnail files itself (X-Sendfile) when it is configured for it
+app.config['USE_X_SENDFILE'] = os.environ.get("USE_X_SENDFILE", "0") == "1"
 
 # Add hasattr function to Jinja2 environment
 app.jinja_env.globals['hasattr'] = hasattr
@@ -41,34 +45,24 @@ def inject_current_app():
 for blueprint, url_prefix in all_blueprints:
     app.register_blueprint(blueprint, url_prefix=url_prefix)
 
+# Bring the schema up to date once at startup rather than on every DAO construction.
+# Set DB_MIGRATE_ON_STARTUP=0 when migrations are run separately at deploy time.
+if os.environ.get("DB_MIGRATE_ON_STARTUP", "1") == "1":
+    run_migrations(host="localhost", user="root", password="", database="print_core_db")
+
 @app.route('/')
 def index():
     """Main homepage with navigation to templates and products"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Get stats for the dashboard from the catalog_stats rollup
+    stats = catalog_summary(CatalogStatsDAO(db_conn).fetch_stats())
     
-    try:
-        # Initialize the DAOs
-        template_dao = TemplateDAO(db_conn)
-        product_dao = ProductDAO(db_conn)
-        
-        # Get stats for the dashboard
-        stats = {
-            "total_templates": template_dao.count_templates(),
-            "total_products": product_dao.count_products(),
-            "published_products": product_dao.count_products(status="PUBLISHED"),
-            "unique_tags": 0  # We'd need to count this across both templates and products
-        }
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('logged_out/index.html', stats=stats, now=now)
+    # Include current year for copyright in footer
+    now = datetime.now()
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    return render_template('logged_out/index.html', stats=stats, now=now)
 
 # Redirects for backward compatibility
 @app.route('/templates')
@@ -94,14 +88,15 @@ def product_detail_redirect(product_id):
 # Database connection handling
 @app.before_request
 def before_request():
-    """Initialize database connection for the request"""
-    # Store database connection in Flask's g object for the duration of the request
+    """Check out a pooled database connection for the request"""
+    # Store database connection in Flask's g object for the duration of the request.
+    # The underlying connection comes from the shared pool, so no handshake is paid here.
     g.db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
     g.db_conn.connect()
 
 @app.teardown_request
 def teardown_request(exception):
-    """Close database connection after request"""
+    """Return the database connection to the pool after request"""
     db_conn = g.pop('db_conn', None)
     if db_conn is not None:
         db_conn.close()
@@ -0,0 +1,87 @@
+from flask import Blueprint, request, abort, g, send_file, jsonify, url_for
+import os
+
+from services.printify_service import PrintifyService
+from services.mockup_cache_service import MockupCacheService
+from services.thumbnail_service import ThumbnailService, THUMBNAIL_FORMATS, snap_width
+
+# Create media blueprint
+media_bp = Blueprint('media', __name__)
+
+# Default shop ID
+DEFAULT_SHOP_ID = "20510104"
+
+# Thumbnails are named after their source image, so browsers may keep them a long time
+THUMBNAIL_MAX_AGE = int(os.getenv("THUMBNAIL_MAX_AGE", str(7 * 24 * 3600)))
+
+# How long /api/mockups waits for lookups still running before answering
+MOCKUP_API_WAIT_SECONDS = float(os.getenv("MOCKUP_API_WAIT_SECONDS", "5"))
+# Most ids accepted by one /api/mockups call
+MOCKUP_API_MAX_IDS = 50
+
+@media_bp.route('/thumb/<printify_id>')
+def thumbnail(printify_id):
+    """Serve a resized mockup for a product or template from the local thumbnail store"""
+    kind = request.args.get('kind', 'product')
+    if kind not in ('product', 'template'):
+        abort(400)
+    width = snap_width(request.args.get('w', 200))
+
+    # WebP when asked for or when the browser accepts it, JPEG otherwise
+    fmt = request.args.get('format')
+    if fmt not in THUMBNAIL_FORMATS:
+        fmt = 'webp' if 'image/webp' in request.headers.get('Accept', '') else 'jpeg'
+
+    # Look up the full-size mockup in the shared cache only. Listing pages and /api/mockups
+    # fill it, so a miss is a 404 rather than a Printify call holding this worker for any id
+    mockup_service = MockupCacheService(g.db_conn)
+    source_url = mockup_service.get_mockup_urls([printify_id], kind).get(printify_id)
+    if not source_url:
+        abort(404)
+
+    thumbnail_service = ThumbnailService()
+    path = thumbnail_service.get_thumbnail(printify_id, source_url, width, fmt)
+    if not path:
+        abort(404)
+
+    # send_file hands the open file to the server (sendfile, or X-Sendfile when enabled)
+    # and answers If-None-Match with 304 using the ETag
+    etag = f"{thumbnail_service.source_key(source_url)}-{width}-{fmt}"
+    response = send_file(
+        path,
+        mimetype=THUMBNAIL_FORMATS[fmt][1],
+        conditional=True,
+        etag=etag,
+        max_age=THUMBNAIL_MAX_AGE
+    )
+    response.cache_control.public = True
+    if not request.args.get('format'):
+        response.vary.add('Accept')
+    return response
+
+@media_bp.route('/api/mockups')
+def api_mockups():
+    """API endpoint resolving mockups that a listing page rendered as placeholders"""
+    kind = request.args.get('kind', 'product')
+    if kind not in ('product', 'template'):
+        abort(400)
+    printify_ids = [pid for pid in request.args.get('ids', '').split(',') if pid][:MOCKUP_API_MAX_IDS]
+
+    # Joins lookups the listing page started; anything still running is reported as pending.
+    # Only ids of stored products or templates may reach Printify; others get cached entries only
+    mockup_service = MockupCacheService(g.db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending = mockup_service.resolve_known_mockups(printify_ids, kind, deadline=MOCKUP_API_WAIT_SECONDS)
+
+    mockups = {}
+    for printify_id in printify_ids:
+        mockup_url = mockup_urls.get(printify_id)
+        mockups[printify_id] = {
+            "mockup_url": mockup_url,
+            "thumb_url": url_for('media.thumbnail', printify_id=printify_id, kind=kind, w=400) if mockup_url else None
+        }
+
+    # Return JSON response
+    return jsonify({
+        "mockups": mockups,
+        "pending": pending
+    })
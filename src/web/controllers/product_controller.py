@@ -3,17 +3,16 @@ from datetime import datetime, timedelta
 import math
 import os
 
-from config.db_connection import DBConnection
 from dao.product_dao import ProductDAO
 from dao.template_dao import TemplateDAO
+from dao.catalog_stats_dao import CatalogStatsDAO, catalog_summary, tag_cloud_sizes
 from services.printify_service import PrintifyService
+from services.mockup_cache_service import MockupCacheService, MOCKUP_PREFETCH_DEADLINE_SECONDS
+from util.pagination_util import KEYSET_SORTS
 
 # Create product blueprint
 product_bp = Blueprint('product', __name__)
 
-# Cache for mockup images
-mockup_cache = {}
-
 # Default shop ID
 DEFAULT_SHOP_ID = "20510104"
 
@@ -23,337 +22,260 @@ PRODUCTS_PER_PAGE = 12
 @product_bp.route('/dashboard/home')
 def index():
     """Main homepage with navigation to templates and products"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Get stats for the dashboard from the catalog_stats rollup
+    stats = catalog_summary(CatalogStatsDAO(db_conn).fetch_stats())
     
-    try:
-        # Initialize the DAOs
-        template_dao = TemplateDAO(db_conn)
-        product_dao = ProductDAO(db_conn)
-        
-        # Get stats for the dashboard
-        stats = {
-            "total_templates": template_dao.count_templates(),
-            "total_products": product_dao.count_products(),
-            "published_products": product_dao.count_products(status="PUBLISHED"),
-            "unique_tags": 0  # We'd need to count this across both templates and products
-        }
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('logged_out/index.html', stats=stats, now=now)
+    # Include current year for copyright in footer
+    now = datetime.now()
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    return render_template('logged_out/index.html', stats=stats, now=now)
 
 @product_bp.route('/dashboard')
 def dashboard():
     """Product dashboard that displays product statistics and recent products"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get stats for the dashboard
-        total_products = product_dao.count_products()
-        published_products = product_dao.count_products(status="PUBLISHED")
-        
-        # Get recent products
-        recent_products = product_dao.fetch_products_paginated(limit=6, offset=0)
-        
-        # Calculate average price
-        avg_price = 0
-        total_with_price = 0
-        
-        # Get unique tags and count them
-        unique_tags = set()
-        tag_counts = {}
-        
-        for product in recent_products:
-            for tag in product.tags:
-                if tag and hasattr(tag, 'tag') and tag.tag:
-                    unique_tags.add(tag.tag)
-                    if tag.tag in tag_counts:
-                        tag_counts[tag.tag] += 1
-                    else:
-                        tag_counts[tag.tag] = 1
-            
-            # Add to average price calculation if the product has a price
-            if hasattr(product, 'price') and product.price:
-                try:
-                    price_value = float(product.price)
-                    avg_price += price_value
-                    total_with_price += 1
-                except (ValueError, TypeError):
-                    pass
-        
-        # Calculate the average price if we have products with prices
-        if total_with_price > 0:
-            avg_price = avg_price / total_with_price
-        
-        # Format the recent products for display
-        products_for_display = []
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        for product in recent_products:
-            # Check if we have a mockup image cached
-            mockup_url = None
-            product_id = product.id
-            
-            if product_id in mockup_cache:
-                mockup_url = mockup_cache[product_id]
-            else:
-                # Try to fetch mockup from Printify
-                try:
-                    product_details = printify_service.get_product_details(product_id)
-                    if product_details and "images" in product_details and len(product_details["images"]) > 0:
-                        # Get the first mockup image
-                        mockup_url = product_details["images"][0]["src"]
-                        # Cache it
-                        mockup_cache[product_id] = mockup_url
-                except Exception as e:
-                    print(f"Error fetching mockup for product {product_id}: {str(e)}")
-            
-            # Add to the display list
-            products_for_display.append({
-                "id": product_id,
-                "title": product.title or "Untitled Product",
-                "description": product.description or "No description",
-                "mockup_url": mockup_url,
-                "created_at": datetime.strptime(product.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.created_at, str) else product.created_at,
-                "updated_at": datetime.strptime(product.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.updated_at, str) else product.updated_at,
-                "tags": product.tags,
-                "status": product.status,
-                "price": product.price
-            })
-        
-        # Stats for the dashboard
-        stats = {
-            "total_products": total_products,
-            "published_products": published_products,
-            "unique_tags": len(unique_tags),
-            "tag_counts": tag_counts,
-            "avg_price": avg_price
-        }
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('dashboard/products/product_dashboard.html', stats=stats, recent_products=products_for_display, now=now)
+    # Stats come pre-aggregated from the catalog_stats rollup, covering every product
+    product_stats = CatalogStatsDAO(db_conn).fetch_stats().get("product", {})
+    
+    # Get recent products as listing summaries; cards need no variants or images
+    recent_products, _ = product_dao.fetch_product_summaries(limit=6, offset=0)
+    
+    # Format the recent products for display
+    products_for_display = []
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # Cached mockups arrive with the summaries; missing ones are fetched from Printify in parallel,
+    # and any still loading at the deadline render as placeholders filled in by /media/api/mockups
+    mockup_service = MockupCacheService(db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending_mockups = mockup_service.resolve_summary_mockups(
+        recent_products, "product", deadline=MOCKUP_PREFETCH_DEADLINE_SECONDS
+    )
+    
+    for product in recent_products:
+        product_id = product.id
+        mockup_url = mockup_urls.get(product_id)
+        
+        # Add to the display list
+        products_for_display.append({
+            "id": product_id,
+            "title": product.title or "Untitled Product",
+            "description": product.description or "No description",
+            "mockup_url": mockup_url,
+            # Small resized copy for cards, served from local disk
+            "thumb_url": url_for('media.thumbnail', printify_id=product_id, kind='product', w=400) if mockup_url else None,
+            "mockup_pending": product_id in pending_mockups,
+            "created_at": datetime.strptime(product.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.created_at, str) else product.created_at,
+            "updated_at": datetime.strptime(product.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.updated_at, str) else product.updated_at,
+            "tags": product.tags,
+            "status": product.status,
+            "price": product.price
+        })
+    
+    # Stats for the dashboard
+    priced_products = product_stats.get("priced", 0)
+    stats = {
+        "total_products": product_stats.get("total", 0),
+        "published_products": product_stats.get("status", {}).get("PUBLISHED", 0),
+        "unique_tags": product_stats.get("unique_tags", 0),
+        "tag_counts": product_stats.get("tag", {}),
+        "tag_font_sizes": tag_cloud_sizes(product_stats.get("tag", {})),
+        "avg_price": product_stats.get("price_sum", 0) / priced_products if priced_products else 0,
+        "price_distribution": product_stats.get("price_bucket", {}),
+        "recent_updates": product_stats.get("updated_7d", 0)
+    }
+    
+    # Include current year for copyright in footer
+    now = datetime.now()
+    
+    return render_template('dashboard/products/product_dashboard.html', stats=stats, recent_products=products_for_display, now=now)
 
 @product_bp.route('/products')
 def products():
     """Display products with pagination"""
     # Get pagination parameters
     page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     search = request.args.get('search', '')
     status = request.args.get('status', '')
-    sort_by = request.args.get('sort', 'created_at')
+    # Rank by search relevance unless the user picked a sort order
+    sort_by = request.args.get('sort', 'relevance' if search else 'created_at')
+    # Seek from a cursor unless an explicit page number or relevance ranking asks for OFFSET paging
+    use_cursor = sort_by in KEYSET_SORTS and (cursor or 'page' not in request.args)
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get total count of products for pagination
-        total_products = product_dao.count_products(search_term=search, status=status)
-        total_pages = math.ceil(total_products / PRODUCTS_PER_PAGE)
-        
-        # Calculate offset
+    # Get product summaries for current page together with the total count for pagination
+    next_cursor = prev_cursor = None
+    if use_cursor:
+        products_data, total_products, next_cursor, prev_cursor = product_dao.fetch_product_summaries_page(
+            limit=PRODUCTS_PER_PAGE,
+            cursor=cursor,
+            search_term=search,
+            status=status,
+            sort_by=sort_by
+        )
+    else:
         offset = (page - 1) * PRODUCTS_PER_PAGE
-        
-        # Get products for current page
-        products_data = product_dao.fetch_products_paginated(
+        products_data, total_products = product_dao.fetch_product_summaries(
             limit=PRODUCTS_PER_PAGE, 
             offset=offset,
             search_term=search,
             status=status,
             sort_by=sort_by
         )
-        
-        # Log the products for debugging
-        print(f"Found {len(products_data)} products for page {page}")
-        
-        # Format the data for display
-        products_for_display = []
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        for product in products_data:
-            # Check if we have a mockup image cached
-            mockup_url = None
-            product_id = product.id
-            
-            if product_id in mockup_cache:
-                mockup_url = mockup_cache[product_id]
-            else:
-                # Try to fetch mockup from Printify
-                try:
-                    product_details = printify_service.get_product_details(product_id)
-                    if product_details and "images" in product_details and len(product_details["images"]) > 0:
-                        # Get the first mockup image
-                        mockup_url = product_details["images"][0]["src"]
-                        # Cache it
-                        mockup_cache[product_id] = mockup_url
-                except Exception as e:
-                    print(f"Error fetching mockup for product {product_id}: {str(e)}")
-            
-            # Add to the display list
-            products_for_display.append({
-                "id": product_id,
-                "title": product.title or "Untitled Product",
-                "description": product.description or "No description",
-                "mockup_url": mockup_url,
-                "created_at": datetime.strptime(product.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.created_at, str) else product.created_at,
-                "updated_at": datetime.strptime(product.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.updated_at, str) else product.updated_at,
-                "tags": product.tags,
-                "status": product.status,
-                "price": product.price
-            })
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('dashboard/products/products.html',
-                               products=products_for_display,
-                               total_products=total_products,
-                               page=page, 
-                               total_pages=total_pages,
-                               now=now)
-    
-    finally:
-        # Close the database connection
-        db_conn.close()
+    total_pages = math.ceil(total_products / PRODUCTS_PER_PAGE)
+    
+    # Log the products for debugging
+    print(f"Found {len(products_data)} products for page {page}")
+    
+    # Format the data for display
+    products_for_display = []
+    
+    # Cached mockups arrive with the summaries; missing ones are fetched from Printify in parallel,
+    # and any still loading at the deadline render as placeholders filled in by /media/api/mockups
+    mockup_service = MockupCacheService(db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending_mockups = mockup_service.resolve_summary_mockups(
+        products_data, "product", deadline=MOCKUP_PREFETCH_DEADLINE_SECONDS
+    )
+    
+    for product in products_data:
+        product_id = product.id
+        mockup_url = mockup_urls.get(product_id)
+        
+        # Add to the display list
+        products_for_display.append({
+            "id": product_id,
+            "title": product.title or "Untitled Product",
+            "description": product.description or "No description",
+            "mockup_url": mockup_url,
+            # Small resized copy for cards, served from local disk
+            "thumb_url": url_for('media.thumbnail', printify_id=product_id, kind='product', w=400) if mockup_url else None,
+            "mockup_pending": product_id in pending_mockups,
+            "created_at": datetime.strptime(product.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.created_at, str) else product.created_at,
+            "updated_at": datetime.strptime(product.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(product.updated_at, str) else product.updated_at,
+            "tags": product.tags,
+            "status": product.status,
+            "price": product.price
+        })
+    
+    # Include current year for copyright in footer
+    now = datetime.now()
+    
+    return render_template('dashboard/products/products.html',
+                           products=products_for_display,
+                           total_products=total_products,
+                           page=page, 
+                           total_pages=total_pages,
+                           next_cursor=next_cursor,
+                           prev_cursor=prev_cursor,
+                           now=now)
 
 @product_bp.route('/product/<product_id>')
 def product_detail(product_id):
     """Display details for a specific product"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
+    
+    # Get the product details
+    product = product_dao.get_product_by_id(product_id)
+    
+    if not product:
+        flash('Product not found', 'error')
+        return redirect(url_for('product.products'))
+    
+    # Initialize Printify service for mockups
+    printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
     
+    # Try to fetch mockup from Printify
+    mockup_urls = []
     try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get the product details
-        product = product_dao.get_product_by_id(product_id)
-        
-        if not product:
-            flash('Product not found', 'error')
-            return redirect(url_for('product.products'))
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        # Try to fetch mockup from Printify
-        mockup_urls = []
-        try:
-            product_details = printify_service.get_product_details(product_id)
-            if product_details and "images" in product_details:
-                for image in product_details["images"]:
-                    mockup_urls.append(image["src"])
-        except Exception as e:
-            print(f"Error fetching mockups for product {product_id}: {str(e)}")
-        
-        # Get current time for footer
-        now = datetime.now()
-        
-        return render_template('dashboard/products/product_detail.html',
-                              product=product,
-                              mockup_urls=mockup_urls,
-                              now=now)
-    
-    finally:
-        # Close the database connection
-        db_conn.close()
+        product_details = printify_service.get_product_details(product_id)
+        if product_details and "images" in product_details:
+            for image in product_details["images"]:
+                mockup_urls.append(image["src"])
+    except Exception as e:
+        print(f"Error fetching mockups for product {product_id}: {str(e)}")
+    
+    # Get current time for footer
+    now = datetime.now()
+    
+    return render_template('dashboard/products/product_detail.html',
+                          product=product,
+                          mockup_urls=mockup_urls,
+                          now=now)
 
 @product_bp.route('/edit/<product_id>')
 def edit_product(product_id):
     """Display form to edit a product"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get the product details
-        product = product_dao.get_product_by_id(product_id)
-        
-        if not product:
-            flash('Product not found', 'error')
-            return redirect(url_for('product.products'))
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('dashboard/products/edit_product.html',
-                              product=product,
-                              now=now)
+    # Get the product details
+    product = product_dao.get_product_by_id(product_id)
+    
+    if not product:
+        flash('Product not found', 'error')
+        return redirect(url_for('product.products'))
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # Include current year for copyright in footer
+    now = datetime.now()
+    
+    return render_template('dashboard/products/edit_product.html',
+                          product=product,
+                          now=now)
 
 @product_bp.route('/update/<product_id>', methods=['POST'])
 def update_product(product_id):
     """Update a product"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get the product details
-        product = product_dao.get_product_by_id(product_id)
-        
-        if not product:
-            flash('Product not found', 'error')
-            return redirect(url_for('product.products'))
-        
-        # Update product with form data
-        product.title = request.form.get('title', product.title)
-        product.description = request.form.get('description', product.description)
-        product.blueprint_id = request.form.get('blueprint_id', product.blueprint_id)
-        product.price = request.form.get('price', product.price)
-        product.status = request.form.get('status', product.status)
-        
-        # Update tags if provided
-        tags_input = request.form.get('tags', '')
-        if tags_input:
-            # Split by comma and create tag objects
-            tag_list = [tag.strip() for tag in tags_input.split(',') if tag.strip()]
-            product.tags = [{"tag": tag} for tag in tag_list]
-        
-        # Save the updated product
-        product_dao.update_product(product)
-        
-        flash('Product updated successfully', 'success')
-        return redirect(url_for('product.product_detail', product_id=product_id))
+    # Get the product details
+    product = product_dao.get_product_by_id(product_id)
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    if not product:
+        flash('Product not found', 'error')
+        return redirect(url_for('product.products'))
+    
+    # Update product with form data
+    product.title = request.form.get('title', product.title)
+    product.description = request.form.get('description', product.description)
+    product.blueprint_id = request.form.get('blueprint_id', product.blueprint_id)
+    product.price = request.form.get('price', product.price)
+    product.status = request.form.get('status', product.status)
+    
+    # Update tags if provided
+    tags_input = request.form.get('tags', '')
+    if tags_input:
+        # Split by comma and create tag objects
+        tag_list = [tag.strip() for tag in tags_input.split(',') if tag.strip()]
+        product.tags = [{"tag": tag} for tag in tag_list]
+    
+    # Save the updated product
+    product_dao.update_product(product)
+    
+    flash('Product updated successfully', 'success')
+    return redirect(url_for('product.product_detail', product_id=product_id))
 
 @product_bp.route('/delete')
 def delete_product():
@@ -364,23 +286,17 @@ def delete_product():
         flash('Product ID is required', 'error')
         return redirect(url_for('product.products'))
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Delete the product
-        product_dao.delete_product(product_id)
-        
-        flash('Product deleted successfully', 'success')
-        return redirect(url_for('product.products'))
+    # Delete the product
+    product_dao.delete_product(product_id)
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    flash('Product deleted successfully', 'success')
+    return redirect(url_for('product.products'))
 
 @product_bp.route('/publish')
 def publish_product():
@@ -391,42 +307,36 @@ def publish_product():
         flash('Product ID is required', 'error')
         return redirect(url_for('product.products'))
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get the product
-        product = product_dao.get_product_by_id(product_id)
-        
-        if not product:
-            flash('Product not found', 'error')
-            return redirect(url_for('product.products'))
-        
-        # First, call PrintifyService to publish the product on Printify
-        # Get the shop_id from app config or environment
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        # Publish to Printify API
-        publish_success = printify_service.publish_product(product_id)
-        
-        if not publish_success:
-            flash('Failed to publish product on Printify', 'error')
-            return redirect(url_for('product.product_detail', product_id=product_id))
-        
-        # If Printify publishing was successful, update status in the database
-        product.status = "PUBLISHED"
-        product_dao.update_product(product)
-        
-        flash('Product published successfully on Printify and status updated', 'success')
+    # Get the product
+    product = product_dao.get_product_by_id(product_id)
+    
+    if not product:
+        flash('Product not found', 'error')
+        return redirect(url_for('product.products'))
+    
+    # First, call PrintifyService to publish the product on Printify
+    # Get the shop_id from app config or environment
+    printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
+    
+    # Publish to Printify API
+    publish_success = printify_service.publish_product(product_id)
+    
+    if not publish_success:
+        flash('Failed to publish product on Printify', 'error')
         return redirect(url_for('product.product_detail', product_id=product_id))
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # If Printify publishing was successful, update status in the database
+    product.status = "PUBLISHED"
+    product_dao.update_product(product)
+    
+    flash('Product published successfully on Printify and status updated', 'success')
+    return redirect(url_for('product.product_detail', product_id=product_id))
 
 @product_bp.route('/unpublish')
 def unpublish_product():
@@ -437,28 +347,22 @@ def unpublish_product():
         flash('Product ID is required', 'error')
         return redirect(url_for('product.products'))
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    product_dao = ProductDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        product_dao = ProductDAO(db_conn)
-        
-        # Get the product
-        product = product_dao.get_product_by_id(product_id)
-        
-        if not product:
-            flash('Product not found', 'error')
-            return redirect(url_for('product.products'))
-        
-        # Update status
-        product.status = "DRAFT"
-        product_dao.update_product(product)
-        
-        flash('Product unpublished successfully', 'success')
-        return redirect(url_for('product.product_detail', product_id=product_id))
+    # Get the product
+    product = product_dao.get_product_by_id(product_id)
+    
+    if not product:
+        flash('Product not found', 'error')
+        return redirect(url_for('product.products'))
+    
+    # Update status
+    product.status = "DRAFT"
+    product_dao.update_product(product)
     
-    finally:
-        # Close the database connection
-        db_conn.close() 
\ No newline at end of file
+    flash('Product unpublished successfully', 'success')
+    return redirect(url_for('product.product_detail', product_id=product_id))
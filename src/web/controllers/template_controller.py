@@ -2,17 +2,16 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from datetime import datetime, timedelta
 import math
 
-from config.db_connection import DBConnection
 from dao.template_dao import TemplateDAO
+from dao.catalog_stats_dao import CatalogStatsDAO
 from services.printify_service import PrintifyService
+from services.mockup_cache_service import MockupCacheService, MOCKUP_PREFETCH_DEADLINE_SECONDS
+from util.pagination_util import KEYSET_SORTS
 from models.printify_template_models import PrintifyTagModel
 
 # Create template blueprint
 template_bp = Blueprint('template', __name__)
 
-# Cache for mockup images
-mockup_cache = {}
-
 # Default shop ID
 DEFAULT_SHOP_ID = "20510104"
 
@@ -22,443 +21,375 @@ TEMPLATES_PER_PAGE = 12
 @template_bp.route('/dashboard')
 def dashboard():
     """Template dashboard that displays template statistics and recent templates"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
-        
-        # Get stats for the dashboard
-        total_templates = template_dao.count_templates()
-        
-        # Calculate recent updates (in the last 7 days)
-        # This would ideally use a SQL query but we'll simulate it here
-        recent_templates = template_dao.fetch_templates_paginated(limit=6, offset=0)
-        
-        # Count recent updates
-        recent_updates = 0
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        
-        # Convert string dates to datetime objects for comparison
-        for template in recent_templates:
-            # Convert updated_at to datetime if it's a string
-            if template.updated_at and isinstance(template.updated_at, str):
-                try:
-                    # Try different formats as needed
-                    try:
-                        template_date = datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        template_date = datetime.strptime(template.updated_at, '%Y-%m-%d')
-                    if template_date > seven_days_ago:
-                        recent_updates += 1
-                except (ValueError, TypeError):
-                    # Skip if we can't parse the date
-                    pass
-            elif template.updated_at and isinstance(template.updated_at, datetime):
-                # If it's already a datetime object, compare directly
-                if template.updated_at > seven_days_ago:
-                    recent_updates += 1
-        
-        # Get unique tags
-        unique_tags = set()
-        tag_counts = {}
-        
-        for template in recent_templates:
-            for tag in template.tags:
-                if tag and hasattr(tag, 'tag') and tag.tag:
-                    unique_tags.add(tag.tag)
-                    tag_counts[tag.tag] = tag_counts.get(tag.tag, 0) + 1
-        
-        # Format the recent templates for display
-        templates_for_display = []
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        for template in recent_templates:
-            # Check if we have a mockup image cached
-            mockup_url = None
-            template_id = template.id
-            
-            if template_id in mockup_cache:
-                mockup_url = mockup_cache[template_id]
-            else:
-                # Try to fetch mockup from Printify
-                try:
-                    template_details = printify_service.get_product_details(template_id)
-                    if template_details and "images" in template_details and len(template_details["images"]) > 0:
-                        # Get the first mockup image
-                        mockup_url = template_details["images"][0]["src"]
-                        # Cache it
-                        mockup_cache[template_id] = mockup_url
-                except Exception as e:
-                    print(f"Error fetching mockup for template {template_id}: {str(e)}")
-            
-            # Add to the display list
-            templates_for_display.append({
-                "id": template_id,
-                "title": template.title or "Untitled Template",
-                "description": template.description or "No description",
-                "mockup_url": mockup_url,
-                "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
-                "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
-                "tags": ', '.join([tag.tag for tag in template.tags if tag and hasattr(tag, 'tag') and tag.tag])
-            })
-        
-        # Stats for the dashboard
-        stats = {
-            "total_templates": total_templates,
-            "recent_updates": recent_updates,
-            "unique_tags": len(unique_tags),
-            "tag_counts": tag_counts
-        }
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('dashboard/templates/template_dashboard.html', stats=stats, recent_templates=templates_for_display, now=now)
+    # Stats come pre-aggregated from the catalog_stats rollup, covering every template
+    template_stats = CatalogStatsDAO(db_conn).fetch_stats().get("template", {})
+    
+    # Get recent templates as listing summaries; cards need no variants or images
+    recent_templates, _ = template_dao.fetch_template_summaries(limit=6, offset=0)
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # Format the recent templates for display
+    templates_for_display = []
+    
+    # Cached mockups arrive with the summaries; missing ones are fetched from Printify in parallel,
+    # and any still loading at the deadline render as placeholders filled in by /media/api/mockups
+    mockup_service = MockupCacheService(db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending_mockups = mockup_service.resolve_summary_mockups(
+        recent_templates, "template", deadline=MOCKUP_PREFETCH_DEADLINE_SECONDS
+    )
+    
+    for template in recent_templates:
+        template_id = template.id
+        mockup_url = mockup_urls.get(template_id)
+        
+        # Add to the display list
+        templates_for_display.append({
+            "id": template_id,
+            "title": template.title or "Untitled Template",
+            "description": template.description or "No description",
+            "mockup_url": mockup_url,
+            # Small resized copy for cards, served from local disk
+            "thumb_url": url_for('media.thumbnail', printify_id=template_id, kind='template', w=400) if mockup_url else None,
+            "mockup_pending": template_id in pending_mockups,
+            "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
+            "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
+            "tags": ', '.join(template.tags)
+        })
+    
+    # Stats for the dashboard
+    stats = {
+        "total_templates": template_stats.get("total", 0),
+        "recent_updates": template_stats.get("updated_7d", 0),
+        "unique_tags": template_stats.get("unique_tags", 0),
+        "tag_counts": template_stats.get("tag", {})
+    }
+    
+    # Include current year for copyright in footer
+    now = datetime.now()
+    
+    return render_template('dashboard/templates/template_dashboard.html', stats=stats, recent_templates=templates_for_display, now=now)
 
 @template_bp.route('/templates')
 def templates():
     """Display templates with pagination"""
     # Get pagination parameters
     page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     search = request.args.get('search', '')
+    # Rank by search relevance unless the user picked a sort order
+    sort_by = request.args.get('sort', 'relevance' if search else 'updated_at')
+    # Seek from a cursor unless an explicit page number or relevance ranking asks for OFFSET paging
+    use_cursor = sort_by in KEYSET_SORTS and (cursor or 'page' not in request.args)
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
-        
-        # Get total count of templates for pagination
-        total_templates = template_dao.count_templates(search_term=search)
-        total_pages = math.ceil(total_templates / TEMPLATES_PER_PAGE)
-        
-        # Calculate offset
+    # Get template summaries for current page together with the total count for pagination
+    next_cursor = prev_cursor = None
+    if use_cursor:
+        templates_data, total_templates, next_cursor, prev_cursor = template_dao.fetch_template_summaries_page(
+            limit=TEMPLATES_PER_PAGE,
+            cursor=cursor,
+            search_term=search,
+            sort_by=sort_by
+        )
+    else:
         offset = (page - 1) * TEMPLATES_PER_PAGE
-        
-        # Get templates for current page
-        templates_data = template_dao.fetch_templates_paginated(
+        templates_data, total_templates = template_dao.fetch_template_summaries(
             limit=TEMPLATES_PER_PAGE, 
             offset=offset,
-            search_term=search
+            search_term=search,
+            sort_by=sort_by
         )
-        
-        # Log the templates for debugging
-        print(f"Found {len(templates_data)} templates for page {page}")
-        
-        # Format the data for display
-        templates_for_display = []
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        for template in templates_data:
-            # Check if we have a mockup image cached
-            mockup_url = None
-            template_id = template.id
-            
-            if template_id in mockup_cache:
-                mockup_url = mockup_cache[template_id]
-            else:
-                # Try to fetch mockup from Printify
-                try:
-                    template_details = printify_service.get_product_details(template_id)
-                    if template_details and "images" in template_details and len(template_details["images"]) > 0:
-                        # Get the first mockup image
-                        mockup_url = template_details["images"][0]["src"]
-                        # Cache it
-                        mockup_cache[template_id] = mockup_url
-                except Exception as e:
-                    print(f"Error fetching mockup for template {template_id}: {str(e)}")
-            
-            # Add to the display list
-            templates_for_display.append({
-                "id": template_id,
-                "title": template.title or "Untitled Template",
-                "description": template.description or "No description",
-                "mockup_url": mockup_url,
-                "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
-                "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
-                "tags": ', '.join([tag.tag for tag in template.tags if tag and hasattr(tag, 'tag') and tag.tag])
-            })
-        
-        # Include current year for copyright in footer
-        now = datetime.now()
-        
-        return render_template('dashboard/templates/templates.html',
-                               templates=templates_for_display,
-                               total_templates=total_templates,
-                               page=page, 
-                               total_pages=total_pages,
-                               now=now)
+    total_pages = math.ceil(total_templates / TEMPLATES_PER_PAGE)
+    
+    # Log the templates for debugging
+    print(f"Found {len(templates_data)} templates for page {page}")
+    
+    # Format the data for display
+    templates_for_display = []
+    
+    # Cached mockups arrive with the summaries; missing ones are fetched from Printify in parallel,
+    # and any still loading at the deadline render as placeholders filled in by /media/api/mockups
+    mockup_service = MockupCacheService(db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending_mockups = mockup_service.resolve_summary_mockups(
+        templates_data, "template", deadline=MOCKUP_PREFETCH_DEADLINE_SECONDS
+    )
+    
+    for template in templates_data:
+        template_id = template.id
+        mockup_url = mockup_urls.get(template_id)
+        
+        # Add to the display list
+        templates_for_display.append({
+            "id": template_id,
+            "title": template.title or "Untitled Template",
+            "description": template.description or "No description",
+            "mockup_url": mockup_url,
+            # Small resized copy for cards, served from local disk
+            "thumb_url": url_for('media.thumbnail', printify_id=template_id, kind='template', w=400) if mockup_url else None,
+            "mockup_pending": template_id in pending_mockups,
+            "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
+            "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
+            "tags": ', '.join(template.tags)
+        })
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # Include current year for copyright in footer
+    now = datetime.now()
+    
+    return render_template('dashboard/templates.html',
+                           templates=templates_for_display,
+                           total_templates=total_templates,
+                           page=page, 
+                           total_pages=total_pages,
+                           next_cursor=next_cursor,
+                           prev_cursor=prev_cursor,
+                           now=now)
 
 @template_bp.route('/template/<template_id>')
 def template_detail(template_id):
     """Display details for a specific template"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
     
+    # Get the template
     try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
+        template = template_dao.fetch_template_from_template_id(template_id)
         
-        # Get the template
-        try:
-            template = template_dao.fetch_template_from_template_id(template_id)
-            
-            # Initialize Printify service for mockups
-            printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-            
-            # Get mockup images
-            mockup_images = []
-            template_details = printify_service.get_product_details(template_id)
-            
-            if template_details and "images" in template_details:
-                mockup_images = [img["src"] for img in template_details["images"]]
-            
-            # Format the template data for display
-            template_data = {
-                "id": template.id,
-                "title": template.title or "Untitled Template",
-                "description": template.description or "No description",
-                "blueprint_id": template.blueprint_id,
-                "print_provider_id": template.print_provider_id,
-                "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
-                "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
-                "tags": ', '.join([tag.tag for tag in template.tags if tag and tag.tag]),
-                "product_type": template.title.split(' - ')[0] if template.title else "Unknown",
-                "variant_id": template.variants[0].data.get("id") if template.variants else None,
-                "print_areas": [pa.data.get("position") for pa in template.print_areas] if template.print_areas else []
-            }
-            
-            # Get current time for footer
-            now = datetime.now()
-            
-            return render_template('dashboard/templates/template_detail.html', template=template_data, mockup_images=mockup_images, now=now)
+        # Initialize Printify service for mockups
+        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
         
-        except ValueError as e:
-            flash(f"Error: {str(e)}", "error")
-            return redirect(url_for('template.templates'))
+        # Get mockup images
+        mockup_images = []
+        template_details = printify_service.get_product_details(template_id)
+        
+        if template_details and "images" in template_details:
+            mockup_images = [img["src"] for img in template_details["images"]]
+        
+        # Format the template data for display
+        template_data = {
+            "id": template.id,
+            "title": template.title or "Untitled Template",
+            "description": template.description or "No description",
+            "blueprint_id": template.blueprint_id,
+            "print_provider_id": template.print_provider_id,
+            "created_at": datetime.strptime(template.created_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.created_at, str) else template.created_at,
+            "updated_at": datetime.strptime(template.updated_at, '%Y-%m-%d %H:%M:%S') if isinstance(template.updated_at, str) else template.updated_at,
+            "tags": ', '.join([tag.tag for tag in template.tags if tag and tag.tag]),
+            "product_type": template.title.split(' - ')[0] if template.title else "Unknown",
+            "variant_id": template.variants[0].data.get("id") if template.variants else None,
+            "print_areas": [pa.data.get("position") for pa in template.print_areas] if template.print_areas else []
+        }
+        
+        # Get current time for footer
+        now = datetime.now()
+        
+        return render_template('dashboard/templates/template_detail.html', template=template_data, mockup_images=mockup_images, now=now)
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    except ValueError as e:
+        flash(f"Error: {str(e)}", "error")
+        return redirect(url_for('template.templates'))
 
 @template_bp.route('/api/templates')
 def api_templates():
     """API endpoint to get templates as JSON (for AJAX loading)"""
     # Get pagination parameters
     page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     search = request.args.get('search', '')
+    # Rank by search relevance unless the user picked a sort order
+    sort_by = request.args.get('sort', 'relevance' if search else 'updated_at')
+    # Seek from a cursor unless an explicit page number or relevance ranking asks for OFFSET paging
+    use_cursor = sort_by in KEYSET_SORTS and (cursor or 'page' not in request.args)
     
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
     
-    try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
-        
-        # Get total count of templates for pagination
-        total_templates = template_dao.count_templates(search_term=search)
-        total_pages = math.ceil(total_templates / TEMPLATES_PER_PAGE)
-        
-        # Calculate offset
+    # Get template summaries for current page together with the total count for pagination
+    next_cursor = prev_cursor = None
+    if use_cursor:
+        templates_data, total_templates, next_cursor, prev_cursor = template_dao.fetch_template_summaries_page(
+            limit=TEMPLATES_PER_PAGE,
+            cursor=cursor,
+            search_term=search,
+            sort_by=sort_by
+        )
+    else:
         offset = (page - 1) * TEMPLATES_PER_PAGE
-        
-        # Get templates for current page
-        templates_data = template_dao.fetch_templates_paginated(
+        templates_data, total_templates = template_dao.fetch_template_summaries(
             limit=TEMPLATES_PER_PAGE, 
             offset=offset,
-            search_term=search
+            search_term=search,
+            sort_by=sort_by
         )
-        
-        # Format the data for display
-        templates_json = []
-        
-        # Initialize Printify service for mockups
-        printify_service = PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID)
-        
-        for template in templates_data:
-            # Check if we have a mockup image cached
-            mockup_url = None
-            template_id = template.id
-            
-            if template_id in mockup_cache:
-                mockup_url = mockup_cache[template_id]
-            else:
-                # Try to fetch mockup from Printify
-                try:
-                    template_details = printify_service.get_product_details(template_id)
-                    if template_details and "images" in template_details and len(template_details["images"]) > 0:
-                        # Get the first mockup image
-                        mockup_url = template_details["images"][0]["src"]
-                        # Cache it
-                        mockup_cache[template_id] = mockup_url
-                except Exception as e:
-                    print(f"Error fetching mockup for template {template_id}: {str(e)}")
-            
-            # Format dates as strings
-            created_at = template.created_at
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    pass
-            elif isinstance(created_at, datetime):
-                created_at = created_at.strftime('%Y-%m-%d %H:%M:%S')
-            
-            updated_at = template.updated_at
-            if isinstance(updated_at, str):
-                try:
-                    updated_at = datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    pass
-            elif isinstance(updated_at, datetime):
-                updated_at = updated_at.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Add to the display list
-            templates_json.append({
-                "id": template_id,
-                "title": template.title or "Untitled Template",
-                "description": template.description or "No description",
-                "mockup_url": mockup_url,
-                "created_at": created_at,
-                "updated_at": updated_at,
-                "tags": [tag.tag for tag in template.tags if tag and hasattr(tag, 'tag') and tag.tag]
-            })
-        
-        # Return JSON response
-        return jsonify({
-            "templates": templates_json,
-            "page": page,
-            "total_pages": total_pages,
-            "total_templates": total_templates
+    total_pages = math.ceil(total_templates / TEMPLATES_PER_PAGE)
+    
+    # Format the data for display
+    templates_json = []
+    
+    # Cached mockups arrive with the summaries; missing ones are fetched from Printify in parallel,
+    # and any still loading at the deadline render as placeholders filled in by /media/api/mockups
+    mockup_service = MockupCacheService(db_conn, PrintifyService(name="PrintifyService", shop_id=DEFAULT_SHOP_ID))
+    mockup_urls, pending_mockups = mockup_service.resolve_summary_mockups(
+        templates_data, "template", deadline=MOCKUP_PREFETCH_DEADLINE_SECONDS
+    )
+    
+    for template in templates_data:
+        template_id = template.id
+        mockup_url = mockup_urls.get(template_id)
+        
+        # Format dates as strings
+        created_at = template.created_at
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                pass
+        elif isinstance(created_at, datetime):
+            created_at = created_at.strftime('%Y-%m-%d %H:%M:%S')
+        
+        updated_at = template.updated_at
+        if isinstance(updated_at, str):
+            try:
+                updated_at = datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                pass
+        elif isinstance(updated_at, datetime):
+            updated_at = updated_at.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Add to the display list
+        templates_json.append({
+            "id": template_id,
+            "title": template.title or "Untitled Template",
+            "description": template.description or "No description",
+            "mockup_url": mockup_url,
+            # Small resized copy for cards, served from local disk
+            "thumb_url": url_for('media.thumbnail', printify_id=template_id, kind='template', w=400) if mockup_url else None,
+            "mockup_pending": template_id in pending_mockups,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "tags": template.tags
         })
     
-    finally:
-        # Close the database connection
-        db_conn.close()
+    # Return JSON response
+    return jsonify({
+        "templates": templates_json,
+        "page": page,
+        "total_pages": total_pages,
+        "total_templates": total_templates,
+        "next": next_cursor,
+        "prev": prev_cursor
+    })
 
 @template_bp.route('/template/<template_id>/edit', methods=['GET'])
 def edit_template(template_id):
     """Display form for editing a template"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
     
+    # Get the template
     try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
+        template = template_dao.fetch_template_from_template_id(template_id)
+        
+        # Format the template data for the form
+        template_data = {
+            "id": template.id,
+            "title": template.title or "",
+            "description": template.description or "",
+            "blueprint_id": template.blueprint_id,
+            "print_provider_id": template.print_provider_id,
+            "user_id": template.user_id,
+            "shop_id": template.shop_id,
+            "visible": template.visible,
+            "is_locked": template.is_locked,
+            "reviewed": template.reviewed,
+            "tags": [tag.tag for tag in template.tags if tag and tag.tag],
+            "variants": [var.data for var in template.variants],
+            "print_areas": [pa.data for pa in template.print_areas],
+            "options": [opt.data for opt in template.options],
+            "images": [img.data for img in template.images],
+            "external": template.external.data if template.external else None,
+            "sales_channel_properties": [scp.data for scp in template.sales_channel_properties],
+            "files": [f.data for f in template.files],
+            "additional_options": [ao.data for ao in template.additional_options],
+            "selling_prices": [sp.data for sp in template.selling_prices],
+            "views": [view.data for view in template.views],
+        }
         
-        # Get the template
-        try:
-            template = template_dao.fetch_template_from_template_id(template_id)
-            
-            # Format the template data for the form
-            template_data = {
-                "id": template.id,
-                "title": template.title or "",
-                "description": template.description or "",
-                "blueprint_id": template.blueprint_id,
-                "print_provider_id": template.print_provider_id,
-                "user_id": template.user_id,
-                "shop_id": template.shop_id,
-                "visible": template.visible,
-                "is_locked": template.is_locked,
-                "reviewed": template.reviewed,
-                "tags": [tag.tag for tag in template.tags if tag and tag.tag],
-                "variants": [var.data for var in template.variants],
-                "print_areas": [pa.data for pa in template.print_areas],
-                "options": [opt.data for opt in template.options],
-                "images": [img.data for img in template.images],
-                "external": template.external.data if template.external else None,
-                "sales_channel_properties": [scp.data for scp in template.sales_channel_properties],
-                "files": [f.data for f in template.files],
-                "additional_options": [ao.data for ao in template.additional_options],
-                "selling_prices": [sp.data for sp in template.selling_prices],
-                "views": [view.data for view in template.views],
-            }
-            
-            # Include current year for copyright in footer
-            now = datetime.now()
-            
-            return render_template('dashboard/templates/edit_template.html', template=template_data, now=now)
-            
-        except ValueError as e:
-            flash(f"Error: {str(e)}", "error")
-            return redirect(url_for('template.templates'))
-    
-    finally:
-        # Close the database connection
-        db_conn.close()
+        # Include current year for copyright in footer
+        now = datetime.now()
+        
+        return render_template('dashboard/templates/edit_template.html', template=template_data, now=now)
+        
+    except ValueError as e:
+        flash(f"Error: {str(e)}", "error")
+        return redirect(url_for('template.templates'))
 
 @template_bp.route('/template/<template_id>/edit', methods=['POST'])
 def update_template(template_id):
     """Handle template update form submission"""
-    # Connect to the database
-    db_conn = DBConnection(host="localhost", user="root", password="", database="print_core_db")
-    db_conn.connect()
+    # Use the pooled connection checked out for this request
+    db_conn = g.db_conn
+
+    # Initialize the DAO
+    template_dao = TemplateDAO(db_conn)
+    
+    # Get form data
+    title = request.form.get('title')
+    description = request.form.get('description')
+    blueprint_id = request.form.get('blueprint_id')
+    print_provider_id = request.form.get('print_provider_id')
+    user_id = request.form.get('user_id')
+    shop_id = request.form.get('shop_id')
+    visible = request.form.get('visible') == 'true'
+    is_locked = request.form.get('is_locked') == 'true'
+    reviewed = request.form.get('reviewed') == 'true'
+    tags = request.form.getlist('tags[]')
     
+    # Update the template
     try:
-        # Initialize the DAO
-        template_dao = TemplateDAO(db_conn)
-        
-        # Get form data
-        title = request.form.get('title')
-        description = request.form.get('description')
-        blueprint_id = request.form.get('blueprint_id')
-        print_provider_id = request.form.get('print_provider_id')
-        user_id = request.form.get('user_id')
-        shop_id = request.form.get('shop_id')
-        visible = request.form.get('visible') == 'true'
-        is_locked = request.form.get('is_locked') == 'true'
-        reviewed = request.form.get('reviewed') == 'true'
-        tags = request.form.getlist('tags[]')
+        template = template_dao.fetch_template_from_template_id(template_id)
+        if not template:
+            flash("Template not found", "error")
+            return redirect(url_for('template.templates'))
         
-        # Update the template
-        try:
-            template = template_dao.fetch_template_from_template_id(template_id)
-            
-            # Update basic fields
-            template.title = title
-            template.description = description
-            template.blueprint_id = int(blueprint_id) if blueprint_id else None
-            template.print_provider_id = int(print_provider_id) if print_provider_id else None
-            template.user_id = int(user_id) if user_id else None
-            template.shop_id = int(shop_id) if shop_id else None
-            template.visible = visible
-            template.is_locked = is_locked
-            template.reviewed = reviewed
-            
-            # Update tags
-            template.tags = [PrintifyTagModel(template_id, tag) for tag in tags if tag]
-            
-            # Save the template
-            template_dao.update_template(template)
-            
-            flash("Template updated successfully!", "success")
-            return redirect(url_for('template.template_detail', template_id=template_id))
-            
-        except ValueError as e:
-            flash(f"Error updating template: {str(e)}", "error")
-            return redirect(url_for('template.edit_template', template_id=template_id))
-            
-    finally:
-        # Close the database connection
-        db_conn.close() 
\ No newline at end of file
+        # Update basic fields
+        template.title = title
+        template.description = description
+        template.blueprint_id = int(blueprint_id) if blueprint_id else None
+        template.print_provider_id = int(print_provider_id) if print_provider_id else None
+        template.user_id = int(user_id) if user_id else None
+        template.shop_id = int(shop_id) if shop_id else None
+        template.visible = visible
+        template.is_locked = is_locked
+        template.reviewed = reviewed
+        
+        # Update tags
+        template.tags = [PrintifyTagModel(template_id, tag) for tag in tags if tag]
+        
+        # Save the template; a failed save is rolled back and re-raised
+        template_dao.insert_or_update_template(template)
+        
+        flash("Template updated successfully!", "success")
+        return redirect(url_for('template.template_detail', template_id=template_id))
+        
+    except Exception as e:
+        flash(f"Error updating template: {str(e)}", "error")
+        return redirect(url_for('template.edit_template', template_id=template_id))